@@ -2,22 +2,38 @@
 CRUD (Create, Read, Update, Delete) utility functions.
 
 This module contains reusable database query functions to avoid duplication
-across router endpoints.
+across router endpoints. Helpers that hit the database are async and take an
+AsyncSession; filter_events / seek_events_after only build up a select().
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Executable, Select, and_, or_, func, select, insert, literal_column, null
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from uuid import UUID
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from bisect import bisect_left
+import heapq
+import os
+import uuid
+import base64
+import json
 
-from .database.models import Event, Profile
+from .database.models import Event, EventChange, Profile
+from .services.recurrence import EVENT_TIMEZONE, as_utc, expand_occurrences
+from .services.search import search_index, to_prefix_tsquery
+from .services.event_cache import normalize_organization
+from .services.durations import longest_event
 
 
 # ============================================
 # Event CRUD Functions
 # ============================================
 
-def get_event_or_404(db: Session, event_id: UUID) -> Event:
+async def get_event_or_404(db: AsyncSession, event_id: UUID) -> Event:
     """
     Fetch event by ID or raise 404 HTTPException.
 
@@ -28,7 +44,7 @@ def get_event_or_404(db: Session, event_id: UUID) -> Event:
 
     Used in: get_event, update_event, delete_event endpoints
     """
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = await db.get(Event, event_id)
 
     if not event:
         raise HTTPException(
@@ -39,27 +55,560 @@ def get_event_or_404(db: Session, event_id: UUID) -> Event:
     return event
 
 
+async def get_event_version(db: AsyncSession, event_id: UUID) -> datetime:
+    """
+    Fetch just the updated_at of an event or raise 404 HTTPException.
+
+    Used to build the ETag for GET /events/{event_id} without loading
+    the whole row.
+    """
+    updated_at = await db.scalar(select(Event.updated_at).where(Event.id == event_id))
+
+    if updated_at is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event with id {event_id} not found"
+        )
+
+    return updated_at
+
+
+async def get_events_version(db: AsyncSession) -> int:
+    """
+    Cheap version stamp for the whole events table: the newest change log
+    seq.
+
+    Every create, update and delete appends to the change log in its own
+    transaction (record_event_changes), so if the newest seq didn't move,
+    no listing can have changed either. max() of the primary key is one
+    index lookup, where count(*) had to visit every event.
+    """
+    return await get_change_token(db)
+
+
+# What the listing endpoints select: EventResponse's fields, in its field
+# order, as plain rows rather than Event objects. Skipping ORM identity
+# tracking and attribute access is most of the cost of a long listing.
+# recurrence_id is only set on expanded occurrences.
+EVENT_ROW_COLUMNS = (
+    Event.title,
+    Event.description,
+    Event.organization,
+    Event.type,
+    Event.start_time,
+    Event.end_time,
+    Event.external_id,
+    Event.recurrence_rule,
+    Event.recurrence_exdates,
+    Event.id,
+    null().label("recurrence_id"),
+    Event.created_at,
+    Event.updated_at,
+)
+
+
+def filter_events(
+    query: Executable,
+    organization: Optional[str] = None,
+    type: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    recurring: Optional[bool] = None,
+) -> Executable:
+    """
+    Apply the shared event listing filters to a select(Event) statement
+    (or an update(Event) / delete(Event) for set-based bulk writes).
+
+    - organization / type are exact matches
+    - start / end select events that overlap the window [start, end),
+      so an event running 9:30-10:30 shows up in a window starting at 10:00
+    - a recurring event matches if any occurrence could overlap the window:
+      it starts before the window ends and hasn't finished repeating
+      (recurrence_end) before it starts
+    - with only end ("everything before end", e.g. a bulk delete of past
+      events), a recurring event matches only once it has stopped
+      repeating: its last occurrence ends before end. An ongoing series
+      is never swept up with past events
+    - recurring=False / True keeps only one-off events / only series
+
+    For one-off events the window is a two-sided range on start_time,
+    [start - longest_event.bound, end): no stored event runs longer than
+    that (see services/durations.py), so nothing starting earlier can
+    still be running at start. It lines up
+    with the (type, start_time) and (organization, start_time) indexes on
+    Event, but only when the two kinds are queried separately - otherwise
+    the range sits inside an OR with the series conditions. Listings that
+    expand series pass recurring for that reason.
+
+    Raises 400 if the window is empty or reversed.
+    """
+    if start and end and end <= start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end must be after start"
+        )
+
+    if organization:
+        query = query.filter(Event.organization == organization)
+
+    if type:
+        query = query.filter(Event.type == type)
+
+    if end:
+        query = query.filter(Event.start_time < end)
+
+    single, series = [], []
+    if start:
+        single += [Event.start_time >= start - longest_event.bound, Event.end_time > start]
+        series.append(or_(Event.recurrence_end.is_(None), Event.recurrence_end > start))
+    elif end:
+        series.append(Event.recurrence_end < end)  # NULL (repeats forever) never matches
+
+    if recurring is False:
+        query = query.filter(Event.recurrence_rule.is_(None), *single)
+    elif recurring:
+        query = query.filter(Event.recurrence_rule.is_not(None), *series)
+    elif single or series:
+        query = query.filter(or_(
+            and_(Event.recurrence_rule.is_(None), *single),
+            and_(Event.recurrence_rule.is_not(None), *series),
+        ))
+
+    return query
+
+
+async def list_events_in_window(
+    db: AsyncSession,
+    organization: Optional[str],
+    type: Optional[str],
+    start: datetime,
+    end: datetime,
+    skip: int = 0,
+    limit: int = 100,
+) -> list:
+    """
+    Events overlapping [start, end), with recurring events expanded into
+    their occurrences in that window, ordered by (start_time, id).
+    Returned as EVENT_ROW_COLUMNS rows (Occurrences of them for recurring
+    events), ready for the listing serializer.
+
+    One-off events come from the database already sorted and limited.
+    Recurring series are few (one row per series, not per occurrence), so
+    they are fetched whole and expanded lazily; the two sorted streams are
+    merged and only the requested slice is materialized.
+    """
+    query = select(*EVENT_ROW_COLUMNS)
+    order = (Event.start_time.asc(), Event.id.asc())
+
+    single = filter_events(query, organization, type, start, end, recurring=False)
+    series = filter_events(query, organization, type, start, end, recurring=True)
+    single = await db.execute(single.order_by(*order).limit(skip + limit))
+    series = await db.execute(series)  # order doesn't matter, the merge sorts occurrences
+
+    occurrences = heapq.merge(
+        *(expand_occurrences(event, start, end) for event in series),
+        key=lambda occurrence: (occurrence.start_time, occurrence.id),
+    )
+    events = heapq.merge(
+        single,
+        occurrences,
+        key=lambda event: (as_utc(event.start_time), event.id),
+    )
+
+    return list(islice(events, skip, skip + limit))
+
+
+def encode_event_cursor(event: Event) -> str:
+    """
+    Build an opaque pagination cursor pointing just after this event.
+
+    The cursor is the (start_time, id) sort key, base64-encoded so clients
+    treat it as a token rather than something to construct themselves.
+    """
+    payload = json.dumps({"s": event.start_time.isoformat(), "i": str(event.id)})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_event_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor from encode_event_cursor or raise 400 HTTPException.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(payload["s"]), UUID(payload["i"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def seek_events_after(query: Select, cursor: str) -> Select:
+    """
+    Restrict an event query to rows after the cursor (keyset pagination).
+
+    Unlike offset(), this seeks straight to the cursor position on the
+    (start_time, id) index, so page 500 costs the same as page 1 and rows
+    inserted earlier in the list don't shift later pages.
+    """
+    start_time, event_id = decode_event_cursor(cursor)
+
+    return query.filter(
+        or_(
+            Event.start_time > start_time,
+            and_(Event.start_time == start_time, Event.id > event_id),
+        )
+    )
+
+
+def time_range(start, end):
+    """Postgres tstzrange [start, end), matching the ix_events_time_range GiST index."""
+    return func.tstzrange(start, end, literal_column("'[)'"))
+
+
+async def find_conflicts(
+    db: AsyncSession,
+    intervals: List[Tuple[datetime, datetime]],
+    organization: Optional[str] = None,
+    exclude_id: Optional[UUID] = None,
+) -> list:
+    """
+    Events (and occurrences of recurring events) overlapping any of the
+    [start, end) intervals, ordered by (start_time, id).
+
+    intervals must be sorted and non-overlapping, e.g. the occurrences of
+    one recurring event. Candidates come from a single query over the
+    whole span - a GiST range search on Postgres, the start_time index
+    elsewhere - and are matched to the intervals by binary search.
+    """
+    span_start, span_end = intervals[0][0], intervals[-1][1]
+
+    query = select(Event)
+    if organization:
+        query = query.filter(Event.organization == organization)
+    if exclude_id:
+        query = query.filter(Event.id != exclude_id)
+
+    if db.bind.dialect.name == "postgresql":
+        single = query.where(
+            Event.recurrence_rule.is_(None),
+            time_range(Event.start_time, Event.end_time).op("&&")(time_range(span_start, span_end)),
+        )
+    else:
+        single = filter_events(query, start=span_start, end=span_end, recurring=False)
+    series = filter_events(query, start=span_start, end=span_end, recurring=True)
+
+    candidates = list(await db.scalars(single))
+    for event in await db.scalars(series):
+        candidates.extend(expand_occurrences(event, span_start, span_end))
+
+    starts = [as_utc(start) for start, _ in intervals]
+    conflicts = []
+    for candidate in candidates:
+        # Last interval starting before the candidate ends; it's the only
+        # one that can still be running when the candidate starts
+        i = bisect_left(starts, as_utc(candidate.end_time)) - 1
+        if i >= 0 and as_utc(intervals[i][1]) > as_utc(candidate.start_time):
+            conflicts.append(candidate)
+
+    return sorted(conflicts, key=lambda event: (as_utc(event.start_time), event.id))
+
+
+# How far ahead an open-ended recurring event is checked for conflicts
+CONFLICT_HORIZON = timedelta(days=int(os.getenv("CONFLICT_HORIZON_DAYS", "365")))
+
+
+async def find_event_conflicts(db: AsyncSession, event: Event) -> list:
+    """
+    Other events of the same organization overlapping this (new or changed,
+    not yet committed) event. For a recurring event every occurrence is
+    checked, up to CONFLICT_HORIZON ahead if the series never ends.
+    """
+    if event.recurrence_rule:
+        until = event.recurrence_end or as_utc(event.start_time) + CONFLICT_HORIZON
+        intervals = [
+            (occurrence.start_time, occurrence.end_time)
+            for occurrence in expand_occurrences(event, event.start_time, until)
+        ]
+    else:
+        intervals = [(event.start_time, event.end_time)]
+
+    if not intervals:
+        return []
+    return await find_conflicts(db, intervals, event.organization, exclude_id=event.id)
+
+
+async def search_events(
+    db: AsyncSession,
+    q: str,
+    limit: int = 20,
+    organization: Optional[str] = None,
+    type: Optional[str] = None,
+) -> List[Event]:
+    """
+    Events matching every word of q as a prefix, best match first.
+
+    Postgres ranks with ts_rank over the GIN-indexed search_vector column;
+    other databases use the in-process index in services/search.py.
+    """
+    if db.bind.dialect.name == "postgresql":
+        tsquery_text = to_prefix_tsquery(q)
+        if tsquery_text is None:
+            return []
+
+        search_vector = literal_column("events.search_vector")
+        tsquery = func.to_tsquery("english", tsquery_text)
+        query = select(Event).where(search_vector.op("@@")(tsquery))
+        if organization:
+            query = query.filter(Event.organization == organization)
+        if type:
+            query = query.filter(Event.type == type)
+
+        query = query.order_by(func.ts_rank(search_vector, tsquery).desc(), Event.start_time.asc()).limit(limit)
+        return list(await db.scalars(query))
+
+    if not search_index.built:
+        rows = await db.execute(select(Event.id, Event.title, Event.description, Event.organization, Event.type))
+        search_index.build(rows)
+
+    ranked = search_index.search(q, limit, organization, type)
+    events = {event.id: event for event in await db.scalars(select(Event).where(Event.id.in_([event_id for event_id, _ in ranked])))}
+    return [events[event_id] for event_id, _ in ranked if event_id in events]
+
+
+def normalized_organization(column):
+    """
+    SQL for an organization name without whitespace, uppercased - the same
+    normalization the calendar's organization filter uses ("Black Student
+    Union" and "BlackStudent union" are one organization).
+    """
+    for whitespace in (" ", "\t", "\n"):
+        column = func.replace(column, whitespace, "")
+    return func.upper(column)
+
+
+def local_day(instant: datetime) -> str:
+    """The EVENT_TIMEZONE date of an instant, as YYYY-MM-DD."""
+    return instant.astimezone(EVENT_TIMEZONE).date().isoformat()
+
+
+async def get_event_facets(
+    db: AsyncSession,
+    type: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> dict:
+    """
+    Counts per normalized organization and per type, and - when a full
+    window is given - per day (in EVENT_TIMEZONE, by start time; an event
+    already running when the window starts counts on the window's first
+    day, so every day is inside the window).
+
+    One-off events are counted with GROUP BY in the database. Recurring
+    series are few, so within a window their occurrences are expanded and
+    counted here; without one, a series counts once.
+    """
+    single = filter_events(select(Event), None, type, start, end, recurring=False).subquery()
+    windowed = bool(start and end)
+
+    organization = normalized_organization(single.c.organization)
+    organizations = Counter(dict((await db.execute(
+        select(organization, func.count()).group_by(organization)
+    )).all()))
+    types = Counter(dict((await db.execute(
+        select(single.c.type, func.count()).group_by(single.c.type)
+    )).all()))
+
+    days = None
+    if windowed:
+        # Bucket by UTC hour in SQL, fold hours into local days here: that
+        # works the same on every database and handles DST correctly
+        if db.bind.dialect.name == "postgresql":
+            hour = func.date_trunc("hour", single.c.start_time)
+        else:
+            hour = func.strftime("%Y-%m-%d %H:00:00", single.c.start_time)
+        window_start = as_utc(start)
+        days = Counter()
+        for bucket, count in await db.execute(select(hour, func.count()).group_by(hour)):
+            if isinstance(bucket, str):
+                bucket = datetime.fromisoformat(bucket)
+            days[local_day(max(as_utc(bucket), window_start))] += count
+
+    series = filter_events(select(Event), None, type, start, end, recurring=True)
+    for event in await db.scalars(series):
+        occurrences = list(expand_occurrences(event, start, end)) if windowed else [event]
+        organizations[normalize_organization(event.organization)] += len(occurrences)
+        types[event.type] += len(occurrences)
+        if windowed:
+            for occurrence in occurrences:
+                days[local_day(max(as_utc(occurrence.start_time), window_start))] += 1
+
+    def counts(counter: Counter) -> List[Dict]:
+        return [{"value": value, "count": count} for value, count in sorted(counter.items()) if count]
+
+    return {
+        "organizations": counts(organizations),
+        "types": counts(types),
+        "days": counts(days) if days is not None else None,
+    }
+
+
+# Rows per INSERT statement in bulk writes, keeps us well under the
+# bind-parameter limits of Postgres (32767) and SQLite
+BULK_BATCH_SIZE = 500
+
+
+async def bulk_upsert_events(db: AsyncSession, rows: List[dict]) -> Tuple[List[UUID], int]:
+    """
+    Write many events with a handful of multi-row INSERTs.
+
+    Rows with an external_id are upserted (INSERT ... ON CONFLICT DO UPDATE
+    on the external_id unique index), so re-running the same import updates
+    those events instead of duplicating them. Rows without one are inserted.
+
+    Does not commit - the caller commits once, making the whole import a
+    single transaction.
+
+    Returns the event ids in row order and how many rows updated an
+    existing event.
+    """
+    now = datetime.now(timezone.utc)
+    for row in rows:
+        row.update(id=uuid.uuid4(), created_at=now, updated_at=now)
+
+    external_ids = [row["external_id"] for row in rows if row.get("external_id")]
+    existing = set()
+    for start in range(0, len(external_ids), BULK_BATCH_SIZE):
+        batch = external_ids[start:start + BULK_BATCH_SIZE]
+        existing.update(await db.scalars(select(Event.external_id).where(Event.external_id.in_(batch))))
+
+    dialect_insert = postgresql.insert if db.bind.dialect.name == "postgresql" else sqlite.insert
+    ids_by_external_id = {}
+
+    for start in range(0, len(rows), BULK_BATCH_SIZE):
+        batch = rows[start:start + BULK_BATCH_SIZE]
+
+        plain = [row for row in batch if not row.get("external_id")]
+        if plain:
+            await db.execute(insert(Event), plain)
+
+        keyed = [row for row in batch if row.get("external_id")]
+        if keyed:
+            statement = dialect_insert(Event).values(keyed)
+            statement = statement.on_conflict_do_update(
+                index_elements=[Event.external_id],
+                # Keep the original id and created_at, replace everything else
+                set_={
+                    column: statement.excluded[column]
+                    for column in (
+                        "title", "description", "organization", "type", "start_time", "end_time",
+                        "recurrence_rule", "recurrence_exdates", "recurrence_end", "updated_at",
+                    )
+                },
+            ).returning(Event.id, Event.external_id)
+            for event_id, external_id in await db.execute(statement):
+                ids_by_external_id[external_id] = event_id
+
+    ids = [ids_by_external_id[row["external_id"]] if row.get("external_id") else row["id"] for row in rows]
+    return ids, len(existing)
+
+
+# ============================================
+# Event change log (delta sync)
+# ============================================
+
+# Arbitrary key for the Postgres advisory lock serializing change log appends
+CHANGE_LOG_LOCK_ID = 7_340_101
+
+
+async def record_event_changes(db: AsyncSession, event_ids: List[UUID], op: str) -> None:
+    """
+    Append "upsert" or "delete" entries for these events to the change log.
+
+    Call inside the write's transaction, right before committing. On
+    Postgres the append takes a transaction-level advisory lock, so change
+    seqs become visible in commit order and a reader never skips past a
+    change that was still uncommitted.
+    """
+    if not event_ids:
+        return
+
+    if db.bind.dialect.name == "postgresql":
+        await db.execute(select(func.pg_advisory_xact_lock(CHANGE_LOG_LOCK_ID)))
+
+    await db.execute(insert(EventChange), [{"event_id": event_id, "op": op} for event_id in event_ids])
+
+
+async def get_change_token(db: AsyncSession) -> int:
+    """The newest change seq (0 if nothing has been logged yet)."""
+    return await db.scalar(select(func.max(EventChange.seq))) or 0
+
+
+async def get_event_changes(db: AsyncSession, since: int, limit: int) -> Tuple[List[Event], List[UUID], int, bool]:
+    """
+    Events changed after change token since, oldest change first.
+
+    Returns (upserted events, deleted ids, new token, has_more). Each event
+    appears once, in its latest state: an event updated and then deleted is
+    only reported as deleted.
+
+    Raises 410 if since is older than the retained log (or unknown), so the
+    client has to reload everything.
+    """
+    oldest, newest = (await db.execute(select(func.min(EventChange.seq), func.max(EventChange.seq)))).one()
+    if since > (newest or 0) or (oldest is not None and since < oldest - 1):
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Change token expired, reload all events"
+        )
+
+    changes = (await db.execute(
+        select(EventChange.seq, EventChange.event_id, EventChange.op)
+        .where(EventChange.seq > since)
+        .order_by(EventChange.seq)
+        .limit(limit + 1)
+    )).all()
+
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    token = changes[-1].seq if changes else since
+
+    latest_op = {}
+    for change in changes:
+        latest_op.pop(change.event_id, None)  # re-insert so order follows the latest change
+        latest_op[change.event_id] = change.op
+
+    upsert_ids = [event_id for event_id, op in latest_op.items() if op == "upsert"]
+    events = {event.id: event for event in await db.scalars(select(Event).where(Event.id.in_(upsert_ids)))}
+
+    upserted = [events[event_id] for event_id in upsert_ids if event_id in events]
+    # Upserted then deleted by a change past this page: report the deletion now
+    deleted = [event_id for event_id, op in latest_op.items() if op == "delete" or event_id not in events]
+
+    return upserted, deleted, token, has_more
+
+
 # ============================================
 # Profile CRUD Functions
 # ============================================
 
-def get_profile_by_email(db: Session, email: str) -> Optional[Profile]:
+async def get_profile_by_email(db: AsyncSession, email: str) -> Optional[Profile]:
     """
     Fetch profile by email, returns None if not found.
 
     Simple query without error handling - lets the caller decide
     what to do if the profile doesn't exist.
     """
-    return db.query(Profile).filter(Profile.email == email).first()
+    return await db.scalar(select(Profile).where(Profile.email == email))
 
 
-def get_profile_by_email_or_404(db: Session, email: str) -> Profile:
+async def get_profile_by_email_or_404(db: AsyncSession, email: str) -> Profile:
     """
     Fetch profile by email or raise 404 HTTPException.
 
     Similar to get_event_or_404 but for profiles.
     """
-    profile = get_profile_by_email(db, email)
+    profile = await get_profile_by_email(db, email)
 
     if not profile:
         raise HTTPException(
@@ -0,0 +1,120 @@
+"""
+Lightweight schema upgrades.
+
+Base.metadata.create_all() only creates tables that don't exist yet, so new
+indexes and columns added to models.py never reach an existing database
+(e.g. our Supabase instance). This module fills that gap without a full
+migration tool: on startup it adds any missing columns and indexes.
+
+Only additive changes are handled - renames and drops still need to be done
+by hand in the Supabase SQL editor. The one data fix is for events stored
+with end_time before start_time, which would keep the time range index and
+its CHECK constraint from being created.
+
+Postgres-only schema that the models can't describe portably (the full-text
+search column) is created here too.
+"""
+
+import logging
+
+from sqlalchemy import CheckConstraint, inspect, text
+from sqlalchemy.schema import AddConstraint
+
+from .db import Base
+
+logger = logging.getLogger(__name__)
+
+
+def upgrade_schema(connection):
+    """
+    Add missing columns and indexes to tables that already exist.
+
+    Safe to run on every startup: everything is checked first, so a database
+    that is already up to date is left untouched.
+    """
+    inspector = inspect(connection)
+
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            # create_all() takes care of brand new tables
+            continue
+
+        existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing_columns:
+                continue
+            column_type = column.type.compile(dialect=connection.dialect)
+            connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+
+        if table.name == "events":
+            repair_reversed_events(connection)
+
+        # SQLite can't add a constraint to an existing table, new tables get them from create_all()
+        if connection.dialect.name == "postgresql":
+            existing_checks = {check["name"] for check in inspector.get_check_constraints(table.name)}
+            for constraint in table.constraints:
+                if isinstance(constraint, CheckConstraint) and constraint.name not in existing_checks:
+                    connection.execute(AddConstraint(constraint))
+
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+        # A fresh inspector, the first one caches what it has read
+        if {index["name"] for index in inspect(connection).get_indexes(table.name)} - existing_indexes:
+            # Fresh statistics, so the planner considers the new indexes
+            # straight away (SQLite never collects them on its own)
+            connection.execute(text(f"ANALYZE {table.name}"))
+
+    if connection.dialect.name == "postgresql":
+        add_search_vector(connection)
+
+
+def repair_reversed_events(connection):
+    """
+    Swap start_time and end_time of events stored the wrong way round.
+
+    Such rows predate the API's validation (or came in through the SQL
+    editor), and tstzrange() raises on them, so ix_events_time_range could
+    never be built. Swapping keeps the event on the calendar; a series'
+    recurrence_end is cleared, which window queries read as "expand to find
+    out".
+    """
+    if inspect(connection).has_table("event_changes"):
+        # Logged like any other write, so delta sync clients and the
+        # listing ETags (both keyed on the change log) see the fix
+        connection.execute(text(
+            "INSERT INTO event_changes (event_id, op, changed_at) "
+            "SELECT id, 'upsert', CURRENT_TIMESTAMP FROM events WHERE end_time < start_time"
+        ))
+    result = connection.execute(text(
+        "UPDATE events SET start_time = end_time, end_time = start_time, "
+        "recurrence_end = NULL, updated_at = CURRENT_TIMESTAMP "
+        "WHERE end_time < start_time"
+    ))
+    if result.rowcount:
+        logger.warning("Swapped start_time and end_time of %d events that ended before they started", result.rowcount)
+
+
+# Weighted so title matches rank above organization, then description
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(organization, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+
+def add_search_vector(connection):
+    """
+    Add the events.search_vector column and its GIN index (Postgres only).
+
+    It's a generated column, so Postgres keeps it current on every insert
+    and update, bulk writes included. Used by crud.search_events.
+    """
+    connection.execute(text(
+        f"ALTER TABLE events ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+    ))
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_events_search_vector ON events USING gin (search_vector)"
+    ))
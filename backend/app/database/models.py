@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index, JSON, CheckConstraint, func, literal_column
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from datetime import datetime, timezone
@@ -17,9 +17,48 @@ class Event(Base):
     type = Column(String(20), nullable=False, default="event")  # "event" or "office_hours"
     start_time = Column(DateTime(timezone=True), nullable=False)
     end_time = Column(DateTime(timezone=True), nullable=False)
+    external_id = Column(String(255), nullable=True)  # client-supplied key for idempotent bulk imports
+    # Recurring events are stored once as a series, see services/recurrence.py.
+    # start_time / end_time are then the first occurrence.
+    recurrence_rule = Column(String(255), nullable=True)  # e.g. "FREQ=WEEKLY;BYDAY=TU,TH;UNTIL=20260612"
+    recurrence_exdates = Column(JSON, nullable=True)  # start times of cancelled occurrences (ISO strings)
+    recurrence_end = Column(DateTime(timezone=True), nullable=True)  # end of the last occurrence, NULL = forever
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
+    # Composite indexes for windowed listings (calendar month/week views).
+    # The leading column matches the equality filter and start_time gives the
+    # range, so "office hours in March" is an index range scan.
+    __table_args__ = (
+        Index("ix_events_type_start_time", "type", "start_time"),
+        Index("ix_events_organization_start_time", "organization", "start_time"),
+        Index("ix_events_start_time_id", "start_time", "id"),
+        Index("ix_events_updated_at", "updated_at"),  # "changed since" scans, see services/durations.py
+        Index("ix_events_external_id", "external_id", unique=True),  # upsert conflict target
+        # Recurring series are a handful of rows among all the events, and
+        # window listings, conflict checks and facets read all of them that
+        # start before the window. A partial index over just those rows
+        # keeps that from being a full table scan.
+        Index(
+            "ix_events_series_organization_start_time",
+            "organization",
+            "start_time",
+            postgresql_where=recurrence_rule.is_not(None),
+            sqlite_where=recurrence_rule.is_not(None),
+        ),
+        # tstzrange() (and so the index below) fails on a reversed range;
+        # upgrade_schema swaps any such rows in older databases back first
+        CheckConstraint("end_time >= start_time", name="ck_events_time_order"),
+        # Interval index for conflict checks: "what overlaps [start, end)" is
+        # a GiST search on tstzrange(start_time, end_time). Postgres only -
+        # SQLite falls back to the start_time range on the btree indexes.
+        Index(
+            "ix_events_time_range",
+            func.tstzrange(start_time, end_time, literal_column("'[)'")),
+            postgresql_using="gist",
+        ).ddl_if(dialect="postgresql"),
+    )
+
     def __repr__(self):
         return f"<Event(title='{self.title}', organization='{self.organization}')>"
 
@@ -38,3 +77,40 @@ class Profile(Base):
 
     def __repr__(self):
         return f"<Profile(email='{self.email}', role='{self.role}')>"
+
+
+class AdminSession(Base):
+    """
+    AdminSession model - login sessions shared by all uvicorn workers
+
+    Only used when SESSION_STORE=database. The token itself is never stored,
+    only its SHA-256 hash, so a leaked table can't be used to log in.
+    """
+    __tablename__ = "admin_sessions"
+
+    token_hash = Column(String(64), primary_key=True)
+    email = Column(String(255), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)  # range-scanned by the sweeper
+
+    def __repr__(self):
+        return f"<AdminSession(email='{self.email}', expires_at='{self.expires_at}')>"
+
+
+class EventChange(Base):
+    """
+    EventChange model - append-only log of event writes, for delta sync
+
+    Every create / update / delete of an event appends a row, so clients can
+    ask for "what changed since seq N" (GET /events/changes). Deletes are
+    kept here as tombstones since the events themselves are hard-deleted.
+    Old rows are pruned after CHANGE_LOG_RETENTION_DAYS.
+    """
+    __tablename__ = "event_changes"
+
+    seq = Column(Integer, primary_key=True, autoincrement=True)  # the change token
+    event_id = Column(UUID(as_uuid=True), nullable=False)
+    op = Column(String(10), nullable=False)  # "upsert" or "delete"
+    changed_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc), index=True)
+
+    def __repr__(self):
+        return f"<EventChange(seq={self.seq}, op='{self.op}', event_id='{self.event_id}')>"
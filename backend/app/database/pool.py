@@ -0,0 +1,157 @@
+"""
+Instrumented connection pool.
+
+A QueuePool that records how long requests wait to check out a
+connection, how often the pool has to open overflow connections and how
+often checkouts time out. Together with the pool's own in-use / idle
+gauges this is what we need to size DB_POOL_SIZE / DB_MAX_OVERFLOW for
+several uvicorn workers sharing one Supabase connection limit.
+"""
+
+import os
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Upper bounds (in milliseconds) of the checkout latency histogram buckets
+CHECKOUT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    """Counters for one engine's pool (per worker process)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_seconds_total = 0.0
+        self.checkout_seconds_max = 0.0
+        self.checkout_buckets = [0] * (len(CHECKOUT_BUCKETS_MS) + 1)  # last one is +Inf
+        self.overflow_connects = 0
+        self.timeouts = 0
+        self.invalidations = 0
+
+    def record_checkout(self, seconds: float, overflowed: bool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_seconds_total += seconds
+            self.checkout_seconds_max = max(self.checkout_seconds_max, seconds)
+
+            milliseconds = seconds * 1000
+            bucket = next(
+                (i for i, bound in enumerate(CHECKOUT_BUCKETS_MS) if milliseconds <= bound),
+                len(CHECKOUT_BUCKETS_MS),
+            )
+            self.checkout_buckets[bucket] += 1
+
+            if overflowed:
+                self.overflow_connects += 1
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            bounds = [str(bound) for bound in CHECKOUT_BUCKETS_MS] + ["+Inf"]
+            return {
+                "checkouts": self.checkouts,
+                "checkout_ms_avg": round(self.checkout_seconds_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "checkout_ms_max": round(self.checkout_seconds_max * 1000, 3),
+                "checkout_ms_histogram": dict(zip(bounds, self.checkout_buckets)),
+                "overflow_connects": self.overflow_connects,
+                "timeouts": self.timeouts,
+                "invalidations": self.invalidations,
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that times every checkout.
+
+    SQLAlchemy has no "checkout requested" event (only "checkout done"),
+    so the wait is measured around _do_get, where the pool blocks until a
+    connection is free or it may open an overflow one.
+    """
+
+    def _do_get(self):
+        overflow_before = self.overflow()
+        started = time.perf_counter()
+
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.record_timeout()
+            raise
+
+        # overflow() counts up from -pool_size, so only positive values
+        # are connections beyond the configured pool size
+        overflow_after = self.overflow()
+        pool_metrics.record_checkout(
+            time.perf_counter() - started,
+            overflowed=overflow_after > overflow_before and overflow_after > 0,
+        )
+        return connection
+
+
+def pool_settings() -> dict:
+    """
+    create_engine() pool arguments, read from the environment.
+
+    - DB_POOL_SIZE: connections kept open per worker (default 5)
+    - DB_MAX_OVERFLOW: extra connections allowed under bursts (default 10)
+    - DB_POOL_TIMEOUT: seconds to wait for a free connection (default 30)
+    - DB_POOL_RECYCLE: reopen connections older than this many seconds, so
+      Supabase / proxies don't hand us ones they silently dropped (default 1800)
+    - DB_POOL_PRE_PING: test connections on checkout and replace dead
+      ones instead of failing the request (default true)
+
+    Remember every uvicorn worker gets its own pool: the database sees up
+    to workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections.
+    """
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes"),
+    }
+
+
+def instrument_engine(engine) -> None:
+    """Count connections the pool had to throw away (failed pre-ping, errors)."""
+
+    @event.listens_for(engine.sync_engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        pool_metrics.record_invalidation()
+
+
+def pool_stats(engine) -> dict:
+    """Live gauges from the pool plus the counters recorded above."""
+    pool = engine.pool
+    stats = {
+        "pid": os.getpid(),  # pools are per worker, tells workers apart
+        "pool_class": type(pool).__name__,
+    }
+
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "timeout_seconds": pool.timeout(),
+        })
+
+    stats.update(pool_metrics.snapshot())
+    return stats
@@ -1,15 +1,36 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .database.db import engine, Base
-from .routers import events, agenda, auth
+from .database.db import engine, Base, SessionLocal
+from .database.migrations import upgrade_schema
+from .routers import events, agenda, auth, metrics, calendar
+from .services.sessions import sweep_expired_sessions_forever
+from .services.changes import prune_change_log_forever
+from .services.durations import longest_event, refresh_longest_event_forever
+from .services.broker import event_broker
+from .services.telemetry import TimingMiddleware, instrument_queries
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # runs once on startup
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.run_sync(upgrade_schema)
+    # Window queries look back as far as the longest stored event runs
+    async with SessionLocal() as db:
+        await longest_event.refresh(db)
+    session_sweeper = asyncio.create_task(sweep_expired_sessions_forever())
+    change_log_pruner = asyncio.create_task(prune_change_log_forever())
+    duration_refresher = asyncio.create_task(refresh_longest_event_forever())
+    await event_broker.start()
     yield
     # place any shutdown cleanup after yield
+    session_sweeper.cancel()
+    change_log_pruner.cancel()
+    duration_refresher.cancel()
+    await event_broker.stop()
+    await engine.dispose()
 
 app = FastAPI(
     title="MCC Event Hub API",
@@ -34,11 +55,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route latency histograms and the Server-Timing header (served on /metrics).
+# Added last so it is the outermost middleware and its timing includes CORS.
+app.add_middleware(TimingMiddleware)
+instrument_queries(engine)
+
 
 # Include routers
 app.include_router(events.router)  # Event CRUD endpoints
 app.include_router(agenda.router)  # AI Agenda Optimizer
 app.include_router(auth.router)  # Admin Authentication
+app.include_router(metrics.router)  # Cache / performance counters
+app.include_router(calendar.router)  # iCalendar subscription feeds
 
 
 # Root endpoint
@@ -1,12 +1,28 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Literal
+from typing_extensions import TypedDict  # pydantic needs this one before Python 3.12
 from uuid import UUID
 
+from ..services.recurrence import as_utc, parse_rrule
+
 # ============================================
 # Event Schemas
 # ============================================
 
+def validate_recurrence_rule(rule: Optional[str]) -> Optional[str]:
+    """Reject rules services/recurrence.py can't expand (422), "" means none."""
+    if rule:
+        parse_rrule(rule)
+    return rule or None
+
+
+def check_event_times(start_time: datetime, end_time: datetime) -> None:
+    """Raise ValueError unless the event ends after it starts."""
+    if as_utc(end_time) <= as_utc(start_time):
+        raise ValueError("end_time must be after start_time")
+
+
 class EventBase(BaseModel):
     """Base schema for Event - shared fields"""
     title: str
@@ -15,26 +31,63 @@ class EventBase(BaseModel):
     type: str = "event"  # "event" or "office_hours"
     start_time: datetime
     end_time: datetime
+    external_id: Optional[str] = Field(default=None, max_length=255)  # e.g. the id in the source spreadsheet
+    recurrence_rule: Optional[str] = Field(default=None, max_length=255)  # e.g. "FREQ=WEEKLY;BYDAY=TU,TH;COUNT=10"
+    recurrence_exdates: Optional[List[datetime]] = None  # start times of cancelled occurrences
+
+    @field_validator("recurrence_rule")
+    @classmethod
+    def check_recurrence_rule(cls, rule):
+        return validate_recurrence_rule(rule)
 
 
 class EventCreate(EventBase):
     """Schema for creating a new event"""
-    pass
+
+    @model_validator(mode="after")
+    def check_times(self):
+        check_event_times(self.start_time, self.end_time)
+        return self
 
 
 class EventUpdate(BaseModel):
-    """Schema for updating an event - all fields optional"""
+    """Schema for updating an event - all fields optional, leave out the ones to keep"""
     title: Optional[str] = None
     description: Optional[str] = None
     organization: Optional[str] = None
     type: Optional[str] = None
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
+    external_id: Optional[str] = Field(default=None, max_length=255)
+    recurrence_rule: Optional[str] = Field(default=None, max_length=255)  # "" or null stops the series repeating
+    recurrence_exdates: Optional[List[datetime]] = None
+
+    @field_validator("title", "organization", "type", "start_time", "end_time")
+    @classmethod
+    def reject_null(cls, value):
+        # Only an explicit null gets here (defaults aren't validated); the
+        # columns are NOT NULL, so that's a 422 rather than a database error
+        if value is None:
+            raise ValueError("can't be null, leave the field out to keep its current value")
+        return value
+
+    @field_validator("recurrence_rule")
+    @classmethod
+    def check_recurrence_rule(cls, rule):
+        return validate_recurrence_rule(rule)
+
+    @model_validator(mode="after")
+    def check_times(self):
+        # With only one of them given, the router checks it against the stored other
+        if self.start_time and self.end_time:
+            check_event_times(self.start_time, self.end_time)
+        return self
 
 
 class EventResponse(EventBase):
     """Schema for event response"""
     id: UUID
+    recurrence_id: Optional[datetime] = None  # set on expanded occurrences of a recurring event: this occurrence's start
     created_at: datetime
     updated_at: datetime
 
@@ -42,6 +95,107 @@ class EventResponse(EventBase):
         from_attributes = True  # Allows SQLAlchemy models to be converted
 
 
+class EventRow(TypedDict):
+    """
+    EventResponse as a plain dict, for serializing long event lists: a
+    TypeAdapter validates a list of these in one pass without building a
+    model per event. Keep the fields, and their order (the JSON key
+    order), the same as EventResponse.
+    """
+    title: str
+    description: Optional[str]
+    organization: str
+    type: str
+    start_time: datetime
+    end_time: datetime
+    external_id: Optional[str]
+    recurrence_rule: Optional[str]
+    recurrence_exdates: Optional[List[datetime]]
+    id: UUID
+    recurrence_id: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+
+
+class EventPage(BaseModel):
+    """Schema for one page of events in cursor pagination"""
+    items: List[EventResponse]
+    next_cursor: Optional[str] = None  # None when this is the last page
+
+
+class EventChanges(BaseModel):
+    """Schema for delta sync: what changed since a change token"""
+    upserted: List[EventResponse]  # created or updated, in their current state
+    deleted: List[UUID]
+    token: int  # pass as since= on the next call
+    has_more: bool  # more changes are waiting, call again right away
+
+
+class FacetCount(BaseModel):
+    """Number of events with one value of a facet"""
+    value: str  # normalized organization, type, or day (YYYY-MM-DD)
+    count: int
+
+
+class EventFacets(BaseModel):
+    """Schema for the calendar's filter options and per-day badges"""
+    organizations: List[FacetCount]
+    types: List[FacetCount]
+    days: Optional[List[FacetCount]] = None  # only when start and end are given
+
+
+class BulkRowError(BaseModel):
+    """Why one row of a bulk import was rejected"""
+    row: int  # 0-based position in the uploaded list / CSV data rows
+    external_id: Optional[str] = None
+    errors: List[str]
+
+
+class BulkImportResponse(BaseModel):
+    """Schema for bulk import results"""
+    created: int
+    updated: int
+    failed: int
+    ids: List[UUID]  # ids of the written events, in upload order (failed rows skipped)
+    errors: List[BulkRowError] = []
+
+
+class EventSelection(BaseModel):
+    """
+    Which events a bulk update / delete applies to.
+
+    Either explicit ids, a filter (same meaning as the GET /events
+    filters), or both - at least one must be given so a request can't
+    touch every event by accident.
+    """
+    ids: Optional[List[UUID]] = Field(default=None, max_length=5000)
+    organization: Optional[str] = None
+    type: Optional[str] = None
+    start: Optional[datetime] = None  # events ending after this
+    end: Optional[datetime] = None  # events starting before this (series: only once they've stopped repeating)
+
+    @model_validator(mode="after")
+    def require_criteria(self):
+        if not (self.ids or self.organization or self.type or self.start or self.end):
+            raise ValueError("Give ids or at least one filter (organization, type, start, end)")
+        return self
+
+
+class BulkDeleteRequest(EventSelection):
+    """Schema for deleting many events in one statement"""
+    pass
+
+
+class BulkUpdateRequest(EventSelection):
+    """Schema for updating many events in one statement"""
+    changes: EventUpdate
+
+
+class BulkWriteResponse(BaseModel):
+    """Schema for bulk update / delete results"""
+    affected: int
+
+
 # ============================================
 # Profile Schemas
 # ============================================
@@ -71,15 +225,26 @@ class ProfileResponse(ProfileBase):
 # AI/Agenda Optimizer Schemas
 # ============================================
 
+class ChatMessage(BaseModel):
+    """Schema for one turn of the agenda chat history"""
+    role: Literal["user", "assistant"]  # the system prompt is added server-side
+    content: str = Field(max_length=8000)
+
+
 class AgendaRequest(BaseModel):
     """Schema for agenda optimizer request from frontend"""
-    message: str
-    history: List[dict] = []
+    message: str = Field(max_length=8000)
+    history: List[ChatMessage] = Field(default=[], max_length=200)
+
+    def history_dicts(self) -> List[dict]:
+        """History as plain {"role", "content"} dicts for the OpenAI client"""
+        return [turn.model_dump() for turn in self.history]
 
 
 class AgendaAIResponse(BaseModel):
     """Schema for agenda optimizer response"""
     response: str
+    cached: bool = False  # True if served from the agenda response cache
 
 
 # ============================================
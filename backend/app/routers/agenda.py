@@ -1,13 +1,54 @@
-from fastapi import APIRouter, HTTPException
+from typing import Awaitable, Callable
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
 from ..models.schemas import AgendaRequest, AgendaAIResponse
-from ..services.ai import optimize_agenda
+from ..services.ai import optimize_agenda, open_agenda_stream
+from ..services.broker import sse_event
+from ..services.resilience import LLMError, LLMUnavailableError
+from ..services.telemetry import TimedRoute
 
 router = APIRouter(
     prefix="/api",
-    tags=["agenda"]
+    tags=["agenda"],
+    route_class=TimedRoute
 )
 
 
+def unavailable(error: LLMUnavailableError) -> HTTPException:
+    """503 telling the client when it's worth trying again."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(error),
+        headers={"Retry-After": str(max(int(error.retry_after), 1))}
+    )
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that runs on_close once the response is over, however
+    it ends: completed, failed, or the client gone before the body was ever
+    read (when neither the body iterator's cleanup nor a BackgroundTask runs).
+    """
+
+    def __init__(self, content, on_close: Callable[[], Awaitable[None]], **kwargs):
+        super().__init__(content, **kwargs)
+        self.on_close = on_close
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.on_close()
+
+
+def bad_gateway(error: LLMError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        detail=f"Error processing agenda request: {str(error)}"
+    )
+
+
 @router.post("/agenda", response_model=AgendaAIResponse)
 async def create_agenda(request: AgendaRequest):
     """
@@ -19,21 +60,83 @@ async def create_agenda(request: AgendaRequest):
     Request body:
     - message: The user's current message (list of topics)
     - history: Array of previous messages in the conversation
+      ({"role": "user" | "assistant", "content": "..."}); older turns are
+      trimmed server-side to stay within the token budget
 
     Returns:
     - response: AI-generated organized agenda
+    - cached: whether it was served from the response cache
+
+    Returns 503 (with Retry-After) when the AI service is overloaded or
+    down, and 502 if it rejects the request.
     """
     try:
         # Call AI service to optimize the agenda
-        ai_response = optimize_agenda(
+        result = await optimize_agenda(
             user_message=request.message,
-            conversation_history=request.history
+            conversation_history=request.history_dicts()
         )
 
-        return AgendaAIResponse(response=ai_response)
+        return AgendaAIResponse(response=result.response, cached=result.cached)
+
+    except LLMUnavailableError as e:
+        raise unavailable(e)
+
+    except LLMError as e:
+        raise bad_gateway(e)
 
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Error processing agenda request: {str(e)}"
         )
+
+
+@router.post("/agenda/stream")
+async def stream_agenda_response(request: AgendaRequest):
+    """
+    Streaming AI Agenda Optimizer endpoint (Server-Sent Events).
+
+    Same request body as POST /api/agenda, but the agenda is sent as it is
+    generated instead of all at once:
+
+    - `data: {"delta": "..."}` for each piece of text
+    - `event: done` with `{"cached": bool}` once the agenda is complete
+    - `event: error` with `{"detail": "..."}` if the AI call fails midway
+
+    Cached agendas are sent as a single delta. Returns 503 / 502 before the
+    stream starts, like POST /api/agenda, if the AI service can't take it.
+    """
+    try:
+        pieces = await open_agenda_stream(
+            user_message=request.message,
+            conversation_history=request.history_dicts()
+        )
+    except LLMUnavailableError as e:
+        raise unavailable(e)
+    except LLMError as e:
+        raise bad_gateway(e)
+
+    async def events():
+        cached = False
+        try:
+            async for piece in pieces:
+                cached = piece.cached
+                yield sse_event({"delta": piece.response})
+
+            yield sse_event({"cached": cached}, event="done")
+
+        except Exception as e:
+            # Headers are already sent, so report the error in-stream
+            yield sse_event({"detail": f"Error processing agenda request: {str(e)}"}, event="error")
+
+    # Releases the AI service slot and the upstream stream when the response ends
+    return ClosingStreamingResponse(
+        events(),
+        on_close=pieces.aclose,
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # don't let proxies buffer the stream
+        },
+    )
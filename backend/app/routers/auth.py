@@ -8,10 +8,12 @@ Key Concepts:
 - We check if the email exists in the Profile table (admin allowlist)
 - If yes, we generate a token and return it
 - Frontend stores this token and sends it with future requests
+- Sessions live in a pluggable store (see services/sessions.py)
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Header
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 import secrets
@@ -20,13 +22,13 @@ from ..database.db import get_db
 from ..database.models import Profile
 from ..models.schemas import AdminLoginRequest, AdminLoginResponse, AdminProfileResponse, AddAdminRequest
 from ..crud import get_profile_by_email
+from ..services.sessions import session_store, admin_profile_cache
+from ..services.telemetry import TimedRoute
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+router = APIRouter(prefix="/auth", tags=["Authentication"], route_class=TimedRoute)
 
-# In-memory session storage (simple approach for learning)
-# In production, you'd use Redis or a database table
-# Format: {token: {"email": "user@example.com", "expires": datetime}}
-active_sessions = {}
+# Session tokens expire this long after login
+SESSION_DURATION = timedelta(hours=24)
 
 def extract_token(authorization: Optional[str]) -> str:
     if not authorization:
@@ -37,16 +39,16 @@ def extract_token(authorization: Optional[str]) -> str:
         )
     return authorization.replace("Bearer ", "")
 
-def validate_session(token: str):
-    if token not in active_sessions:
+async def validate_session(token: str):
+    session = await session_store.get(token)
+    if session is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired session",
             headers={"WWW-Authenticate": "Bearer"}
         )
-    session = active_sessions[token]
     if datetime.now(timezone.utc) > session["expires"]:
-        del active_sessions[token]
+        await session_store.delete(token)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Session expired. Please login again.",
@@ -66,9 +68,9 @@ def generate_session_token() -> str:
 
 
 @router.post("/login", response_model=AdminLoginResponse)
-def login(
+async def login(
     request: AdminLoginRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Admin Login Endpoint
@@ -83,7 +85,7 @@ def login(
     """
 
     # Step 1: Query the database for this email
-    profile = get_profile_by_email(db, request.email)
+    profile = await get_profile_by_email(db, request.email)
 
     # Step 2: If email not found, return error
     if not profile:
@@ -96,11 +98,8 @@ def login(
     token = generate_session_token()
 
     # Step 4: Store session (expires in 24 hours)
-    expiration = datetime.now(timezone.utc) + timedelta(hours=24)
-    active_sessions[token] = {
-        "email": request.email,
-        "expires": expiration
-    }
+    expiration = datetime.now(timezone.utc) + SESSION_DURATION
+    await session_store.create(token, request.email, expiration)
 
     # Step 5: Return token to frontend
     return AdminLoginResponse(
@@ -111,7 +110,7 @@ def login(
 
 
 @router.post("/logout")
-def logout(authorization: Optional[str] = Header(None)):
+async def logout(authorization: Optional[str] = Header(None)):
     """
     Logout Endpoint
 
@@ -122,15 +121,14 @@ def logout(authorization: Optional[str] = Header(None)):
     """
     token = extract_token(authorization)
 
-    if token in active_sessions:
-        del active_sessions[token]
+    if await session_store.delete(token):
         return {"message": "Logged out successfully"}
 
     return {"message": "Already logged out"}
 
 
 @router.get("/verify")
-def verify_session(authorization: Optional[str] = Header(None)):
+async def verify_session(authorization: Optional[str] = Header(None)):
     """
     Verify Session Endpoint
 
@@ -141,7 +139,7 @@ def verify_session(authorization: Optional[str] = Header(None)):
     """
 
     token = extract_token(authorization)
-    session = validate_session(token)
+    session = await validate_session(token)
 
     # Token is valid!
     return {
@@ -150,9 +148,9 @@ def verify_session(authorization: Optional[str] = Header(None)):
     }
 
 
-def get_current_admin(
+async def get_current_admin(
     authorization: Optional[str] = Header(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> Profile:
     """
     Dependency function to get the current authenticated admin.
@@ -161,7 +159,7 @@ def get_current_admin(
 
     Usage in other routes:
         @router.delete("/events/{id}")
-        def delete_event(
+        async def delete_event(
             id: str,
             admin: Profile = Depends(get_current_admin)
         ):
@@ -170,13 +168,23 @@ def get_current_admin(
 
     This is called a "dependency" in FastAPI - it runs before your endpoint.
     The token comes from the Authorization header: "Bearer <token>"
+
+    The admin's id/email/role are cached for a short time, so a burst of
+    dashboard edits doesn't re-query the profiles table on every request.
+    On a cache hit the returned Profile is a detached copy holding just
+    those fields.
     """
 
     token = extract_token(authorization)
-    session = validate_session(token)
+    session = await validate_session(token)
+
+    cached = admin_profile_cache.get(session["email"])
+    if cached:
+        profile_id, email, role = cached
+        return Profile(id=profile_id, email=email, role=role)
 
     # Get the profile from database
-    profile = get_profile_by_email(db, session["email"])
+    profile = await get_profile_by_email(db, session["email"])
 
     if not profile:
         raise HTTPException(
@@ -184,6 +192,8 @@ def get_current_admin(
             detail="User not found"
         )
 
+    admin_profile_cache.set(profile.email, (profile.id, profile.email, profile.role))
+
     return profile
 
 
@@ -192,24 +202,24 @@ def get_current_admin(
 # ============================================
 
 @router.get("/admins", response_model=List[AdminProfileResponse])
-def list_admins(
+async def list_admins(
     admin: Profile = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     List all admin profiles.
 
     **Requires admin authentication.**
     """
-    admins = db.query(Profile).order_by(Profile.created_at.desc()).all()
+    admins = (await db.scalars(select(Profile).order_by(Profile.created_at.desc()))).all()
     return admins
 
 
 @router.post("/admins", response_model=AdminProfileResponse, status_code=status.HTTP_201_CREATED)
-def add_admin(
+async def add_admin(
     request: AddAdminRequest,
     admin: Profile = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Add a new admin by email.
@@ -217,7 +227,7 @@ def add_admin(
     **Requires admin authentication.**
     """
     # Check if admin already exists
-    existing = get_profile_by_email(db, request.email)
+    existing = await get_profile_by_email(db, request.email)
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -227,17 +237,17 @@ def add_admin(
     # Create new admin profile
     new_admin = Profile(email=request.email, role="admin")
     db.add(new_admin)
-    db.commit()
-    db.refresh(new_admin)
+    await db.commit()
+    await db.refresh(new_admin)
 
     return new_admin
 
 
 @router.delete("/admins/{email}", status_code=status.HTTP_204_NO_CONTENT)
-def remove_admin(
+async def remove_admin(
     email: str,
     admin: Profile = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Remove an admin by email.
@@ -254,7 +264,7 @@ def remove_admin(
         )
 
     # Find the admin
-    admin_to_remove = get_profile_by_email(db, email)
+    admin_to_remove = await get_profile_by_email(db, email)
 
     if not admin_to_remove:
         raise HTTPException(
@@ -262,7 +272,10 @@ def remove_admin(
             detail=f"Admin with email {email} not found"
         )
 
-    db.delete(admin_to_remove)
-    db.commit()
+    await db.delete(admin_to_remove)
+    await db.commit()
+
+    # Stop accepting their existing sessions right away (in this worker)
+    admin_profile_cache.invalidate(email)
 
     return None
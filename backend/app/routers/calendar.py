@@ -0,0 +1,150 @@
+"""
+Calendar Router
+
+iCalendar subscription feeds for Google / Apple / Outlook calendar:
+
+- GET /calendar/all.ics - every organization's events
+- GET /calendar/{organization}.ics - one organization's events (matched
+  like the calendar's organization filter: case and spaces don't matter);
+  404 for an organization that has no events at all
+
+Calendar apps re-poll these URLs constantly, so a rendered feed is kept in
+calendar_feed_cache until an event of that organization changes, and
+every response carries ETag / Last-Modified so most polls end in a 304.
+"""
+
+import hashlib
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..crud import filter_events, normalized_organization
+from ..database.db import get_db
+from ..database.models import Event
+from ..services.cache import TTLCache
+from ..services.event_cache import ALL_ORGANIZATIONS, calendar_feed_cache, normalize_organization
+from ..services.http_cache import etag_matches, modified_since_matches, not_modified, validator_headers
+from ..services.ics import render_calendar
+from ..services.telemetry import TimedRoute, timed
+
+router = APIRouter(prefix="/calendar", tags=["calendar"], route_class=TimedRoute)
+
+# Past events stay in feeds this long, so last month is still visible
+FEED_PAST_DAYS = int(os.getenv("CALENDAR_FEED_PAST_DAYS", "90"))
+
+# feed key -> (etag, last_modified) of the last rendered version, so a
+# re-render with identical content keeps its Last-Modified date. It has to
+# outlive calendar_feed_cache (cleared by event writes), but is bounded
+# like it; a forgotten version only means a fresh Last-Modified.
+feed_versions = TTLCache(
+    max_entries=calendar_feed_cache.max_entries,
+    ttl_seconds=float(os.getenv("CALENDAR_FEED_VERSION_TTL_SECONDS", "86400")),
+)
+
+
+async def render_feed(db: AsyncSession, key: str) -> tuple:
+    """
+    Render a feed as (etag, last_modified, body).
+
+    A feed without events is still a valid, empty calendar: calendar apps
+    treat an error as a dead subscription and may drop it, when the
+    organization may just have a quiet week. Only an organization with no
+    events at all, past ones included, is a 404.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=FEED_PAST_DAYS)
+    query = filter_events(select(Event), start=cutoff)
+    if key != ALL_ORGANIZATIONS:
+        query = query.where(normalized_organization(Event.organization) == key)
+
+    events = (await db.scalars(query.order_by(Event.start_time.asc(), Event.id.asc()))).all()
+
+    if key == ALL_ORGANIZATIONS:
+        name = "MCC Events"
+    elif events:
+        name = f"MCC - {events[0].organization}"
+    else:
+        organization = await db.scalar(
+            select(Event.organization).where(normalized_organization(Event.organization) == key).limit(1)
+        )
+        if organization is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No organization with that name has any events"
+            )
+        name = f"MCC - {organization}"
+    with timed("serialization"):
+        body = render_calendar(name, events).encode("utf-8")
+
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    previous = feed_versions.get(key)
+    last_modified = previous[1] if previous and previous[0] == etag else datetime.now(timezone.utc).replace(microsecond=0)
+    feed_versions.set(key, (etag, last_modified))
+
+    return etag, last_modified, body
+
+
+async def feed_response(
+    db: AsyncSession,
+    key: str,
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str],
+) -> Response:
+    """Serve a feed from cache (rendering it on a miss), honoring conditional requests."""
+    feed = calendar_feed_cache.get(key)
+    if feed is None:
+        generation = calendar_feed_cache.generation
+        feed = await render_feed(db, key)
+        calendar_feed_cache.set(key, feed, generation=generation)
+
+    etag, last_modified, body = feed
+    if etag_matches(if_none_match, etag) or (
+        if_none_match is None and modified_since_matches(if_modified_since, last_modified)
+    ):
+        return not_modified(etag, last_modified)
+
+    return Response(
+        content=body,
+        media_type="text/calendar; charset=utf-8",
+        headers=validator_headers(etag, last_modified),
+    )
+
+
+@router.get("/all.ics")
+@router.head("/all.ics")
+async def all_events_feed(
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Subscription feed with every MCC event.
+
+    Add this URL to a calendar app ("subscribe from URL"). Includes events
+    from the last CALENDAR_FEED_PAST_DAYS days onward; recurring events are
+    sent as one repeating event.
+    """
+    return await feed_response(db, ALL_ORGANIZATIONS, if_none_match, if_modified_since)
+
+
+@router.get("/{organization}.ics")
+@router.head("/{organization}.ics")
+async def organization_feed(
+    organization: str,
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Subscription feed with one organization's events.
+
+    The name is matched ignoring case and spaces, so
+    /calendar/Black%20Student%20Union.ics and /calendar/BLACKSTUDENTUNION.ics
+    are the same feed. An organization without upcoming events gets an
+    empty calendar, not an error, so subscriptions survive quiet weeks;
+    a name no event has ever used is a 404.
+    """
+    return await feed_response(db, normalize_organization(organization), if_none_match, if_modified_since)
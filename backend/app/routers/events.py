@@ -1,28 +1,151 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Row, select, update, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import TypeAdapter, ValidationError
+from typing import List, Literal, Optional
 from uuid import UUID
+from datetime import datetime, timedelta, timezone
+import asyncio
+import csv
+import io
+import json
 
-from ..database.db import get_db
+import orjson
+
+from ..database.db import SessionLocal, get_db
 from ..database.models import Event, Profile
-from ..models.schemas import EventCreate, EventUpdate, EventResponse
+from ..models.schemas import (
+    EventCreate,
+    EventUpdate,
+    EventResponse,
+    EventRow,
+    EventPage,
+    EventFacets,
+    EventChanges,
+    BulkImportResponse,
+    BulkRowError,
+    EventSelection,
+    BulkDeleteRequest,
+    BulkUpdateRequest,
+    BulkWriteResponse,
+    check_event_times,
+)
 from .auth import get_current_admin
-from ..crud import get_event_or_404
+from ..crud import (
+    get_event_or_404,
+    get_event_version,
+    get_events_version,
+    filter_events,
+    EVENT_ROW_COLUMNS,
+    list_events_in_window,
+    find_conflicts,
+    find_event_conflicts,
+    search_events,
+    get_event_facets,
+    record_event_changes,
+    get_change_token,
+    get_event_changes,
+    seek_events_after,
+    encode_event_cursor,
+    bulk_upsert_events,
+)
+from ..services.http_cache import make_etag, etag_matches, set_cache_headers, not_modified
+from ..services.event_cache import (
+    event_list_cache,
+    event_facet_cache,
+    listing_key,
+    event_scope,
+    invalidate_events,
+    clear_event_caches,
+)
+from ..services.recurrence import exdates_to_json, series_end
+from ..services.search import search_index
+from ..services.broker import event_broker, publish_event_change, sse_event
+from ..services.telemetry import TimedRoute, timed
+from ..services.durations import longest_event
 
 
 router = APIRouter(
     prefix="/events",
-    tags=["events"]
+    tags=["events"],
+    route_class=TimedRoute
 )
 
 
+# Serializers, built once at import
+event_list_adapter = TypeAdapter(List[EventResponse])
+event_row_list_adapter = TypeAdapter(List[EventRow])
+
+
+def validate_event_rows(rows) -> List[EventRow]:
+    """
+    Validate EVENT_ROW_COLUMNS rows for the listing endpoints in one
+    TypeAdapter pass over plain dicts. Through dump_json() this gives the
+    same JSON as EventResponse, several times faster for long lists.
+    """
+    return event_row_list_adapter.validate_python([
+        # dict(zip()) is several times faster than Row._asdict()
+        dict(zip(row._fields, row)) if isinstance(row, Row) else row._asdict()
+        for row in rows
+    ])
+
+
+def dump_json(content) -> bytes:
+    """orjson, writing UTC datetimes with a Z the way pydantic does."""
+    return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+
+def json_response(body: bytes, etag: str) -> Response:
+    """Send pre-serialized JSON with the cache validator headers."""
+    response = Response(content=body, media_type="application/json")
+    set_cache_headers(response, etag)
+    return response
+
+
+def is_duplicate_external_id(error: IntegrityError) -> bool:
+    """
+    True if error is ix_events_external_id rejecting a duplicate. Other
+    integrity errors are bugs, not conflicts, and shouldn't become a 409.
+    """
+    # SQLite: "UNIQUE constraint failed: events.external_id",
+    # Postgres: 'duplicate key value violates unique constraint "ix_events_external_id"'
+    message = str(error.orig)
+    return "external_id" in message and ("UNIQUE" in message or "unique" in message)
+
+
+def reject_conflicts(conflicts: list) -> None:
+    """409 listing the overlapping events, for strict writes."""
+    if conflicts:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "message": "This event overlaps other events of the same organization",
+                "conflicts": event_list_adapter.dump_python(
+                    event_list_adapter.validate_python(conflicts, from_attributes=True), mode="json"
+                ),
+            }
+        )
+
+
+def recurrence_columns(fields: dict) -> dict:
+    """Convert recurrence_exdates from an EventCreate / EventUpdate dump to its column value."""
+    if "recurrence_exdates" in fields:
+        fields["recurrence_exdates"] = exdates_to_json(fields["recurrence_exdates"])
+    return fields
+
+
 @router.get("/", response_model=List[EventResponse])
-def get_events(
+async def get_events(
     skip: int = 0,
     limit: int = 100,
     organization: str = None,
     type: str = None,
-    db: Session = Depends(get_db)
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get all events with optional filtering.
@@ -31,80 +154,723 @@ def get_events(
     - **limit**: Maximum number of records to return
     - **organization**: Filter by organization name (optional)
     - **type**: Filter by event type: "event" or "office_hours" (optional)
+    - **start**: Only events that end after this time (optional)
+    - **end**: Only events that start before this time (optional); without
+      **start**, recurring events only once they have stopped repeating
+
+    Pass both start and end to fetch just the events visible in a calendar
+    view (e.g. one month) instead of downloading everything. Recurring
+    events are then expanded into their occurrences in that window (each
+    with the series' id and a **recurrence_id**); without a full window
+    they are returned once, as the series.
+
+    Responses carry an ETag. Send it back in If-None-Match and you get an
+    empty 304 if no event has changed since.
+
+    Serialized responses are cached in memory until an event they contain
+    could have changed, so repeat reads don't touch the database.
+    """
+    key = listing_key("events", organization, type, start, end, skip, limit)
+
+    cached = event_list_cache.get(key)
+    if cached:
+        etag, body = cached
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        return json_response(body, etag)
+
+    generation = event_list_cache.generation
+    etag = make_etag("events", await get_events_version(db), skip, limit, organization, type, start, end)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    if start and end:
+        events = await list_events_in_window(db, organization, type, start, end, skip, limit)
+    else:
+        query = filter_events(select(*EVENT_ROW_COLUMNS), organization, type, start, end)
+
+        # Order by start time (ascending), id breaks ties so paging is stable
+        query = query.order_by(Event.start_time.asc(), Event.id.asc()).offset(skip).limit(limit)
+        events = (await db.execute(query)).all()
+
+    with timed("serialization"):
+        body = dump_json(validate_event_rows(events))
+    event_list_cache.set(key, (etag, body), generation=generation)
+
+    return json_response(body, etag)
+
+
+@router.get("/page", response_model=EventPage)
+async def get_events_page(
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    organization: str = None,
+    type: str = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get events one page at a time using cursor (keyset) pagination.
+
+    Takes the same filters as GET /events. Leave **cursor** empty for the
+    first page, then pass the returned **next_cursor** to get the next one.
+    next_cursor is null on the last page.
+
+    Every page costs the same no matter how deep it is, and events created
+    while paging don't cause rows to be skipped or repeated.
+
+    Supports If-None-Match and is cached the same way as GET /events.
+    Recurring events are listed once, as the series (not expanded).
+    """
+    key = listing_key("events-page", organization, type, start, end, cursor, limit)
+
+    cached = event_list_cache.get(key)
+    if cached:
+        etag, body = cached
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        return json_response(body, etag)
+
+    generation = event_list_cache.generation
+    etag = make_etag("events-page", await get_events_version(db), cursor, limit, organization, type, start, end)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    query = filter_events(select(*EVENT_ROW_COLUMNS), organization, type, start, end)
+
+    if cursor:
+        query = seek_events_after(query, cursor)
+
+    # Fetch one extra row to find out if there is another page
+    query = query.order_by(Event.start_time.asc(), Event.id.asc()).limit(limit + 1)
+    events = (await db.execute(query)).all()
+
+    next_cursor = None
+    if len(events) > limit:
+        events = events[:limit]
+        next_cursor = encode_event_cursor(events[-1])
+
+    with timed("serialization"):
+        body = dump_json({"items": validate_event_rows(events), "next_cursor": next_cursor})
+    event_list_cache.set(key, (etag, body), generation=generation)
+
+    return json_response(body, etag)
+
+
+# Comment frames sent while idle, so proxies don't close the stream
+STREAM_HEARTBEAT_SECONDS = 15
+
+
+@router.get("/stream")
+async def stream_event_changes(request: Request):
+    """
+    Push notifications for event changes (Server-Sent Events).
+
+    - `event: ready` once connected
+    - `data: {"op": "upsert" | "delete", "ids": [...], "count": n}` after
+      every create, update or delete (ids is empty for large bulk writes)
+    - `event: resync` if notifications may have been missed (e.g. this
+      client fell too far behind); the server then closes the stream
+
+    Notifications carry no event data: on each one, fetch what changed with
+    GET /events/changes?since=<your token>. Returns 503 when the server
+    already has as many subscribers as it accepts.
+    """
+    subscription = event_broker.subscribe()
+    if subscription is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many live subscribers, poll GET /events/changes instead",
+            headers={"Retry-After": "30"},
+        )
+
+    async def notifications():
+        try:
+            yield sse_event({}, event="ready")
+            while True:
+                if subscription.overflowed:
+                    yield sse_event({}, event="resync")
+                    return
+                try:
+                    message = await asyncio.wait_for(subscription.queue.get(), timeout=STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": keepalive\n\n"
+                    continue
+                if message["op"] == "resync":
+                    yield sse_event({}, event="resync")
+                    return
+                yield sse_event(message)
+        finally:
+            event_broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        notifications(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # don't let proxies buffer the stream
+        },
+    )
+
+
+@router.get("/changes", response_model=EventChanges)
+async def get_changes(
+    since: Optional[int] = Query(None, ge=0),
+    limit: int = Query(500, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Delta sync: the events created, updated or deleted since a change token.
+
+    1. Call without **since** to get the current token, then load the
+       events as usual (GET /events)
+    2. Poll with **since**=token: apply **upserted** and **deleted** to your
+       copy, and keep the returned token for the next call. If **has_more**
+       is true, call again straight away.
+
+    A token older than the change log's retention (CHANGE_LOG_RETENTION_DAYS)
+    gets 410 Gone: reload everything and start over from step 1.
+    """
+    if since is None:
+        return EventChanges(upserted=[], deleted=[], token=await get_change_token(db), has_more=False)
+
+    upserted, deleted, token, has_more = await get_event_changes(db, since, limit)
+    return EventChanges(
+        upserted=event_list_adapter.validate_python(upserted, from_attributes=True),
+        deleted=deleted,
+        token=token,
+        has_more=has_more,
+    )
+
+
+# Longest window GET /events/facets will count per day
+FACET_MAX_WINDOW_DAYS = 366
+
+
+@router.get("/facets", response_model=EventFacets)
+async def get_facets(
+    type: str = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Summary counts for the calendar's filters and month view.
+
+    - **organizations**: distinct organizations, normalized (whitespace
+      removed, uppercased) with their event counts
+    - **types**: event counts per type
+    - **days**: event counts per day, when **start** and **end** are given
+      (at most a year apart)
+
+    Takes the same type / start / end filters as GET /events. Computed with
+    GROUP BY in the database and cached until the next event write.
     """
-    query = db.query(Event)
+    if start and end and end - start > timedelta(days=FACET_MAX_WINDOW_DAYS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Window can be at most {FACET_MAX_WINDOW_DAYS} days"
+        )
 
-    # Filter by organization if provided
-    if organization:
-        query = query.filter(Event.organization == organization)
+    key = listing_key("facets", None, type, start, end, None, None)
+    facets = event_facet_cache.get(key)
+    if facets is None:
+        generation = event_facet_cache.generation
+        facets = EventFacets(**await get_event_facets(db, type, start, end))
+        event_facet_cache.set(key, facets, generation=generation)
 
-    # Filter by type if provided
-    if type:
-        query = query.filter(Event.type == type)
+    return facets
 
-    # Order by start time (ascending)
-    events = query.order_by(Event.start_time.asc()).offset(skip).limit(limit).all()
 
-    return events
+@router.get("/search", response_model=List[EventResponse])
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    organization: str = None,
+    type: str = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Search events by title, organization and description.
+
+    - **q**: Search text; every word must match, and words match as
+      prefixes, so it works for type-ahead ("blac stu" finds "Black
+      Student Union")
+    - **limit**: Maximum number of results (default 20)
+    - **organization** / **type**: Same filters as GET /events (optional)
+
+    Results are ranked: title matches first, then organization, then
+    description. Recurring events are returned once, as the series.
+    """
+    return await search_events(db, q, limit, organization, type)
+
+
+@router.get("/conflicts", response_model=List[EventResponse])
+async def get_conflicts(
+    start: datetime,
+    end: datetime,
+    organization: str = None,
+    exclude_id: Optional[UUID] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Find the events overlapping [start, end).
+
+    - **organization**: Only check this organization's events (optional)
+    - **exclude_id**: Ignore this event, e.g. the one being edited (optional)
+
+    Occurrences of recurring events are included. Use it to warn before
+    saving, or pass strict=true to POST / PUT to refuse overlapping writes.
+    """
+    if end <= start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end must be after start"
+        )
+
+    return await find_conflicts(db, [(start, end)], organization, exclude_id)
+
+
+# Columns written by GET /events/export, in CSV column order
+EXPORT_COLUMNS = (
+    Event.id, Event.title, Event.description, Event.organization, Event.type,
+    Event.start_time, Event.end_time, Event.external_id,
+    Event.recurrence_rule, Event.recurrence_exdates, Event.created_at, Event.updated_at,
+)
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+# Rows fetched from the database cursor (and encoded) per chunk
+EXPORT_BATCH_SIZE = 1000
+
+
+def export_value(value):
+    """JSON/CSV-friendly form of a column value (ISO 8601 UTC datetimes)."""
+    if isinstance(value, datetime):
+        return (value if value.tzinfo else value.replace(tzinfo=timezone.utc)).isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+@router.get("/export")
+async def export_events(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    organization: str = None,
+    type: str = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+):
+    """
+    Download events as NDJSON (one JSON object per line) or CSV.
+
+    Takes the same filters as GET /events, without a row limit. Rows are
+    streamed from a server-side cursor as they are read, so the download
+    starts immediately and memory use doesn't grow with the number of
+    events. Recurring events are exported once, as the series.
+
+    The CSV has a header row and can be re-imported with POST /events/bulk
+    (recurrence_exdates is a JSON list in one cell).
+    """
+    # Built (and validated) before streaming starts, so bad filters get a 400
+    query = filter_events(select(*EXPORT_COLUMNS), organization, type, start, end)
+    query = query.order_by(Event.start_time.asc(), Event.id.asc()).execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+    def ndjson_chunk(rows) -> str:
+        return "".join(
+            json.dumps({field: export_value(value) for field, value in zip(EXPORT_FIELDS, row)}) + "\n"
+            for row in rows
+        )
+
+    def csv_chunk(rows) -> str:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([
+                json.dumps(value) if isinstance(value, list) else export_value(value)
+                for value in row
+            ])
+        return buffer.getvalue()
+
+    async def chunks():
+        if format == "csv":
+            yield ",".join(EXPORT_FIELDS) + "\r\n"
+        encode = csv_chunk if format == "csv" else ndjson_chunk
+
+        # Own session: the request's session is closed once the handler
+        # returns, while this keeps reading for the whole download
+        async with SessionLocal() as session:
+            result = await session.stream(query)
+            async for rows in result.partitions():
+                yield encode(rows)
+
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        chunks(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="events.{format}"'},
+    )
 
 
 @router.get("/{event_id}", response_model=EventResponse)
-def get_event(event_id: UUID, db: Session = Depends(get_db)):
+async def get_event(
+    event_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db)
+):
     """
     Get a single event by ID.
+
+    Supports If-None-Match: returns 304 if the event hasn't changed.
     """
-    event = get_event_or_404(db, event_id)
+    etag = make_etag("event", event_id, await get_event_version(db, event_id))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    event = await get_event_or_404(db, event_id)
 
+    set_cache_headers(response, etag)
     return event
 
 
 @router.post("/", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
-def create_event(event_data: EventCreate, db: Session = Depends(get_db)):
+async def create_event(event_data: EventCreate, strict: bool = False, db: AsyncSession = Depends(get_db)):
     """
     Create a new event.
 
     This is called from the EventModal component when users create events.
+    Set **recurrence_rule** to store a repeating event (e.g. weekly office
+    hours) once instead of one event per occurrence.
+
+    With **strict**=true, returns 409 (listing the conflicts) instead of
+    creating an event that overlaps another event of the same organization.
     """
     # Create new event
-    new_event = Event(**event_data.model_dump())
+    new_event = Event(**recurrence_columns(event_data.model_dump()))
+    new_event.recurrence_end = series_end(new_event.recurrence_rule, new_event.start_time, new_event.end_time)
 
+    if strict:
+        reject_conflicts(await find_event_conflicts(db, new_event))
+
+    longest_event.observe(new_event.start_time, new_event.end_time)
     db.add(new_event)
-    db.commit()
-    db.refresh(new_event)
+    try:
+        await db.flush()
+        await record_event_changes(db, [new_event.id], "upsert")
+        await db.commit()
+    except IntegrityError as e:
+        if not is_duplicate_external_id(e):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"An event with external_id {event_data.external_id} already exists"
+        )
+    await db.refresh(new_event)
+
+    invalidate_events(new_event)
+    search_index.add_event(new_event)
+    await publish_event_change("upsert", [new_event.id])
 
     return new_event
 
 
+# Largest import accepted in one request
+BULK_MAX_ROWS = 5000
+
+# List fields, written to CSV as a JSON list in one cell (see GET /events/export)
+CSV_JSON_FIELDS = ("recurrence_exdates",)
+
+
+async def read_bulk_rows(request: Request) -> List[dict]:
+    """
+    Read the uploaded rows from a JSON or CSV request body.
+
+    JSON: a list of events, or {"events": [...]}.
+    CSV (Content-Type: text/csv): a header row with the EventCreate field
+    names; empty cells count as missing, and recurrence_exdates is a JSON
+    list, as GET /events/export writes it.
+    """
+    body = await request.body()
+
+    if request.headers.get("content-type", "").startswith("text/csv"):
+        try:
+            reader = csv.DictReader(io.StringIO(body.decode("utf-8-sig")))
+            rows = [{key: value for key, value in row.items() if value not in ("", None)} for row in reader]
+        except (UnicodeDecodeError, csv.Error) as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid CSV: {e}")
+        for row in rows:
+            for field in CSV_JSON_FIELDS:
+                if field in row:
+                    try:
+                        row[field] = json.loads(row[field])
+                    except ValueError:
+                        pass  # left as is, so the row fails validation and is reported
+    else:
+        try:
+            rows = json.loads(body)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid JSON: {e}")
+        if isinstance(rows, dict):
+            rows = rows.get("events")
+        if not isinstance(rows, list):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Expected a list of events or {\"events\": [...]}"
+            )
+
+    if len(rows) > BULK_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {BULK_MAX_ROWS} events per import"
+        )
+
+    return rows
+
+
+@router.post("/bulk", response_model=BulkImportResponse)
+async def bulk_import_events(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    admin: Profile = Depends(get_current_admin)
+):
+    """
+    Import many events at once (e.g. a term's worth of office hours).
+
+    Send a JSON list of events, or a CSV file with Content-Type: text/csv
+    whose header uses the same field names.
+
+    - Every row is validated like POST /events; invalid rows are reported
+      in **errors** and skipped, the rest are written
+    - Rows with an **external_id** are upserted: importing the same file
+      again updates those events instead of creating duplicates
+    - All valid rows are written in one transaction with batched
+      multi-row INSERTs, not one round-trip per event
+
+    **Requires admin authentication.**
+    """
+    rows = await read_bulk_rows(request)
+
+    valid_rows = []
+    errors = []
+    seen_external_ids = set()
+
+    for index, row in enumerate(rows):
+        external_id = row.get("external_id") if isinstance(row, dict) else None
+        try:
+            event_data = EventCreate.model_validate(row)
+        except ValidationError as e:
+            messages = [f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}" for error in e.errors()]
+            errors.append(BulkRowError(row=index, external_id=external_id, errors=messages))
+            continue
+
+        if event_data.external_id:
+            if event_data.external_id in seen_external_ids:
+                errors.append(BulkRowError(row=index, external_id=external_id, errors=["external_id: duplicated in this import"]))
+                continue
+            seen_external_ids.add(event_data.external_id)
+
+        fields = recurrence_columns(event_data.model_dump())
+        fields["recurrence_end"] = series_end(fields["recurrence_rule"], fields["start_time"], fields["end_time"])
+        longest_event.observe(fields["start_time"], fields["end_time"])
+        valid_rows.append(fields)
+
+    ids, updated = await bulk_upsert_events(db, valid_rows)
+    await record_event_changes(db, ids, "upsert")
+    await db.commit()
+
+    # Upserts can move existing events anywhere, so drop every cached listing
+    if valid_rows:
+        clear_event_caches()
+    for event_id, row in zip(ids, valid_rows):
+        search_index.add(event_id, row["title"], row["description"], row["organization"], row["type"])
+    await publish_event_change("upsert", ids)
+
+    return BulkImportResponse(
+        created=len(ids) - updated,
+        updated=updated,
+        failed=len(errors),
+        ids=ids,
+        errors=errors,
+    )
+
+
+def select_events(statement, selection: EventSelection):
+    """Apply an EventSelection (ids and/or filters) to an update / delete."""
+    if selection.ids:
+        statement = statement.where(Event.id.in_(selection.ids))
+
+    return filter_events(statement, selection.organization, selection.type, selection.start, selection.end)
+
+
+@router.patch("/bulk", response_model=BulkWriteResponse)
+async def bulk_update_events(
+    request: BulkUpdateRequest,
+    db: AsyncSession = Depends(get_db),
+    admin: Profile = Depends(get_current_admin)
+):
+    """
+    Update every selected event with one UPDATE statement.
+
+    Select events by **ids** and/or filters (organization, type, start,
+    end), and give the fields to change in **changes**. Returns how many
+    events were updated. start_time and end_time can only be changed
+    together.
+
+    **Requires admin authentication.**
+    """
+    changes = request.changes.model_dump(exclude_unset=True)
+
+    if not changes:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No changes given")
+    if "external_id" in changes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="external_id is unique per event and can't be bulk-updated"
+        )
+    if "recurrence_rule" in changes or "recurrence_exdates" in changes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Recurrence is set per event, use PUT /events/{event_id}"
+        )
+    # One side alone would have to be checked against each row's other
+    # side; both together are checked once, by EventUpdate (which also
+    # rejects null for them and the other NOT NULL fields, as a 422)
+    if len(changes.keys() & {"start_time", "end_time"}) == 1:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Set start_time and end_time together in a bulk update, or use PUT /events/{event_id}"
+        )
+
+    moved = "start_time" in changes
+    if moved:
+        longest_event.observe(changes["start_time"], changes["end_time"])
+
+    changes["updated_at"] = datetime.now(timezone.utc)
+    statement = select_events(update(Event), request).values(**changes).returning(Event.id, Event.recurrence_rule)
+
+    result = await db.execute(statement.execution_options(synchronize_session=False))
+    updated = result.all()
+    updated_ids = [row.id for row in updated]
+
+    # Moving a series changes where its last occurrence ends, which can't be
+    # computed in SQL. Every row got the same times, so it only depends on
+    # each series' rule; series are few, so recompute them here
+    if moved:
+        series_ends = [
+            {"id": row.id, "recurrence_end": series_end(row.recurrence_rule, changes["start_time"], changes["end_time"])}
+            for row in updated if row.recurrence_rule
+        ]
+        if series_ends:
+            await db.execute(update(Event), series_ends)
+
+    await record_event_changes(db, updated_ids, "upsert")
+    await db.commit()
+
+    # The previous values of the updated rows aren't known here, so any
+    # cached listing could be affected
+    if updated_ids:
+        clear_event_caches()
+        if changes.keys() & {"title", "description", "organization", "type"}:
+            search_index.reset()  # rebuilt from the database on the next search
+    await publish_event_change("upsert", updated_ids)
+
+    return BulkWriteResponse(affected=len(updated_ids))
+
+
+@router.post("/bulk-delete", response_model=BulkWriteResponse)
+async def bulk_delete_events(
+    request: BulkDeleteRequest,
+    db: AsyncSession = Depends(get_db),
+    admin: Profile = Depends(get_current_admin)
+):
+    """
+    Delete every selected event with one DELETE statement.
+
+    Select events by **ids** and/or filters, e.g. `{"end": "2025-06-15"}`
+    removes everything that started before the end of spring term.
+    Returns how many events were deleted.
+
+    **Requires admin authentication.**
+    """
+    statement = select_events(delete(Event), request).returning(
+        Event.id, Event.organization, Event.type, Event.start_time, Event.end_time,
+        Event.recurrence_rule, Event.recurrence_end,
+    )
+
+    result = await db.execute(statement.execution_options(synchronize_session=False))
+    rows = result.all()
+    deleted = [event_scope(row) for row in rows]
+    await record_event_changes(db, [row.id for row in rows], "delete")
+    await db.commit()
+
+    invalidate_events(*deleted)
+    for row in rows:
+        search_index.remove(row.id)
+    await publish_event_change("delete", [row.id for row in rows])
+
+    return BulkWriteResponse(affected=len(deleted))
+
+
 @router.put("/{event_id}", response_model=EventResponse)
-def update_event(
+async def update_event(
     event_id: UUID,
     event_data: EventUpdate,
-    db: Session = Depends(get_db),
+    strict: bool = False,
+    db: AsyncSession = Depends(get_db),
     admin: Profile = Depends(get_current_admin)
 ):
     """
     Update an existing event.
 
-    Only provided fields will be updated.
+    Only provided fields will be updated. With **strict**=true, returns 409
+    if the updated event would overlap another event of its organization.
     **Requires admin authentication.**
     """
-    event = get_event_or_404(db, event_id)
+    event = await get_event_or_404(db, event_id)
+    before = event_scope(event)
 
     # Update only provided fields
-    update_data = event_data.model_dump(exclude_unset=True)
+    update_data = recurrence_columns(event_data.model_dump(exclude_unset=True))
     for field, value in update_data.items():
         setattr(event, field, value)
+    try:
+        check_event_times(event.start_time, event.end_time)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    event.recurrence_end = series_end(event.recurrence_rule, event.start_time, event.end_time)
+    longest_event.observe(event.start_time, event.end_time)
+
+    if strict:
+        reject_conflicts(await find_event_conflicts(db, event))
 
-    db.commit()
-    db.refresh(event)
+    try:
+        await record_event_changes(db, [event.id], "upsert")
+        await db.commit()
+    except IntegrityError as e:
+        if not is_duplicate_external_id(e):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"An event with external_id {event_data.external_id} already exists"
+        )
+    await db.refresh(event)
+
+    # Drop cached listings the event moved out of as well as into
+    invalidate_events(before, event)
+    search_index.add_event(event)
+    await publish_event_change("upsert", [event.id])
 
     return event
 
 
 @router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_event(
+async def delete_event(
     event_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     admin: Profile = Depends(get_current_admin)
 ):
     """
@@ -113,9 +879,15 @@ def delete_event(
     This will also delete all associated agenda items (cascade).
     **Requires admin authentication.**
     """
-    event = get_event_or_404(db, event_id)
+    event = await get_event_or_404(db, event_id)
+    before = event_scope(event)
+
+    await db.delete(event)
+    await record_event_changes(db, [event_id], "delete")
+    await db.commit()
 
-    db.delete(event)
-    db.commit()
+    invalidate_events(before)
+    search_index.remove(event_id)
+    await publish_event_change("delete", [event_id])
 
     return None
@@ -0,0 +1,148 @@
+"""
+Metrics Router
+
+Read-only counters for sizing and tuning the backend (cache hit rates,
+connection pool usage, etc.). Nothing here touches the database.
+
+GET /metrics serves them, plus per-route request timings, in Prometheus
+text format; the /metrics/* endpoints are JSON views for people.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ..database.db import engine
+from ..database.pool import pool_stats
+from ..services.event_cache import event_list_cache, event_facet_cache, calendar_feed_cache
+from ..services.ics import vevent_cache
+from ..services.sessions import admin_profile_cache
+from ..services.agenda_cache import agenda_cache
+from ..services.history import history_metrics
+from ..services.resilience import llm_stats
+from ..services.search import search_index
+from ..services.broker import event_broker
+from ..services.telemetry import PROMETHEUS_CONTENT_TYPE, PrometheusText, TimedRoute, telemetry
+
+router = APIRouter(prefix="/metrics", tags=["metrics"], route_class=TimedRoute)
+
+
+@router.get("/cache")
+def cache_metrics():
+    """
+    Hit, miss and eviction counters for the in-process caches.
+
+    Counters are per worker process.
+    """
+    return {
+        "events": event_list_cache.stats(),
+        "event_facets": event_facet_cache.stats(),
+        "calendar_feeds": calendar_feed_cache.stats(),
+        "calendar_events": vevent_cache.stats(),
+        "admin_profiles": admin_profile_cache.stats(),
+        "agenda": agenda_cache.stats(),
+        "search_index": search_index.stats(),  # in-process fallback, unused on Postgres
+    }
+
+
+@router.get("/pool")
+def pool_metrics():
+    """
+    Database connection pool usage for this worker.
+
+    - checked_out / idle / overflow: connections in use right now
+    - checkout_ms_*: how long requests waited for a connection
+    - overflow_connects: connections opened beyond DB_POOL_SIZE
+    - timeouts: checkouts that gave up after DB_POOL_TIMEOUT
+    - invalidations: dead connections replaced (e.g. failed pre-ping)
+    """
+    return pool_stats(engine)
+
+
+@router.get("/agenda")
+def agenda_metrics():
+    """
+    Agenda optimizer prompt sizes and LLM backend health for this worker.
+
+    - history: token budget, how many requests had older turns trimmed,
+      token counts before / after trimming
+    - llm: circuit breaker state, in-flight calls and queue depth,
+      retry / timeout counters
+    """
+    return {
+        "history": history_metrics.snapshot(),
+        "llm": llm_stats(),
+    }
+
+
+@router.get("/stream")
+def stream_metrics():
+    """
+    Live /events/stream subscribers and message counters (per worker).
+
+    dropped_subscribers counts clients cut off for falling behind.
+    """
+    return event_broker.stats()
+
+
+CACHES = {
+    "events": event_list_cache,
+    "event_facets": event_facet_cache,
+    "calendar_feeds": calendar_feed_cache,
+    "calendar_events": vevent_cache,
+    "admin_profiles": admin_profile_cache,
+    "agenda": agenda_cache,
+}
+
+
+@router.get("", response_class=PlainTextResponse)
+def prometheus_metrics():
+    """
+    Everything above in Prometheus text format, for scraping.
+
+    - mcc_http_*: latency histogram, status codes, SQL statements and
+      db / serialization / ai time per route
+    - mcc_db_*: statement latency histogram, slow statements, pool usage
+    - mcc_cache_*, mcc_llm_*, mcc_stream_*: the caches, the LLM backend
+      and /events/stream
+
+    Counters are per worker process; scrape every worker.
+    """
+    out = PrometheusText()
+    telemetry.write_prometheus(out)
+
+    pool = pool_stats(engine)
+    for key, kind, help_text in (
+        ("checked_out", "gauge", "Connections in use"),
+        ("idle", "gauge", "Idle connections in the pool"),
+        ("overflow", "gauge", "Connections open beyond DB_POOL_SIZE"),
+        ("checkouts", "counter", "Connection checkouts"),
+        ("overflow_connects", "counter", "Connections opened beyond DB_POOL_SIZE"),
+        ("timeouts", "counter", "Checkouts that timed out waiting for a connection"),
+        ("invalidations", "counter", "Dead connections replaced"),
+    ):
+        if key in pool:
+            suffix = "_total" if kind == "counter" else ""
+            out.metric(f"mcc_db_pool_{key}{suffix}", kind, help_text, [({}, pool[key])])
+
+    cache_stats = {name: cache.stats() for name, cache in CACHES.items()}
+    for key, kind, help_text in (
+        ("size", "gauge", "Entries in the cache"),
+        ("hits", "counter", "Cache hits"),
+        ("misses", "counter", "Cache misses"),
+        ("evictions", "counter", "Entries evicted to stay under max_entries"),
+        ("invalidations", "counter", "Entries dropped because the data changed"),
+    ):
+        suffix = "_total" if kind == "counter" else ""
+        out.metric(f"mcc_cache_{key}{suffix}", kind, help_text, [
+            ({"cache": name}, stats[key]) for name, stats in cache_stats.items()
+        ])
+
+    llm = llm_stats()
+    for key in ("calls", "failures", "retries", "timeouts"):
+        out.metric(f"mcc_llm_{key}_total", "counter", f"LLM {key}", [({}, llm[key])])
+
+    stream = event_broker.stats()
+    out.metric("mcc_stream_subscribers", "gauge", "Connected /events/stream clients", [({}, stream["subscribers"])])
+    out.metric("mcc_stream_dropped_subscribers_total", "counter", "Stream clients dropped for falling behind", [({}, stream["dropped_subscribers"])])
+
+    return PlainTextResponse(out.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,122 @@
+"""
+Response cache for the agenda optimizer.
+
+Recurring meetings send the same (or trivially different) topic lists over
+and over. Completions are cached by a hash of the normalized messages sent
+to the model, so a repeat request is answered from memory instead of
+paying the full LLM latency and cost.
+
+- In memory: LRU + TTL (AGENDA_CACHE_MAX_ENTRIES, AGENDA_CACHE_TTL_SECONDS)
+- On disk (optional): set AGENDA_CACHE_DIR to keep entries across restarts
+  and share them between workers on the same machine
+
+Only exact matches after normalization (case and whitespace) are hits;
+there is no embedding-based "similar request" matching.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from .cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+MAX_ENTRIES = int(os.getenv("AGENDA_CACHE_MAX_ENTRIES", "512"))
+TTL_SECONDS = float(os.getenv("AGENDA_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+CACHE_DIR = os.getenv("AGENDA_CACHE_DIR")
+
+# Check the disk cache size every this many writes rather than on each one
+PRUNE_EVERY = 50
+
+
+def _normalize(text: str) -> str:
+    """Case and whitespace don't change the agenda we want back."""
+    return " ".join(str(text).split()).casefold()
+
+
+def cache_key(model: str, messages: list) -> str:
+    """Content address of a completion request."""
+    normalized = [
+        {"role": message.get("role"), "content": _normalize(message.get("content", ""))}
+        for message in messages
+    ]
+    payload = json.dumps({"model": model, "messages": normalized}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class AgendaCache:
+    """In-memory TTL cache with an optional directory of JSON files behind it."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float, directory: Optional[str] = None):
+        self.memory = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.directory = Path(directory) if directory else None
+        self.disk_hits = 0
+        self.disk_writes = 0
+
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        response = self.memory.get(key)
+        if response is not None or not self.directory:
+            return response
+
+        try:
+            entry = json.loads(self._path(key).read_text())
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry["created"] > self.ttl_seconds:
+            self._path(key).unlink(missing_ok=True)
+            return None
+
+        self.disk_hits += 1
+        self.memory.set(key, entry["response"])
+        return entry["response"]
+
+    def set(self, key: str, response: str) -> None:
+        self.memory.set(key, response)
+
+        if not self.directory:
+            return
+
+        try:
+            # Write then rename so readers never see a half-written file
+            temp_path = self._path(key).with_suffix(".tmp")
+            temp_path.write_text(json.dumps({"created": time.time(), "response": response}))
+            os.replace(temp_path, self._path(key))
+            self.disk_writes += 1
+        except OSError:
+            logger.exception("Could not persist agenda cache entry")
+            return
+
+        if self.disk_writes % PRUNE_EVERY == 0:
+            self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        """Delete the oldest files beyond max_entries."""
+        files = sorted(self.directory.glob("*.json"), key=lambda path: path.stat().st_mtime)
+        for path in files[:max(len(files) - self.max_entries, 0)]:
+            path.unlink(missing_ok=True)
+
+    def stats(self) -> dict:
+        stats = self.memory.stats()
+        stats.update({
+            "disk_enabled": self.directory is not None,
+            "disk_hits": self.disk_hits,
+            "disk_writes": self.disk_writes,
+        })
+        return stats
+
+
+agenda_cache = AgendaCache(MAX_ENTRIES, TTL_SECONDS, CACHE_DIR)
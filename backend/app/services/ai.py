@@ -1,51 +1,170 @@
 import os
-from openai import OpenAI
+from typing import AsyncIterator, Awaitable, Callable, NamedTuple, Optional
+from openai import AsyncOpenAI
 from dotenv import load_dotenv
 
+from .agenda_cache import agenda_cache, cache_key
+from .history import compact_history, history_metrics
+from .resilience import RETRYABLE_ERRORS, TIMEOUT_SECONDS, call_llm, llm_breaker, llm_gate
+
 load_dotenv()
 
 # Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Async so a completion never blocks the event loop. Set OPENAI_BASE_URL to
+# point it at a local fake/compatible server for testing. Timeouts and
+# retries are handled by services/resilience.py, not the SDK.
+client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), timeout=TIMEOUT_SECONDS, max_retries=0)
+
+# System prompt that defines the AI's behavior
+SYSTEM_PROMPT = """You help organize meeting topics into a clear agenda.
+
+    Take the user's topics and arrange them in a logical order for the meeting."""
+
+MODEL = "gpt-4o-mini"  # Fast and cost-effective
 
 
-def optimize_agenda(user_message: str, conversation_history: list = None) -> str:
+def build_messages(user_message: str, conversation_history: list = None) -> list:
+    """
+    Build the messages array sent to OpenAI: system prompt, history, new message.
+
+    Long histories are trimmed to AGENDA_HISTORY_TOKEN_BUDGET (oldest turns
+    first) and the decision is recorded in the agenda metrics.
+    """
+    messages, report = compact_history(
+        {"role": "system", "content": SYSTEM_PROMPT},
+        conversation_history or [],
+        {"role": "user", "content": user_message},
+    )
+    history_metrics.record(report)
+
+    return messages
+
+
+class AgendaResult(NamedTuple):
+    """An agenda (or a piece of one) and whether it came from the response cache."""
+    response: str
+    cached: bool = False
+
+
+async def optimize_agenda(user_message: str, conversation_history: list = None) -> AgendaResult:
     """
     Uses OpenAI to organize meeting topics into a structured agenda.
 
+    Identical requests (ignoring case and whitespace) are answered from
+    the agenda cache without calling OpenAI.
+
+    Raises LLMUnavailableError when OpenAI is overloaded / down (the caller
+    should answer 503) and LLMError when it rejects the request.
+
     Args:
         user_message: The user's input (list of topics)
         conversation_history: Previous messages in the conversation
 
     Returns:
-        AI-generated organized agenda
+        AI-generated organized agenda, flagged if served from cache
     """
-    # System prompt that defines the AI's behavior
-    system_prompt = """You help organize meeting topics into a clear agenda.
+    messages = build_messages(user_message, conversation_history)
+    key = cache_key(MODEL, messages)
 
-    Take the user's topics and arrange them in a logical order for the meeting."""
+    cached = agenda_cache.get(key)
+    if cached is not None:
+        return AgendaResult(cached, cached=True)
+
+    # Wait for a free slot, then call OpenAI with deadline / retries /
+    # circuit breaker applied. Raises LLMUnavailableError or LLMError.
+    async with llm_gate:
+        response = await call_llm(lambda: client.chat.completions.create(
+            model=MODEL,
+            messages=messages,
+            temperature=0.7,  # Balance creativity and consistency
+            max_tokens=500
+        ))
+
+    agenda = response.choices[0].message.content
+    agenda_cache.set(key, agenda)
+
+    return AgendaResult(agenda)
+
+
+class AgendaStream:
+    """
+    The pieces of a streamed agenda (see open_agenda_stream), plus what
+    they hold on to: a llm_gate slot and the upstream OpenAI response.
+
+    Iterate it for the pieces; aclose() releases the rest and is safe to
+    call more than once. It must be called however the stream ends -
+    including when nobody ever iterates it, e.g. the client disconnected
+    before the response body started - or the gate slot leaks.
+    """
 
-    # Build messages array
-    messages = [{"role": "system", "content": system_prompt}]
+    def __init__(self, pieces: AsyncIterator[AgendaResult], close: Optional[Callable[[], Awaitable[None]]] = None):
+        self._pieces = pieces
+        self._close = close
 
-    # Add conversation history if provided
-    if conversation_history:
-        messages.extend(conversation_history)
+    def __aiter__(self) -> AsyncIterator[AgendaResult]:
+        return self._pieces
 
-    # Add current user message
-    messages.append({"role": "user", "content": user_message})
+    async def aclose(self) -> None:
+        await self._pieces.aclose()
+        close, self._close = self._close, None
+        if close is not None:
+            await close()
 
+
+async def open_agenda_stream(user_message: str, conversation_history: list = None) -> AgendaStream:
+    """
+    Streaming version of optimize_agenda.
+
+    Starts the completion and returns an iterator over the agenda text as
+    OpenAI generates it, so the first words reach the user in milliseconds
+    instead of after the whole completion.
+
+    The stream is opened before returning, so "busy" / "unavailable" are
+    raised here (LLMUnavailableError) while a proper error status can still
+    be sent. Errors after that are raised from the iterator. The caller
+    must aclose() the returned AgendaStream when it is done with it.
+
+    A cached agenda is yielded as a single piece with cached=True. The full
+    text is added to the agenda cache once the stream completes.
+    """
+    messages = build_messages(user_message, conversation_history)
+    key = cache_key(MODEL, messages)
+
+    cached = agenda_cache.get(key)
+    if cached is not None:
+        async def cached_pieces():
+            yield AgendaResult(cached, cached=True)
+        return AgendaStream(cached_pieces())
+
+    # The slot is held until the AgendaStream is closed
+    await llm_gate.acquire()
     try:
-        # Call OpenAI API
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",  # Fast and cost-effective
+        stream = await call_llm(lambda: client.chat.completions.create(
+            model=MODEL,
             messages=messages,
-            temperature=0.7,  # Balance creativity and consistency
-            max_tokens=500
-        )
+            temperature=0.7,
+            max_tokens=500,
+            stream=True
+        ))
+    except BaseException:
+        llm_gate.release()
+        raise
+
+    async def pieces():
+        text = []
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    text.append(chunk.choices[0].delta.content)
+                    yield AgendaResult(chunk.choices[0].delta.content)
+        except RETRYABLE_ERRORS:
+            llm_breaker.record_failure()
+            raise
 
-        return response.choices[0].message.content
+        agenda_cache.set(key, "".join(text))
 
-    except Exception as e:
-        # Return error message if OpenAI call fails
-        return f"Sorry, I encountered an error: {str(e)}. Please make sure your OpenAI API key is set correctly."
+    async def close():
+        llm_gate.release()
+        await stream.close()
 
+    return AgendaStream(pieces(), close)
@@ -0,0 +1,207 @@
+"""
+Push notifications for event changes (GET /events/stream).
+
+The event write handlers publish a small message after every commit:
+
+    {"op": "upsert" | "delete", "ids": [...], "count": n}
+
+(ids is left empty when a bulk write touched more than STREAM_MAX_IDS
+events). Clients treat it as a nudge to call GET /events/changes rather
+than as the data itself, so a missed or merged message costs nothing.
+
+Two brokers, picked with the EVENT_BROKER env var:
+
+- memory (default): fan-out inside this process. Only subscribers
+  connected to the worker that handled the write hear about it, so use it
+  with a single worker.
+- postgres: messages go through Postgres NOTIFY and every worker LISTENs,
+  so all subscribers hear about every write. Holds one pooled connection
+  per worker for the listener.
+
+Each subscriber has a bounded queue (EVENT_STREAM_QUEUE_SIZE). A client
+that doesn't keep up is not allowed to build an unbounded backlog: when
+its queue is full it is dropped and told to resync.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import List, Optional, Set
+
+from sqlalchemy import func, select
+
+logger = logging.getLogger(__name__)
+
+QUEUE_SIZE = int(os.getenv("EVENT_STREAM_QUEUE_SIZE", "100"))
+MAX_SUBSCRIBERS = int(os.getenv("EVENT_STREAM_MAX_SUBSCRIBERS", "1000"))
+STREAM_MAX_IDS = 100
+
+NOTIFY_CHANNEL = "event_changes"
+LISTEN_CHECK_SECONDS = 5.0
+
+
+def sse_event(data: dict, event: str = None) -> str:
+    """Format one Server-Sent Event frame."""
+    frame = f"event: {event}\n" if event else ""
+    return frame + f"data: {json.dumps(data)}\n\n"
+
+
+class Subscription:
+    """One connected stream: a bounded queue of messages for it."""
+
+    def __init__(self, max_queue: int):
+        self.queue: "asyncio.Queue[dict]" = asyncio.Queue(maxsize=max_queue)
+        self.overflowed = False
+
+
+class EventBroker:
+    """In-process fan-out to every subscriber of this worker."""
+
+    name = "memory"
+
+    def __init__(self, max_queue: int = QUEUE_SIZE, max_subscribers: int = MAX_SUBSCRIBERS):
+        self.max_queue = max_queue
+        self.max_subscribers = max_subscribers
+        self._subscribers: Set[Subscription] = set()
+        self.published = 0
+        self.delivered = 0
+        self.dropped_subscribers = 0
+
+    def subscribe(self) -> Optional[Subscription]:
+        """Register a new subscriber, or None if we're at max_subscribers."""
+        if len(self._subscribers) >= self.max_subscribers:
+            return None
+        subscription = Subscription(self.max_queue)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+
+    def deliver(self, message: dict) -> None:
+        """Queue a message for every local subscriber, dropping the ones that are full."""
+        for subscription in list(self._subscribers):
+            try:
+                subscription.queue.put_nowait(message)
+                self.delivered += 1
+            except asyncio.QueueFull:
+                subscription.overflowed = True
+                self._subscribers.discard(subscription)
+                self.dropped_subscribers += 1
+
+    async def publish(self, message: dict) -> None:
+        self.published += 1
+        self.deliver(message)
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def stats(self) -> dict:
+        return {
+            "broker": self.name,
+            "subscribers": len(self._subscribers),
+            "max_subscribers": self.max_subscribers,
+            "queue_size": self.max_queue,
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped_subscribers": self.dropped_subscribers,
+        }
+
+
+class PostgresEventBroker(EventBroker):
+    """
+    Fan-out across workers with Postgres LISTEN / NOTIFY.
+
+    publish() only sends the NOTIFY; local subscribers get the message
+    when this worker's listener receives it back, like every other worker.
+    """
+
+    name = "postgres"
+
+    def __init__(self, engine, **kwargs):
+        super().__init__(**kwargs)
+        self.engine = engine
+        self._listener: Optional[asyncio.Task] = None
+
+    async def publish(self, message: dict) -> None:
+        self.published += 1
+        async with self.engine.connect() as connection:
+            await connection.execute(select(func.pg_notify(NOTIFY_CHANNEL, json.dumps(message))))
+            await connection.commit()
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        self.deliver(json.loads(payload))
+
+    async def _listen_forever(self) -> None:
+        reconnecting = False
+        while True:
+            try:
+                async with self.engine.connect() as connection:
+                    driver_connection = (await connection.get_raw_connection()).driver_connection
+                    await driver_connection.add_listener(NOTIFY_CHANNEL, self._on_notify)
+                    try:
+                        if reconnecting:
+                            # Notifications sent while we were away are lost
+                            self.deliver({"op": "resync", "ids": [], "count": 0})
+                        while not driver_connection.is_closed():
+                            await asyncio.sleep(LISTEN_CHECK_SECONDS)
+                    finally:
+                        if not driver_connection.is_closed():
+                            await driver_connection.remove_listener(NOTIFY_CHANNEL, self._on_notify)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Event change listener failed, reconnecting")
+            reconnecting = True
+            await asyncio.sleep(LISTEN_CHECK_SECONDS)
+
+    async def start(self) -> None:
+        self._listener = asyncio.create_task(self._listen_forever())
+
+    async def stop(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+
+
+def change_message(op: str, ids: List) -> dict:
+    """The message published for a write that touched these event ids."""
+    return {
+        "op": op,
+        "ids": [str(event_id) for event_id in ids] if len(ids) <= STREAM_MAX_IDS else [],
+        "count": len(ids),
+    }
+
+
+def create_event_broker():
+    """Build the broker selected by EVENT_BROKER ("memory" or "postgres")."""
+    backend = os.getenv("EVENT_BROKER", "memory").lower()
+
+    if backend == "postgres":
+        from ..database.db import engine
+        return PostgresEventBroker(engine)
+    if backend == "memory":
+        return EventBroker()
+
+    raise ValueError(f"Unknown EVENT_BROKER {backend!r}, expected 'memory' or 'postgres'")
+
+
+event_broker = create_event_broker()
+
+
+async def publish_event_change(op: str, ids: List) -> None:
+    """
+    Tell stream subscribers that events changed. Call after committing.
+
+    Never raises: the write already succeeded, and clients also catch up
+    through GET /events/changes.
+    """
+    if not ids:
+        return
+    try:
+        await event_broker.publish(change_message(op, ids))
+    except Exception:
+        logger.exception("Publishing event change failed")
@@ -0,0 +1,57 @@
+"""
+Event change log retention.
+
+The event_changes table (see EventChange) grows with every write, so a
+background task started in main.py deletes entries older than
+CHANGE_LOG_RETENTION_DAYS. Clients holding a token older than that get
+410 from GET /events/changes and reload the full list instead.
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select
+
+from ..database.db import SessionLocal
+from ..database.models import EventChange
+
+logger = logging.getLogger(__name__)
+
+RETENTION = timedelta(days=float(os.getenv("CHANGE_LOG_RETENTION_DAYS", "30")))
+PRUNE_INTERVAL_SECONDS = float(os.getenv("CHANGE_LOG_PRUNE_INTERVAL_SECONDS", "3600"))
+
+
+async def prune_change_log() -> int:
+    """
+    Delete change log entries older than RETENTION, returns how many.
+
+    The newest entry is always kept so the current token stays valid even
+    after a long period without writes.
+    """
+    newest = select(func.max(EventChange.seq)).scalar_subquery()
+    async with SessionLocal() as db:
+        result = await db.execute(delete(EventChange).where(
+            EventChange.changed_at < datetime.now(timezone.utc) - RETENTION,
+            EventChange.seq < newest,
+        ))
+        await db.commit()
+    return result.rowcount
+
+
+async def prune_change_log_forever():
+    """
+    Background task: prune the change log every PRUNE_INTERVAL_SECONDS.
+
+    Started from the app lifespan and cancelled on shutdown.
+    """
+    while True:
+        await asyncio.sleep(PRUNE_INTERVAL_SECONDS)
+        try:
+            removed = await prune_change_log()
+            if removed:
+                logger.info("Pruned %d event change log entries", removed)
+        except Exception:
+            # A failed prune (e.g. database blip) shouldn't kill the task
+            logger.exception("Event change log prune failed")
@@ -0,0 +1,102 @@
+"""
+Longest stored event, the lower bound of window queries.
+
+crud.filter_events matches one-off events in a window [start, end) with
+start_time >= start - longest_event.bound: nothing that started earlier
+can still be running at start, and the two-sided range lines up with the
+start_time indexes. For that to be correct the bound has to cover every
+stored event, so it is
+
+- measured from the events table on startup,
+- raised by this worker's event writes as they commit, and
+- re-checked every DURATION_REFRESH_SECONDS against the rows any worker
+  changed since the last check (a range scan on ix_events_updated_at).
+
+It never shrinks while the app runs: a deleted long event only leaves the
+range a little wider than it needs to be. MIN_EVENT_LOOKBACK_DAYS is a
+floor, so events up to that long are found by every worker straight away
+and the periodic check only matters for longer ones written elsewhere.
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import func, select
+
+from ..database.db import SessionLocal
+from ..database.models import Event
+from .recurrence import as_utc
+
+logger = logging.getLogger(__name__)
+
+MIN_EVENT_LOOKBACK = timedelta(days=float(os.getenv("MIN_EVENT_LOOKBACK_DAYS", "14")))
+DURATION_REFRESH_SECONDS = float(os.getenv("DURATION_REFRESH_SECONDS", "60"))
+
+
+class LongestEvent:
+    """The longest event duration this worker knows of."""
+
+    def __init__(self, floor: timedelta = MIN_EVENT_LOOKBACK):
+        self.floor = floor
+        self.longest = timedelta(0)
+        self.checked_at: Optional[datetime] = None  # last refresh, None = never
+
+    @property
+    def bound(self) -> timedelta:
+        """How far before a window to look for events still running in it."""
+        return max(self.floor, self.longest)
+
+    def observe(self, start_time: datetime, end_time: datetime) -> None:
+        """Account for an event this worker is about to write."""
+        self.longest = max(self.longest, as_utc(end_time) - as_utc(start_time))
+
+    async def refresh(self, db) -> None:
+        """
+        Raise the bound to the longest event changed since the last refresh
+        (all of them on the first call). Series count by their first
+        occurrence; they only widen the range a little.
+        """
+        if db.bind.dialect.name == "postgresql":
+            duration = func.max(Event.end_time - Event.start_time)
+        else:
+            duration = func.max(func.julianday(Event.end_time) - func.julianday(Event.start_time))
+        query = select(duration)
+
+        checked_at = datetime.now(timezone.utc)
+        if self.checked_at is not None:
+            # Overlap the previous check so rows stamped by a worker whose
+            # clock runs a little behind aren't missed
+            query = query.where(Event.updated_at >= self.checked_at - timedelta(seconds=DURATION_REFRESH_SECONDS))
+
+        longest = await db.scalar(query)
+        if isinstance(longest, (int, float)):
+            longest = timedelta(days=longest)  # julianday difference
+        if longest is not None and longest > self.longest:
+            if longest > self.bound:
+                logger.info("Longest event is now %s, window queries look back that far", longest)
+            self.longest = longest
+        self.checked_at = checked_at
+
+
+longest_event = LongestEvent()
+
+
+async def refresh_longest_event_forever():
+    """
+    Background task: pick up long events written by other workers every
+    DURATION_REFRESH_SECONDS.
+
+    Started from the app lifespan (after the first refresh) and cancelled
+    on shutdown.
+    """
+    while True:
+        await asyncio.sleep(DURATION_REFRESH_SECONDS)
+        try:
+            async with SessionLocal() as db:
+                await longest_event.refresh(db)
+        except Exception:
+            # A failed check (e.g. database blip) shouldn't kill the task
+            logger.exception("Longest event refresh failed")
@@ -0,0 +1,140 @@
+"""
+Cache of serialized GET /events responses.
+
+Listings are cached as ready-to-send JSON bytes keyed by the normalized
+query parameters. Writes invalidate precisely: an event only touches the
+cached listings whose organization / type / window filters it could
+appear in (before or after the change), everything else stays warm.
+
+GET /events/facets aggregates are small and span every organization, so
+they are simply dropped on any write. Rendered .ics calendar feeds are
+cached per (normalized) organization and dropped when one of that
+organization's events changes.
+"""
+
+import os
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional
+
+from .cache import TTLCache
+
+
+class ListingKey(NamedTuple):
+    """Normalized query parameters of a cached listing."""
+    endpoint: str  # "events" or "events-page"
+    organization: Optional[str]
+    type: Optional[str]
+    start: Optional[datetime]
+    end: Optional[datetime]
+    position: object  # skip for /events, cursor for /events/page
+    limit: int
+
+
+class EventScope(NamedTuple):
+    """The fields of an event that decide which listings it appears in."""
+    organization: str
+    type: str
+    start_time: datetime
+    end_time: Optional[datetime]  # for a recurring event, end of the last occurrence (None = forever)
+
+
+event_list_cache = TTLCache(
+    max_entries=int(os.getenv("EVENT_CACHE_MAX_ENTRIES", "256")),
+    ttl_seconds=float(os.getenv("EVENT_CACHE_TTL_SECONDS", "30")),
+)
+
+
+# Calendar apps poll feeds constantly; a feed stays until a write touches it
+calendar_feed_cache = TTLCache(
+    max_entries=int(os.getenv("CALENDAR_FEED_CACHE_MAX_ENTRIES", "256")),
+    ttl_seconds=float(os.getenv("CALENDAR_FEED_CACHE_TTL_SECONDS", "300")),
+)
+
+# Key of the all-organizations feed in calendar_feed_cache
+ALL_ORGANIZATIONS = "*"
+
+event_facet_cache = TTLCache(
+    max_entries=int(os.getenv("EVENT_FACET_CACHE_MAX_ENTRIES", "128")),
+    ttl_seconds=float(os.getenv("EVENT_CACHE_TTL_SECONDS", "30")),
+)
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Treat naive datetimes as UTC so they compare with aware ones."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def normalize_organization(name: str) -> str:
+    """
+    Organization name without whitespace, uppercased, like the calendar's
+    organization filter. Must match crud.normalized_organization (SQL).
+    """
+    return name.replace(" ", "").replace("\t", "").replace("\n", "").upper()
+
+
+def listing_key(endpoint, organization, type, start, end, position, limit) -> ListingKey:
+    """Build a cache key, normalizing empty filters and timezones."""
+    return ListingKey(
+        endpoint=endpoint,
+        organization=organization or None,
+        type=type or None,
+        start=_as_utc(start),
+        end=_as_utc(end),
+        position=position,
+        limit=limit,
+    )
+
+
+def event_scope(event) -> EventScope:
+    """
+    Snapshot an event's listing-relevant fields.
+
+    Take this before mutating an event so the listings it used to be in
+    can be invalidated along with the ones it moves into. A recurring
+    event spans its whole series, not just the first occurrence.
+    """
+    end_time = event.end_time
+    if getattr(event, "recurrence_rule", None):
+        end_time = event.recurrence_end
+    return EventScope(event.organization, event.type, event.start_time, end_time)
+
+
+def _listing_includes(key: ListingKey, event) -> bool:
+    """Could this event appear in the listing cached under key?"""
+    if key.organization is not None and key.organization != event.organization:
+        return False
+    if key.type is not None and key.type != event.type:
+        return False
+    if key.end is not None and _as_utc(event.start_time) >= key.end:
+        return False
+    if key.start is not None and event.end_time is not None and _as_utc(event.end_time) <= key.start:
+        return False
+    return True
+
+
+def invalidate_events(*events) -> int:
+    """
+    Drop every cached listing one of these events could appear in.
+
+    Pass the event as it was before a change and as it is after, e.g.
+    invalidate_events(old, new) for an update. Each argument is an Event,
+    an EventScope, or anything with the attributes event_scope reads.
+    """
+    events = [event if isinstance(event, EventScope) else event_scope(event) for event in events]
+    event_facet_cache.clear()
+
+    feeds = {ALL_ORGANIZATIONS} | {normalize_organization(event.organization) for event in events}
+    calendar_feed_cache.invalidate_where(lambda key: key in feeds)
+
+    return event_list_cache.invalidate_where(
+        lambda key: any(_listing_includes(key, event) for event in events)
+    )
+
+
+def clear_event_caches() -> None:
+    """Drop every cached listing, facet and feed, for writes whose scope isn't known."""
+    event_list_cache.clear()
+    event_facet_cache.clear()
+    calendar_feed_cache.clear()
@@ -0,0 +1,135 @@
+"""
+Conversation history compaction for the agenda optimizer.
+
+The agenda chat resends its whole history every turn. To keep long chats
+from getting slower and pricier each turn (and eventually overflowing the
+model's context), the history is trimmed to a token budget before it is
+sent: the system prompt and the new message always go, then as many of
+the most recent turns as fit. Older turns are replaced by a short note so
+the model knows earlier context was left out.
+
+Tokens are counted locally with tiktoken. If its encoding can't be loaded
+(e.g. first start on a host without network access), they are estimated
+at ~4 characters per token instead (close enough for budgeting).
+"""
+
+import os
+import threading
+from typing import List, NamedTuple, Tuple
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("o200k_base")  # gpt-4o family
+except Exception:  # e.g. the encoding can't be downloaded offline
+    _encoding = None
+
+# Max prompt tokens (system prompt + history + new message) per request
+HISTORY_TOKEN_BUDGET = int(os.getenv("AGENDA_HISTORY_TOKEN_BUDGET", "3000"))
+
+# Role/formatting overhead OpenAI adds around each chat message
+TOKENS_PER_MESSAGE = 4
+
+
+def count_tokens(text: str) -> int:
+    """Number of tokens in text (estimated if the encoding isn't available)."""
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return len(text) // 4 + 1
+
+
+def message_tokens(message: dict) -> int:
+    return count_tokens(message["content"]) + TOKENS_PER_MESSAGE
+
+
+class CompactionReport(NamedTuple):
+    """What compact_history decided for one request."""
+    tokens_before: int
+    tokens_after: int
+    turns_kept: int
+    turns_dropped: int
+
+    @property
+    def trimmed(self) -> bool:
+        return self.turns_dropped > 0
+
+
+def compact_history(
+    system_message: dict,
+    history: List[dict],
+    user_message: dict,
+    budget: int = HISTORY_TOKEN_BUDGET,
+) -> Tuple[List[dict], CompactionReport]:
+    """
+    Build the messages list, dropping the oldest turns that don't fit in budget.
+
+    The system prompt and the new user message are always included, even
+    if they alone exceed the budget (request size is capped by the schema).
+    """
+    fixed_tokens = message_tokens(system_message) + message_tokens(user_message)
+    history_tokens = [message_tokens(message) for message in history]
+    tokens_before = fixed_tokens + sum(history_tokens)
+
+    # Walk back from the newest turn, keeping turns while they fit
+    remaining = budget - fixed_tokens
+    kept = 0
+    for tokens in reversed(history_tokens):
+        if tokens > remaining:
+            break
+        remaining -= tokens
+        kept += 1
+
+    dropped = len(history) - kept
+    recent = history[dropped:]
+
+    messages = [system_message]
+    if dropped:
+        messages.append({
+            "role": "system",
+            "content": f"({dropped} earlier messages in this conversation were omitted to save space.)",
+        })
+    messages.extend(recent)
+    messages.append(user_message)
+
+    tokens_after = sum(message_tokens(message) for message in messages)
+    return messages, CompactionReport(tokens_before, tokens_after, kept, dropped)
+
+
+class HistoryMetrics:
+    """Running totals of prompt sizes and trimming decisions (per worker)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.trimmed_requests = 0
+        self.turns_dropped = 0
+        self.tokens_before_total = 0
+        self.tokens_sent_total = 0
+        self.tokens_sent_max = 0
+        self.last = None
+
+    def record(self, report: CompactionReport) -> None:
+        with self._lock:
+            self.requests += 1
+            self.trimmed_requests += report.trimmed
+            self.turns_dropped += report.turns_dropped
+            self.tokens_before_total += report.tokens_before
+            self.tokens_sent_total += report.tokens_after
+            self.tokens_sent_max = max(self.tokens_sent_max, report.tokens_after)
+            self.last = report._asdict()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "token_budget": HISTORY_TOKEN_BUDGET,
+                "token_counter": "tiktoken" if _encoding is not None else "estimate",
+                "requests": self.requests,
+                "trimmed_requests": self.trimmed_requests,
+                "turns_dropped": self.turns_dropped,
+                "prompt_tokens_before_total": self.tokens_before_total,
+                "prompt_tokens_sent_total": self.tokens_sent_total,
+                "prompt_tokens_sent_max": self.tokens_sent_max,
+                "last_request": self.last,
+            }
+
+
+history_metrics = HistoryMetrics()
@@ -0,0 +1,85 @@
+"""
+HTTP caching helpers (ETag / conditional GET).
+
+Routers compute an ETag from a cheap version check, and if the client
+already has that version (If-None-Match) we answer 304 Not Modified
+without running the real query or serializing anything.
+"""
+
+import hashlib
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Response, status
+
+# Clients may keep a copy but must revalidate it on every use, which with
+# ETags is a cheap 304 when nothing changed.
+CACHE_CONTROL = "no-cache"
+
+
+def make_etag(*parts) -> str:
+    """
+    Build a strong ETag from anything that determines the response body.
+
+    For example a collection version plus the query parameters - if none
+    of them change, the response bytes can't change either.
+    """
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against our current ETag.
+
+    Handles "*", comma-separated lists and weak (W/) validators, which
+    If-None-Match compares with the weak comparison function.
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates
+
+
+def modified_since_matches(if_modified_since: Optional[str], last_modified: datetime) -> bool:
+    """
+    Check an If-Modified-Since header: True if the client's copy is current.
+
+    Only consult it when the request has no If-None-Match (the ETag wins).
+    Unparseable dates count as no header.
+    """
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    # HTTP dates have whole-second precision
+    return last_modified.replace(microsecond=0) <= since
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime] = None) -> dict:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    return headers
+
+
+def set_cache_headers(response: Response, etag: str, last_modified: Optional[datetime] = None) -> None:
+    """Attach the validator headers to a normal 200 response."""
+    response.headers.update(validator_headers(etag, last_modified))
+
+
+def not_modified(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    """304 response telling the client its cached copy is still current."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=validator_headers(etag, last_modified),
+    )
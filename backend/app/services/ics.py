@@ -0,0 +1,226 @@
+"""
+iCalendar (RFC 5545) rendering for the subscription feeds in routers/calendar.py.
+
+Feeds are assembled from per-event VEVENT blocks. Each block is cached by
+(event id, updated_at), so when one event changes only its block is
+rendered again and the rest of the feed is reused as-is.
+
+Recurring events use EVENT_TIMEZONE local times (TZID), so every feed
+carries a VTIMEZONE describing that zone's daylight saving rules.
+"""
+
+import os
+from calendar import monthrange
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+from .cache import TTLCache
+from .recurrence import EVENT_TIMEZONE, as_utc, parse_rrule
+
+PRODID = "-//University of Oregon Multicultural Center//MCC Event Hub//EN"
+UID_DOMAIN = "mcc-event-hub"
+
+WEEKDAY_NAMES = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+vevent_cache = TTLCache(
+    max_entries=int(os.getenv("CALENDAR_EVENT_CACHE_MAX_ENTRIES", "20000")),
+    ttl_seconds=float(os.getenv("CALENDAR_EVENT_CACHE_TTL_SECONDS", "86400")),
+)
+
+
+def escape_text(value: str) -> str:
+    """Escape a TEXT property value."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str) -> str:
+    """Fold a content line to at most 75 octets per line, as RFC 5545 requires."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Don't split a multi-byte UTF-8 character
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+        limit = 74  # continuation lines start with a space
+    return "\r\n ".join(parts)
+
+
+def utc_stamp(value: datetime) -> str:
+    return as_utc(value).strftime("%Y%m%dT%H%M%SZ")
+
+
+def local_stamp(value: datetime) -> str:
+    return as_utc(value).astimezone(EVENT_TIMEZONE).strftime("%Y%m%dT%H%M%S")
+
+
+def format_offset(offset: timedelta) -> str:
+    """A UTC offset as a UTC-OFFSET value, e.g. -0800."""
+    seconds = int(offset.total_seconds())
+    hours, rest = divmod(abs(seconds), 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{'-' if offset < timedelta(0) else '+'}{hours:02d}{minutes:02d}" + (f"{seconds:02d}" if seconds else "")
+
+
+def offset_changes(year: int) -> List[Tuple[datetime, timedelta, timedelta]]:
+    """(UTC instant, offset before, offset after) for each EVENT_TIMEZONE offset change in year."""
+    changes = []
+    instant = datetime(year, 1, 1, tzinfo=timezone.utc)
+    offset = instant.astimezone(EVENT_TIMEZONE).utcoffset()
+    # Offsets change on a quarter hour everywhere, so this hits the exact instant
+    while instant.year == year:
+        instant += timedelta(minutes=15)
+        new_offset = instant.astimezone(EVENT_TIMEZONE).utcoffset()
+        if new_offset != offset:
+            changes.append((instant, offset, new_offset))
+            offset = new_offset
+    return changes
+
+
+def nth_weekday(year: int, month: int, week: int, weekday: int) -> date:
+    """The week-th (-1: last) weekday of a month, as in RRULE BYDAY=2SU / -1SU."""
+    if week > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (week - 1))
+    last = date(year, month, monthrange(year, month)[1])
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+@lru_cache(maxsize=2)  # this year's, and last year's around New Year
+def render_vtimezone(year: int) -> str:
+    """
+    VTIMEZONE for EVENT_TIMEZONE, which RFC 5545 requires for every TZID a
+    calendar uses.
+
+    Each offset change of the given year becomes a yearly rule ("second
+    Sunday of March"), which is how zones with daylight saving define it,
+    so a change to the zone's rules shows up in the next year's feeds.
+    A zone without changes gets a single STANDARD component.
+    """
+    lines = ["BEGIN:VTIMEZONE", f"TZID:{EVENT_TIMEZONE.key}"]
+
+    changes = offset_changes(year)
+    if not changes:
+        now = datetime(year, 1, 1, tzinfo=EVENT_TIMEZONE)
+        offset = format_offset(now.utcoffset())
+        lines += [
+            "BEGIN:STANDARD",
+            "DTSTART:19700101T000000",
+            f"TZOFFSETFROM:{offset}",
+            f"TZOFFSETTO:{offset}",
+            f"TZNAME:{now.tzname()}",
+            "END:STANDARD",
+        ]
+
+    for instant, before, after in changes:
+        # DTSTART is the moment of change in the local time in effect before it
+        wall = (instant + before).replace(tzinfo=None)
+        week = -1 if wall.day + 7 > monthrange(wall.year, wall.month)[1] else (wall.day - 1) // 7 + 1
+        first = datetime.combine(nth_weekday(1970, wall.month, week, wall.weekday()), wall.time())
+        component = "DAYLIGHT" if instant.astimezone(EVENT_TIMEZONE).dst() else "STANDARD"
+        lines += [
+            f"BEGIN:{component}",
+            f"DTSTART:{first.strftime('%Y%m%dT%H%M%S')}",
+            f"RRULE:FREQ=YEARLY;BYMONTH={wall.month};BYDAY={week}{WEEKDAY_NAMES[wall.weekday()]}",
+            f"TZOFFSETFROM:{format_offset(before)}",
+            f"TZOFFSETTO:{format_offset(after)}",
+            f"TZNAME:{instant.astimezone(EVENT_TIMEZONE).tzname()}",
+            f"END:{component}",
+        ]
+
+    lines.append("END:VTIMEZONE")
+    return "".join(fold_line(line) + "\r\n" for line in lines)
+
+
+def ical_rrule(rule: str) -> str:
+    """
+    Our stored rule as an RFC 5545 RRULE value.
+
+    UNTIL is always written as a UTC date-time (a date-only UNTIL is not
+    allowed with a date-time DTSTART).
+    """
+    parsed = parse_rrule(rule)
+    parts = [f"FREQ={parsed.freq}"]
+    if parsed.interval != 1:
+        parts.append(f"INTERVAL={parsed.interval}")
+    if parsed.byday:
+        parts.append("BYDAY=" + ",".join(WEEKDAY_NAMES[day] for day in parsed.byday))
+    if parsed.count is not None:
+        parts.append(f"COUNT={parsed.count}")
+    if parsed.until is not None:
+        parts.append(f"UNTIL={utc_stamp(parsed.until)}")
+    return ";".join(parts)
+
+
+def render_vevent(event) -> str:
+    """
+    One VEVENT block (CRLF-terminated lines) for an event.
+
+    Recurring events are written in EVENT_TIMEZONE local time (TZID) so
+    calendar apps expand them with the same wall-clock time we do, across
+    daylight saving changes.
+    """
+    key = (event.id, event.updated_at)
+    cached = vevent_cache.get(key)
+    if cached is not None:
+        return cached
+
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{event.id}@{UID_DOMAIN}",
+        f"DTSTAMP:{utc_stamp(event.updated_at or event.created_at)}",
+        f"LAST-MODIFIED:{utc_stamp(event.updated_at or event.created_at)}",
+    ]
+
+    if event.recurrence_rule:
+        tzid = EVENT_TIMEZONE.key
+        lines.append(f"DTSTART;TZID={tzid}:{local_stamp(event.start_time)}")
+        lines.append(f"DTEND;TZID={tzid}:{local_stamp(event.end_time)}")
+        lines.append(f"RRULE:{ical_rrule(event.recurrence_rule)}")
+        for exdate in event.recurrence_exdates or []:
+            lines.append(f"EXDATE;TZID={tzid}:{local_stamp(datetime.fromisoformat(exdate))}")
+    else:
+        lines.append(f"DTSTART:{utc_stamp(event.start_time)}")
+        lines.append(f"DTEND:{utc_stamp(event.end_time)}")
+
+    lines.append(f"SUMMARY:{escape_text(event.title)}")
+    if event.description:
+        lines.append(f"DESCRIPTION:{escape_text(event.description)}")
+    lines.append(f"CATEGORIES:{escape_text(event.organization)}")
+    lines.append("END:VEVENT")
+
+    block = "".join(fold_line(line) + "\r\n" for line in lines)
+    vevent_cache.set(key, block)
+    return block
+
+
+def render_calendar(name: str, events: Iterable) -> str:
+    """A complete VCALENDAR with one VEVENT per event (possibly none)."""
+    header = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(name)}",
+        f"X-WR-TIMEZONE:{EVENT_TIMEZONE.key}",
+        "REFRESH-INTERVAL;VALUE=DURATION:PT1H",
+        "X-PUBLISHED-TTL:PT1H",
+    ]
+    body = "".join(fold_line(line) + "\r\n" for line in header)
+    body += render_vtimezone(datetime.now(timezone.utc).year)
+    body += "".join(render_vevent(event) for event in events)
+    return body + "END:VCALENDAR\r\n"
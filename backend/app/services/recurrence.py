@@ -0,0 +1,247 @@
+"""
+Recurring events.
+
+A recurring event is stored once, as a series: its start_time / end_time
+are the first occurrence and recurrence_rule says how it repeats. The
+individual occurrences are never stored - they are generated on the fly,
+and only for the time window being displayed.
+
+Supported rule syntax is the subset of RFC 5545 RRULE we need for office
+hours and weekly meetings:
+
+    FREQ=DAILY|WEEKLY     required
+    INTERVAL=n            every n days / weeks (default 1)
+    BYDAY=MO,WE,FR        weekly only: which weekdays (default: the first
+                          occurrence's weekday)
+    COUNT=n               stop after n occurrences, or
+    UNTIL=20260612        no occurrence starts after this date / datetime
+          20260612T235959Z
+
+e.g. "FREQ=WEEKLY;BYDAY=TU,TH;UNTIL=20260612" for twice-weekly office
+hours through the end of spring term. Individual occurrences can be
+cancelled by listing their start times in recurrence_exdates.
+
+Occurrences keep their wall-clock time in EVENT_TIMEZONE (the campus
+timezone), so 10am office hours stay at 10am across daylight saving changes.
+"""
+
+import os
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+EVENT_TIMEZONE = ZoneInfo(os.getenv("EVENT_TIMEZONE", "America/Los_Angeles"))
+
+WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+
+# Safety cap when walking a whole finite series (see series_end)
+MAX_SERIES_OCCURRENCES = 10000
+
+
+class RecurrenceRule(NamedTuple):
+    freq: str  # "DAILY" or "WEEKLY"
+    interval: int
+    byday: Tuple[int, ...]  # weekday numbers, Monday = 0 (weekly only)
+    count: Optional[int]
+    until: Optional[datetime]  # UTC, inclusive
+
+
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Aware UTC datetime (naive values, e.g. from SQLite, are taken as UTC)."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _parse_until(value: str) -> datetime:
+    if len(value) == 8:
+        # Date only: the whole day counts, in the campus timezone
+        day = datetime.strptime(value, "%Y%m%d").date()
+        return datetime.combine(day, time.max, tzinfo=EVENT_TIMEZONE).astimezone(timezone.utc)
+    if value.endswith("Z"):
+        return datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+    raise ValueError("UNTIL must be YYYYMMDD or YYYYMMDDTHHMMSSZ")
+
+
+def parse_rrule(rule: str) -> RecurrenceRule:
+    """
+    Parse a recurrence rule string, raising ValueError if it is invalid or
+    uses parts we don't support.
+    """
+    parts = {}
+    for part in rule.strip().removeprefix("RRULE:").split(";"):
+        if not part:
+            continue
+        key, _, value = part.partition("=")
+        if not value:
+            raise ValueError(f"Malformed recurrence rule part {part!r}")
+        parts[key.upper()] = value.upper()
+
+    unsupported = set(parts) - {"FREQ", "INTERVAL", "BYDAY", "COUNT", "UNTIL"}
+    if unsupported:
+        raise ValueError(f"Unsupported recurrence rule parts: {', '.join(sorted(unsupported))}")
+
+    freq = parts.get("FREQ")
+    if freq not in ("DAILY", "WEEKLY"):
+        raise ValueError("FREQ must be DAILY or WEEKLY")
+
+    try:
+        interval = int(parts.get("INTERVAL", "1"))
+        count = int(parts["COUNT"]) if "COUNT" in parts else None
+    except ValueError:
+        raise ValueError("INTERVAL and COUNT must be whole numbers")
+    if interval < 1 or (count is not None and count < 1):
+        raise ValueError("INTERVAL and COUNT must be at least 1")
+
+    if "COUNT" in parts and "UNTIL" in parts:
+        raise ValueError("Use either COUNT or UNTIL, not both")
+
+    until = _parse_until(parts["UNTIL"]) if "UNTIL" in parts else None
+
+    byday = ()
+    if "BYDAY" in parts:
+        if freq != "WEEKLY":
+            raise ValueError("BYDAY is only supported with FREQ=WEEKLY")
+        try:
+            byday = tuple(sorted({WEEKDAYS[day] for day in parts["BYDAY"].split(",")}))
+        except KeyError:
+            raise ValueError("BYDAY must be a list of MO, TU, WE, TH, FR, SA, SU")
+
+    return RecurrenceRule(freq, interval, byday, count, until)
+
+
+def _occurrence_starts(rule: RecurrenceRule, dtstart: datetime, not_before: Optional[datetime] = None) -> Iterator[datetime]:
+    """
+    Yield occurrence start times (UTC) in order, honoring COUNT and UNTIL.
+
+    With not_before, jumps straight to the period containing it instead of
+    walking from the first occurrence: occurrence numbers (for COUNT) are
+    computed arithmetically, so a window years into a series costs the
+    same as the first week.
+    """
+    local_start = as_utc(dtstart).astimezone(EVENT_TIMEZONE)
+    first_day = local_start.date()
+    wall_time = local_start.time()
+
+    def at(day: date) -> datetime:
+        return datetime.combine(day, wall_time, tzinfo=EVENT_TIMEZONE).astimezone(timezone.utc)
+
+    # Days in the first period / later periods, for numbering occurrences
+    if rule.freq == "DAILY":
+        period_days = rule.interval
+        offsets = (0,)
+        period_start = first_day
+    else:
+        period_days = 7 * rule.interval
+        offsets = rule.byday or (first_day.weekday(),)
+        period_start = first_day - timedelta(days=first_day.weekday())  # Monday of the first week
+    first_period_count = sum(1 for offset in offsets if period_start + timedelta(days=offset) >= first_day)
+
+    period = 0
+    if not_before is not None:
+        skip_to = as_utc(not_before).astimezone(EVENT_TIMEZONE).date()
+        period = max((skip_to - period_start).days // period_days - 1, 0)
+
+    while True:
+        day0 = period_start + timedelta(days=period * period_days)
+        number = 0 if period == 0 else first_period_count + (period - 1) * len(offsets)
+
+        for offset in offsets:
+            day = day0 + timedelta(days=offset)
+            if day < first_day:
+                continue
+
+            if rule.count is not None and number >= rule.count:
+                return
+            start = at(day)
+            if rule.until is not None and start > rule.until:
+                return
+
+            number += 1
+            yield start
+
+        period += 1
+
+
+def _exdates(event) -> set:
+    return {as_utc(datetime.fromisoformat(value)) for value in (event.recurrence_exdates or [])}
+
+
+class Occurrence:
+    """
+    One generated occurrence of a recurring event.
+
+    Looks like the Event it came from (same id, title, ...) except for
+    start_time / end_time, plus recurrence_id: the occurrence's original
+    start, as in iCalendar's RECURRENCE-ID.
+    """
+
+    def __init__(self, event, start_time: datetime, end_time: datetime):
+        self._event = event
+        self.start_time = start_time
+        self.end_time = end_time
+        self.recurrence_id = start_time
+
+    def __getattr__(self, name):
+        return getattr(self._event, name)
+
+    def _asdict(self) -> dict:
+        """The occurrence as a dict, when the series was selected as a Row (see Row._asdict)."""
+        return {
+            **self._event._asdict(),
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "recurrence_id": self.recurrence_id,
+        }
+
+
+def expand_occurrences(event, window_start: datetime, window_end: datetime) -> Iterator[Occurrence]:
+    """
+    Yield the occurrences of a recurring event that overlap [window_start, window_end).
+
+    Cancelled occurrences (recurrence_exdates) are skipped.
+    """
+    rule = parse_rrule(event.recurrence_rule)
+    duration = as_utc(event.end_time) - as_utc(event.start_time)
+    window_start, window_end = as_utc(window_start), as_utc(window_end)
+    cancelled = _exdates(event)
+
+    for start in _occurrence_starts(rule, event.start_time, not_before=window_start - duration):
+        if start >= window_end:
+            return
+        if start + duration > window_start and start not in cancelled:
+            yield Occurrence(event, start, start + duration)
+
+
+def series_end(rule: Optional[str], start_time: datetime, end_time: datetime) -> Optional[datetime]:
+    """
+    End of the last occurrence of a series, or None if it repeats forever.
+
+    Stored as Event.recurrence_end so window queries can skip series that
+    finished before the window. Non-recurring events return None.
+    """
+    if not rule:
+        return None
+
+    parsed = parse_rrule(rule)
+    if parsed.count is None and parsed.until is None:
+        return None
+
+    last_start = None
+    for number, start in enumerate(_occurrence_starts(parsed, start_time)):
+        if number >= MAX_SERIES_OCCURRENCES:
+            return None  # treat absurdly long series as open-ended
+        last_start = start
+
+    if last_start is None:
+        return as_utc(end_time)
+    return last_start + (as_utc(end_time) - as_utc(start_time))
+
+
+def exdates_to_json(exdates: Optional[List[datetime]]) -> Optional[List[str]]:
+    """Store cancelled occurrence starts as UTC ISO strings (JSON column)."""
+    if exdates is None:
+        return None
+    return [as_utc(value).isoformat() for value in exdates]
@@ -0,0 +1,255 @@
+"""
+Protection around the LLM backend.
+
+When OpenAI slows down or fails, agenda requests must not pile up until
+every worker is stuck waiting on it. Calls to the model go through:
+
+- a concurrency gate: at most AGENDA_LLM_MAX_CONCURRENCY completions in
+  flight, at most AGENDA_LLM_MAX_QUEUE requests waiting for a slot
+- a per-attempt deadline (AGENDA_LLM_TIMEOUT_SECONDS)
+- retries of transient errors with jittered exponential backoff
+- a circuit breaker that, after AGENDA_BREAKER_FAILURES consecutive
+  failures, rejects calls immediately for AGENDA_BREAKER_RESET_SECONDS
+
+Anything that means "try again later" raises LLMUnavailableError, which
+the agenda router turns into a 503.
+"""
+
+import asyncio
+import os
+import random
+import time
+from typing import Awaitable, Callable, TypeVar
+
+import openai
+
+from .telemetry import timed
+
+T = TypeVar("T")
+
+MAX_CONCURRENCY = int(os.getenv("AGENDA_LLM_MAX_CONCURRENCY", "8"))
+MAX_QUEUE = int(os.getenv("AGENDA_LLM_MAX_QUEUE", "32"))
+QUEUE_TIMEOUT_SECONDS = float(os.getenv("AGENDA_LLM_QUEUE_TIMEOUT_SECONDS", "5"))
+TIMEOUT_SECONDS = float(os.getenv("AGENDA_LLM_TIMEOUT_SECONDS", "20"))
+MAX_RETRIES = int(os.getenv("AGENDA_LLM_MAX_RETRIES", "2"))
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 4.0
+BREAKER_FAILURES = int(os.getenv("AGENDA_BREAKER_FAILURES", "5"))
+BREAKER_RESET_SECONDS = float(os.getenv("AGENDA_BREAKER_RESET_SECONDS", "30"))
+
+# Errors worth retrying: the provider is slow, overloaded or unreachable
+RETRYABLE_ERRORS = (
+    asyncio.TimeoutError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+
+
+class LLMUnavailableError(Exception):
+    """The model can't take this request right now (503, retry later)."""
+
+    def __init__(self, message: str, retry_after: float = 1.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class LLMError(Exception):
+    """The model rejected the request in a way retrying won't fix (502)."""
+
+
+class CircuitBreaker:
+    """
+    Classic closed / open / half-open breaker.
+
+    closed: calls go through, consecutive failures are counted
+    open: calls fail fast until reset_seconds have passed
+    half-open: a single probe call goes through, the rest fail fast until
+               it is resolved; success closes the breaker, failure opens
+               it for another reset_seconds
+
+    allow() hands out the probe, so whoever it returned True to must
+    report back with record_success(), record_failure() or end_probe().
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.times_opened = 0
+        self.probing = False  # a half-open probe call is in flight
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "half_open":
+            if self.probing:
+                return False
+            self.probing = True
+        return state != "open"
+
+    def end_probe(self) -> None:
+        """The probe finished without saying anything about health (e.g. cancelled); let another through."""
+        self.probing = False
+
+    def retry_after(self) -> float:
+        if self.opened_at is None:
+            return 0.0
+        return max(self.reset_seconds - (time.monotonic() - self.opened_at), 0.0)
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    def record_failure(self) -> None:
+        self.probing = False
+        self.consecutive_failures += 1
+        if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            if self.state != "open":
+                self.times_opened += 1
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+            "probing": self.probing,
+            "retry_after_seconds": round(self.retry_after(), 1),
+        }
+
+
+class ConcurrencyGate:
+    """
+    Semaphore with a bounded wait queue.
+
+    Requests beyond max_concurrency wait for a slot, but only up to
+    max_queue of them and only for queue_timeout seconds - past that the
+    request is rejected instead of tying up the worker.
+    """
+
+    def __init__(self, max_concurrency: int, max_queue: int, queue_timeout: float):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_flight = 0
+        self.waiting = 0
+        self.rejected = 0
+
+    async def acquire(self) -> None:
+        if self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise LLMUnavailableError("Agenda assistant is busy, please try again shortly.")
+
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise LLMUnavailableError("Agenda assistant is busy, please try again shortly.")
+        finally:
+            self.waiting -= 1
+
+        self.in_flight += 1
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._semaphore.release()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.release()
+
+    def stats(self) -> dict:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "max_queue": self.max_queue,
+            "queue_depth": self.waiting,
+            "rejected": self.rejected,
+        }
+
+
+llm_gate = ConcurrencyGate(MAX_CONCURRENCY, MAX_QUEUE, QUEUE_TIMEOUT_SECONDS)
+llm_breaker = CircuitBreaker(BREAKER_FAILURES, BREAKER_RESET_SECONDS)
+llm_counters = {"calls": 0, "retries": 0, "timeouts": 0, "failures": 0}
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff, so retries from many requests spread out."""
+    return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+
+async def call_llm(make_call: Callable[[], Awaitable[T]]) -> T:
+    """
+    Run one model call with the breaker, deadline and retries applied.
+
+    make_call must start a fresh request each time it is called. The
+    caller is responsible for holding a llm_gate slot.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        probe = llm_breaker.state == "half_open"
+        if not llm_breaker.allow():
+            raise LLMUnavailableError(
+                "Agenda assistant is temporarily unavailable, please try again shortly.",
+                retry_after=llm_breaker.retry_after(),
+            )
+
+        llm_counters["calls"] += 1
+        try:
+            with timed("ai"):
+                result = await asyncio.wait_for(make_call(), timeout=TIMEOUT_SECONDS)
+        except RETRYABLE_ERRORS as e:
+            llm_counters["failures"] += 1
+            if isinstance(e, (asyncio.TimeoutError, openai.APITimeoutError)):
+                llm_counters["timeouts"] += 1
+            llm_breaker.record_failure()
+
+            if attempt == MAX_RETRIES:
+                raise LLMUnavailableError(
+                    "Agenda assistant is not responding, please try again shortly.",
+                    retry_after=llm_breaker.retry_after() or 1.0,
+                ) from e
+
+            llm_counters["retries"] += 1
+            await asyncio.sleep(backoff_delay(attempt))
+            continue
+        except openai.APIError as e:
+            # Bad request, auth problem, etc. - retrying won't help and it
+            # says nothing about the provider's health, so the breaker ignores it
+            if probe:
+                llm_breaker.end_probe()
+            raise LLMError(str(e)) from e
+        except BaseException:
+            # Cancelled, e.g. the client went away: no verdict either
+            if probe:
+                llm_breaker.end_probe()
+            raise
+
+        llm_breaker.record_success()
+        return result
+
+
+def llm_stats() -> dict:
+    """Breaker state, queue depth and call counters for /metrics/agenda."""
+    return {
+        "breaker": llm_breaker.stats(),
+        "gate": llm_gate.stats(),
+        **llm_counters,
+        "timeout_seconds": TIMEOUT_SECONDS,
+        "max_retries": MAX_RETRIES,
+    }
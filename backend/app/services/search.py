@@ -0,0 +1,165 @@
+"""
+Event search.
+
+On Postgres, GET /events/search runs against the search_vector tsvector
+column (generated from title, description and organization, GIN-indexed -
+see database/migrations.py), so the database keeps it current on every
+write.
+
+SQLite has no tsvector, so local development and tests use the in-process
+inverted index below instead. It is built from the events table on the
+first search and then kept current by the event write handlers. It only
+sees writes made by this process, which is fine for a single dev server.
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+# Relative weight of a match in each field (like setweight A / B / C)
+FIELD_WEIGHTS = {"title": 3.0, "organization": 2.0, "description": 1.0}
+
+_WORD = re.compile(r"\w+")
+
+
+def search_terms(text: Optional[str]) -> List[str]:
+    """Lowercased words of text, in order."""
+    return _WORD.findall(text.lower()) if text else []
+
+
+def to_prefix_tsquery(query: str) -> Optional[str]:
+    """
+    Postgres to_tsquery() text matching every word of query as a prefix,
+    e.g. "black stud" -> "black:* & stud:*". None if query has no words.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+class EventSearchIndex:
+    """
+    Inverted index: word -> {event id: score}.
+
+    Every query word is matched as a prefix (for type-ahead), found by
+    binary search over the sorted vocabulary, and an event must match all
+    of them. Score is the sum of the field weights of the matched words.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.built = False
+        self._postings: Dict[str, Dict[UUID, float]] = defaultdict(dict)
+        self._terms_by_event: Dict[UUID, List[str]] = {}
+        self._filters_by_event: Dict[UUID, Tuple[str, str]] = {}  # (organization, type)
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+
+    def add(self, event_id: UUID, title, description, organization, type) -> None:
+        """Index (or re-index) one event. No-op until the index is built."""
+        with self._lock:
+            if not self.built:
+                return
+            self._remove(event_id)
+
+            scores = defaultdict(float)
+            for field, text in (("title", title), ("description", description), ("organization", organization)):
+                for term in search_terms(text):
+                    scores[term] += FIELD_WEIGHTS[field]
+
+            for term, score in scores.items():
+                if term not in self._postings:
+                    self._vocabulary_dirty = True
+                self._postings[term][event_id] = score
+            self._terms_by_event[event_id] = list(scores)
+            self._filters_by_event[event_id] = (organization, type)
+
+    def add_event(self, event) -> None:
+        self.add(event.id, event.title, event.description, event.organization, event.type)
+
+    def remove(self, event_id: UUID) -> None:
+        with self._lock:
+            self._remove(event_id)
+
+    def _remove(self, event_id: UUID) -> None:
+        for term in self._terms_by_event.pop(event_id, ()):
+            postings = self._postings[term]
+            postings.pop(event_id, None)
+            if not postings:
+                del self._postings[term]
+                self._vocabulary_dirty = True
+        self._filters_by_event.pop(event_id, None)
+
+    def reset(self) -> None:
+        """Forget everything; the next search rebuilds from the database."""
+        with self._lock:
+            self.built = False
+            self._postings.clear()
+            self._terms_by_event.clear()
+            self._filters_by_event.clear()
+            self._vocabulary = []
+
+    def build(self, rows) -> None:
+        """Index all events from (id, title, description, organization, type) rows."""
+        self.reset()
+        with self._lock:
+            self.built = True
+        for row in rows:
+            self.add(*row)
+
+    def _prefix_matches(self, prefix: str) -> Dict[UUID, float]:
+        """Best score per event over all words starting with prefix."""
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+
+        matches = {}
+        i = bisect_left(self._vocabulary, prefix)
+        while i < len(self._vocabulary) and self._vocabulary[i].startswith(prefix):
+            for event_id, score in self._postings[self._vocabulary[i]].items():
+                matches[event_id] = max(score, matches.get(event_id, 0.0))
+            i += 1
+        return matches
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        organization: Optional[str] = None,
+        type: Optional[str] = None,
+    ) -> List[Tuple[UUID, float]]:
+        """Top (event id, score) pairs matching every word of query, best first."""
+        terms = search_terms(query)
+        if not terms:
+            return []
+
+        with self._lock:
+            scores = None
+            for term in terms:
+                matches = self._prefix_matches(term)
+                if scores is None:
+                    scores = matches
+                else:
+                    scores = {event_id: scores[event_id] + score for event_id, score in matches.items() if event_id in scores}
+                if not scores:
+                    return []
+
+            results = [
+                (event_id, score) for event_id, score in scores.items()
+                if (organization is None or self._filters_by_event[event_id][0] == organization)
+                and (type is None or self._filters_by_event[event_id][1] == type)
+            ]
+
+        results.sort(key=lambda result: result[1], reverse=True)
+        return results[:limit]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"built": self.built, "events": len(self._terms_by_event), "terms": len(self._postings)}
+
+
+search_index = EventSearchIndex()
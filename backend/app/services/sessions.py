@@ -0,0 +1,174 @@
+"""
+Admin session storage.
+
+Sessions map a login token to {"email": ..., "expires": datetime}. Two
+backends are available, picked with the SESSION_STORE env var:
+
+- memory (default): a dict in this process. Fastest, but every uvicorn
+  worker has its own, so only use it with a single worker.
+- database: the admin_sessions table, shared by all workers. Each worker
+  caches the sessions it has looked up for ADMIN_CACHE_TTL_SECONDS, so a
+  logged-in admin costs one database read per minute, not per request.
+
+Expired sessions are removed by a background sweeper started in main.py,
+so lookups stay a single key access and storage stays bounded even for
+tokens that are never presented again.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import delete
+
+from ..database.db import SessionLocal
+from ..database.models import AdminSession
+from .cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# How long a worker trusts what it read about an admin (their session,
+# their profile) before reading it again. Also how long another worker
+# may still accept a session logged out, or an admin removed, elsewhere.
+ADMIN_CACHE_TTL_SECONDS = float(os.getenv("ADMIN_PROFILE_CACHE_TTL_SECONDS", "60"))
+
+
+class MemorySessionStore:
+    """
+    Process-local session store.
+
+    Every session lives for the same duration, so insertion order is
+    expiry order: the OrderedDict is both the lookup table and the expiry
+    queue, and a sweep only looks at the (expired) front of it.
+    """
+
+    def __init__(self):
+        self._sessions: "OrderedDict[str, dict]" = OrderedDict()
+
+    async def create(self, token: str, email: str, expires: datetime) -> None:
+        self._sessions[token] = {"email": email, "expires": expires}
+
+    async def get(self, token: str) -> Optional[dict]:
+        return self._sessions.get(token)
+
+    async def delete(self, token: str) -> bool:
+        return self._sessions.pop(token, None) is not None
+
+    async def sweep(self) -> int:
+        now = datetime.now(timezone.utc)
+        removed = 0
+        while self._sessions:
+            token, session = next(iter(self._sessions.items()))
+            if session["expires"] > now:
+                break
+            del self._sessions[token]
+            removed += 1
+        return removed
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+class DatabaseSessionStore:
+    """
+    Session store backed by the admin_sessions table.
+
+    Tokens are looked up by primary key (their SHA-256 hash) and the
+    sweeper deletes by the indexed expires_at column. Sessions found are
+    cached per worker for ADMIN_CACHE_TTL_SECONDS; callers still check
+    "expires" on every request, and delete() drops this worker's copy.
+    """
+
+    def __init__(self):
+        self.cache = TTLCache(
+            max_entries=int(os.getenv("SESSION_CACHE_MAX_ENTRIES", "1024")),
+            ttl_seconds=ADMIN_CACHE_TTL_SECONDS,
+        )
+
+    @staticmethod
+    def _hash(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    async def create(self, token: str, email: str, expires: datetime) -> None:
+        async with SessionLocal() as db:
+            db.add(AdminSession(token_hash=self._hash(token), email=email, expires_at=expires))
+            await db.commit()
+
+    async def get(self, token: str) -> Optional[dict]:
+        token_hash = self._hash(token)
+        session = self.cache.get(token_hash)
+        if session is not None:
+            return session
+
+        async with SessionLocal() as db:
+            row = await db.get(AdminSession, token_hash)
+
+        if row is None:
+            return None  # not cached: a token can't become valid later
+
+        expires = row.expires_at
+        if expires.tzinfo is None:
+            # SQLite hands back naive datetimes
+            expires = expires.replace(tzinfo=timezone.utc)
+
+        session = {"email": row.email, "expires": expires}
+        self.cache.set(token_hash, session)
+        return session
+
+    async def delete(self, token: str) -> bool:
+        self.cache.invalidate(self._hash(token))
+        async with SessionLocal() as db:
+            result = await db.execute(delete(AdminSession).where(AdminSession.token_hash == self._hash(token)))
+            await db.commit()
+        return result.rowcount > 0
+
+    async def sweep(self) -> int:
+        async with SessionLocal() as db:
+            result = await db.execute(delete(AdminSession).where(AdminSession.expires_at <= datetime.now(timezone.utc)))
+            await db.commit()
+        return result.rowcount
+
+
+def create_session_store():
+    """Build the store selected by SESSION_STORE ("memory" or "database")."""
+    backend = os.getenv("SESSION_STORE", "memory").lower()
+
+    if backend == "database":
+        return DatabaseSessionStore()
+    if backend == "memory":
+        return MemorySessionStore()
+
+    raise ValueError(f"Unknown SESSION_STORE {backend!r}, expected 'memory' or 'database'")
+
+
+session_store = create_session_store()
+
+# Resolved admin identities (email -> (id, email, role)) so protected
+# requests don't re-read the profiles table on every call
+admin_profile_cache = TTLCache(
+    max_entries=int(os.getenv("ADMIN_PROFILE_CACHE_MAX_ENTRIES", "1024")),
+    ttl_seconds=ADMIN_CACHE_TTL_SECONDS,
+)
+
+SWEEP_INTERVAL_SECONDS = float(os.getenv("SESSION_SWEEP_INTERVAL_SECONDS", "300"))
+
+
+async def sweep_expired_sessions_forever():
+    """
+    Background task: remove expired sessions every SWEEP_INTERVAL_SECONDS.
+
+    Started from the app lifespan and cancelled on shutdown.
+    """
+    while True:
+        await asyncio.sleep(SWEEP_INTERVAL_SECONDS)
+        try:
+            removed = await session_store.sweep()
+            if removed:
+                logger.info("Swept %d expired admin sessions", removed)
+        except Exception:
+            # A failed sweep (e.g. database blip) shouldn't kill the task
+            logger.exception("Admin session sweep failed")
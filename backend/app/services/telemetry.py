@@ -0,0 +1,353 @@
+"""
+Request telemetry: where the time in a request goes.
+
+- TimingMiddleware times every request and keeps a latency histogram per
+  route (the path template, e.g. /events/{id}, not the raw path).
+- instrument_queries() times every SQL statement through the engine's
+  cursor events, counts statements per request (a request that runs
+  dozens of them is usually an N+1 loop) and logs slow ones with their
+  parameters.
+- TimedRoute measures how long FastAPI takes to validate and encode what
+  an endpoint returned.
+- Every response gets a Server-Timing header with the request's db,
+  serialization and ai time, which browser dev tools show per request.
+
+The current request's timings live in a contextvar, so the query hooks
+and timed() can add to them without anything being passed around.
+Everything is exposed in Prometheus text format on GET /metrics.
+Counters are per worker process.
+"""
+
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+
+logger = logging.getLogger(__name__)
+
+SLOW_QUERY_SECONDS = float(os.getenv("SLOW_QUERY_MS", "200")) / 1000
+# Requests running more statements than this are logged as likely N+1 loops
+QUERY_COUNT_WARNING = int(os.getenv("QUERY_COUNT_WARNING", "25"))
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# Upper bounds (in seconds) of the histogram buckets
+REQUEST_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS_SECONDS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+MAX_LOGGED_PARAMETERS = 1000  # characters
+
+UNMATCHED_ROUTE = "unmatched"  # 404s, so bad paths don't each get a series
+
+
+class RequestTimings:
+    """Time spent so far in the current request, by kind."""
+
+    __slots__ = ("db", "queries", "serialization", "ai", "endpoint_done")
+
+    def __init__(self):
+        self.db = 0.0
+        self.queries = 0
+        self.serialization = 0.0
+        self.ai = 0.0
+        self.endpoint_done: Optional[float] = None
+
+
+current_timings: ContextVar[Optional[RequestTimings]] = ContextVar("current_timings", default=None)
+
+
+@contextmanager
+def timed(kind: str):
+    """Add the time spent in the block to the current request's `kind` ("ai", "serialization")."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = current_timings.get()
+        if timings is not None:
+            setattr(timings, kind, getattr(timings, kind) + time.perf_counter() - started)
+
+
+class Histogram:
+    """Latency histogram with fixed buckets (not cumulative; the +Inf bucket is last)."""
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.buckets[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+
+class RouteStats:
+    """Everything recorded for one (method, route)."""
+
+    def __init__(self):
+        self.latency = Histogram(REQUEST_BUCKETS_SECONDS)
+        self.responses: Dict[int, int] = defaultdict(int)  # status code -> count
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.serialization_seconds = 0.0
+        self.ai_seconds = 0.0
+        self.query_heavy_requests = 0
+
+
+class Telemetry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.routes: Dict[Tuple[str, str], RouteStats] = {}
+        self.queries = Histogram(QUERY_BUCKETS_SECONDS)
+        self.slow_queries = 0
+
+    def record_request(self, method: str, route: str, status: int, seconds: float, timings: RequestTimings) -> None:
+        query_heavy = timings.queries > QUERY_COUNT_WARNING
+        if query_heavy:
+            logger.warning("%s %s ran %d queries (N+1 query?)", method, route, timings.queries)
+
+        with self._lock:
+            stats = self.routes.get((method, route))
+            if stats is None:
+                stats = self.routes[(method, route)] = RouteStats()
+            stats.latency.observe(seconds)
+            stats.responses[status] += 1
+            stats.queries += timings.queries
+            stats.db_seconds += timings.db
+            stats.serialization_seconds += timings.serialization
+            stats.ai_seconds += timings.ai
+            stats.query_heavy_requests += query_heavy
+
+    def record_query(self, seconds: float) -> None:
+        with self._lock:
+            self.queries.observe(seconds)
+            self.slow_queries += seconds >= SLOW_QUERY_SECONDS
+
+    def write_prometheus(self, out: "PrometheusText") -> None:
+        with self._lock:
+            routes = sorted(self.routes.items())
+            out.histogram(
+                "mcc_http_request_duration_seconds",
+                "Time to response headers, by route",
+                [({"method": method, "route": route}, stats.latency) for (method, route), stats in routes],
+            )
+            out.metric(
+                "mcc_http_responses_total", "counter", "Responses by route and status code",
+                [
+                    ({"method": method, "route": route, "status": str(status)}, count)
+                    for (method, route), stats in routes
+                    for status, count in sorted(stats.responses.items())
+                ],
+            )
+            for name, attribute, help_text in (
+                ("mcc_http_request_db_queries_total", "queries", "SQL statements run by requests, by route"),
+                ("mcc_http_request_db_seconds_total", "db_seconds", "Time spent in SQL statements, by route"),
+                ("mcc_http_request_serialization_seconds_total", "serialization_seconds", "Time spent serializing responses, by route"),
+                ("mcc_http_request_ai_seconds_total", "ai_seconds", "Time spent waiting on the AI model, by route"),
+                ("mcc_http_query_heavy_requests_total", "query_heavy_requests", f"Requests that ran more than {QUERY_COUNT_WARNING} SQL statements"),
+            ):
+                out.metric(name, "counter", help_text, [
+                    ({"method": method, "route": route}, getattr(stats, attribute)) for (method, route), stats in routes
+                ])
+            out.histogram("mcc_db_query_duration_seconds", "SQL statement execution time", [({}, self.queries)])
+            out.metric("mcc_db_slow_queries_total", "counter", f"SQL statements slower than {SLOW_QUERY_SECONDS:g}s", [({}, self.slow_queries)])
+
+
+telemetry = Telemetry()
+
+
+def server_timing(timings: RequestTimings, total: float) -> str:
+    """Server-Timing header value (durations in milliseconds)."""
+    parts = [
+        f'db;dur={timings.db * 1000:.1f};desc="{timings.queries} queries"',
+        f"serialization;dur={timings.serialization * 1000:.1f}",
+    ]
+    if timings.ai:
+        parts.append(f"ai;dur={timings.ai * 1000:.1f}")
+    parts.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(parts)
+
+
+class TimingMiddleware:
+    """
+    Times every HTTP request and adds the Server-Timing header.
+
+    A plain ASGI middleware (not BaseHTTPMiddleware) so the endpoint runs in
+    the same context and its timings land in this request's RequestTimings.
+    Latency is measured up to the response headers, so a long-lived stream
+    (SSE, exports) counts only its setup time.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        started = time.perf_counter()
+        recorded = False
+
+        def record(status: int) -> float:
+            nonlocal recorded
+            recorded = True
+            elapsed = time.perf_counter() - started
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            telemetry.record_request(scope["method"], route, status, elapsed, timings)
+            return elapsed
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start" and not recorded:
+                elapsed = record(message["status"])
+                if SERVER_TIMING_ENABLED:
+                    MutableHeaders(scope=message).append("Server-Timing", server_timing(timings, elapsed))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            if not recorded:
+                # Unhandled exception: the 500 is sent by Starlette's outer error middleware
+                record(500)
+            current_timings.reset(token)
+
+
+def _mark_endpoint_done():
+    timings = current_timings.get()
+    if timings is not None:
+        timings.endpoint_done = time.perf_counter()
+
+
+def _timed_endpoint(endpoint):
+    """Wrap an endpoint to note when it returns; FastAPI reads its signature through functools.wraps."""
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                _mark_endpoint_done()
+    else:
+        @functools.wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                _mark_endpoint_done()
+    return wrapper
+
+
+class TimedRoute(APIRoute):
+    """
+    APIRoute that records serialization time: everything between the
+    endpoint returning and the response being ready, i.e. response_model
+    validation plus JSON encoding. Use as APIRouter(route_class=TimedRoute).
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, _timed_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def timed_handler(request):
+            response = await handler(request)
+            timings = current_timings.get()
+            if timings is not None and timings.endpoint_done is not None:
+                timings.serialization += time.perf_counter() - timings.endpoint_done
+                timings.endpoint_done = None
+            return response
+
+        return timed_handler
+
+
+def describe_parameters(parameters, executemany: bool) -> str:
+    """Statement parameters for the slow query log, truncated."""
+    if executemany:
+        text = f"{len(parameters)} parameter sets, first: {parameters[0]!r}" if parameters else "[]"
+    else:
+        text = repr(parameters)
+    if len(text) > MAX_LOGGED_PARAMETERS:
+        text = text[:MAX_LOGGED_PARAMETERS] + "..."
+    return text
+
+
+def instrument_queries(engine) -> None:
+    """Time every statement the engine runs (the SQLAlchemy docs' cursor-event recipe)."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+        connection.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - connection.info["query_started"].pop()
+        telemetry.record_query(seconds)
+
+        timings = current_timings.get()
+        if timings is not None:
+            timings.db += seconds
+            timings.queries += 1
+
+        if seconds >= SLOW_QUERY_SECONDS:
+            logger.warning(
+                "Slow query (%.1f ms): %s | parameters: %s",
+                seconds * 1000, " ".join(statement.split()), describe_parameters(parameters, executemany),
+            )
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: dict, extra: str = "") -> str:
+    parts = [f'{name}="{_label_value(str(value))}"' for name, value in labels.items()]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class PrometheusText:
+    """Builds a Prometheus text exposition (format 0.0.4)."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def metric(self, name: str, kind: str, help_text: str, samples: Iterable[Tuple[dict, float]]) -> None:
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            self.lines.append(f"{name}{_labels(labels)} {value}")
+
+    def histogram(self, name: str, help_text: str, series: Iterable[Tuple[dict, Histogram]]) -> None:
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} histogram")
+        for labels, histogram in series:
+            cumulative = 0
+            for bound, count in zip(list(histogram.bounds) + ["+Inf"], histogram.buckets):
+                cumulative += count
+                le = f'le="{bound}"'
+                self.lines.append(f"{name}_bucket{_labels(labels, le)} {cumulative}")
+            self.lines.append(f"{name}_sum{_labels(labels)} {histogram.sum}")
+            self.lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
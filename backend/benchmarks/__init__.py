@@ -0,0 +1,7 @@
+"""
+Backend benchmark suite - see benchmarks/README.md.
+
+Run from the backend/ directory:
+
+    python -m benchmarks.run --scales 1000,100000
+"""
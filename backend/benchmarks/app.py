@@ -0,0 +1,50 @@
+"""
+The FastAPI app as benchmarked.
+
+Two changes to app.main.app, both benchmark-only:
+
+- optimize_agenda is replaced by a stub that waits AGENDA_STUB_LATENCY_MS
+  and returns a canned agenda, so POST /api/agenda measures our own
+  overhead rather than OpenAI's.
+- GET /_benchmark/admin runs nothing but the get_current_admin
+  dependency, so its cost can be measured on its own.
+"""
+
+import asyncio
+import os
+
+from fastapi import Depends
+
+from app.database.models import Profile
+from app.routers import agenda
+from app.routers.auth import get_current_admin
+from app.services.ai import AgendaResult
+
+AGENDA_STUB_LATENCY_MS = float(os.getenv("AGENDA_STUB_LATENCY_MS", "0"))
+
+STUB_AGENDA = (
+    "## Agenda\n\n"
+    "1. **Welcome and introductions** (5 min)\n"
+    "2. **Budget update** (15 min)\n"
+    "3. **Event planning** (20 min)\n"
+    "4. **Open discussion** (10 min)\n"
+)
+
+
+async def stub_optimize_agenda(user_message: str, conversation_history: list = None) -> AgendaResult:
+    if AGENDA_STUB_LATENCY_MS:
+        await asyncio.sleep(AGENDA_STUB_LATENCY_MS / 1000)
+    return AgendaResult(response=STUB_AGENDA)
+
+
+async def current_admin(admin: Profile = Depends(get_current_admin)):
+    return {"email": admin.email}
+
+
+def build_app():
+    from app.main import app
+
+    agenda.optimize_agenda = stub_optimize_agenda
+    if not any(getattr(route, "path", None) == "/_benchmark/admin" for route in app.routes):
+        app.add_api_route("/_benchmark/admin", current_admin, methods=["GET"], include_in_schema=False)
+    return app
@@ -0,0 +1,83 @@
+"""
+Compare two benchmark result files, e.g. before and after a change:
+
+    python -m benchmarks.compare benchmarks/results/<old>.json benchmarks/results/<new>.json
+
+Prints p50/p95/p99 and throughput per scale, mode and endpoint with the
+relative change, and exits with status 1 if any p95 got slower (or any
+throughput dropped) by more than --threshold percent.
+"""
+
+import argparse
+import json
+import sys
+
+METRICS = ["p50_ms", "p95_ms", "p99_ms", "throughput_rps"]
+MODES = ("inprocess", "http")
+
+
+def change(old: float, new: float) -> float:
+    """Relative change in percent."""
+    return (new - old) / old * 100 if old else 0.0
+
+
+def is_regression(metric: str, old: float, new: float, threshold: float) -> bool:
+    if metric == "p95_ms":
+        return change(old, new) > threshold
+    if metric == "throughput_rps":
+        return change(old, new) < -threshold
+    return False
+
+
+def compare(base: dict, head: dict, threshold: float):
+    """Yield one row per endpoint measured in both files, and whether it regressed."""
+    for scale, head_scale in head["scales"].items():
+        base_scale = base["scales"].get(scale)
+        if base_scale is None:
+            continue
+        for mode in MODES:
+            for endpoint, new in head_scale.get(mode, {}).items():
+                old = base_scale.get(mode, {}).get(endpoint)
+                if old is None:
+                    continue
+                cells = []
+                regressed = False
+                for metric in METRICS:
+                    cells.append(f"{new[metric]:>9.2f} ({change(old[metric], new[metric]):+6.1f}%)")
+                    regressed = regressed or is_regression(metric, old[metric], new[metric], threshold)
+                yield f"{scale:>8} {mode:<9} {endpoint:<20} " + " ".join(cells), regressed
+
+
+def describe(report: dict) -> str:
+    return f"{report['commit'][:12]}{'-dirty' if report['dirty'] else ''} ({report['database']}, {report['created_at'][:19]})"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent change counted as a regression (default 10)")
+    args = parser.parse_args()
+
+    with open(args.base) as base_file, open(args.head) as head_file:
+        base, head = json.load(base_file), json.load(head_file)
+
+    print(f"base: {describe(base)}")
+    print(f"head: {describe(head)}")
+    if base["settings"] != head["settings"] or base["database"] != head["database"]:
+        print("warning: the two runs used different settings or databases")
+    print()
+    print(f"{'events':>8} {'mode':<9} {'endpoint':<20} " + " ".join(f"{metric:>19}" for metric in METRICS))
+
+    regressions = 0
+    for row, regressed in compare(base, head, args.threshold):
+        print(row + ("  <- regression" if regressed else ""))
+        regressions += regressed
+
+    if regressions:
+        print(f"\n{regressions} endpoint(s) regressed by more than {args.threshold:g}%")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark one scale: seed, then run the workload in-process and/or over
+HTTP, and write the results as JSON.
+
+Started by benchmarks/run.py in a fresh process per scale (DATABASE_URL is
+read when the app is imported, and each scale starts with cold caches).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+from .app import build_app
+from .seed import seed
+from .workload import run_workload
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVER_START_TIMEOUT_SECONDS = 30
+
+
+def log(message: str):
+    print(message, file=sys.stderr, flush=True)
+
+
+async def run_in_process(args) -> dict:
+    """Requests go straight to the ASGI app, without a server or sockets."""
+    app = build_app()
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            return await run_workload(client, args.events, args.requests, args.concurrency, args.warmup, args.only, log)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_until_up(client: httpx.AsyncClient, server: subprocess.Popen):
+    deadline = time.monotonic() + SERVER_START_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"Benchmark server exited with code {server.returncode}")
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("Benchmark server did not start in time")
+
+
+async def run_over_http(args) -> dict:
+    """Requests go through a real uvicorn server (one worker) on localhost."""
+    port = free_port()
+    server = subprocess.Popen([sys.executable, "-m", "benchmarks.server", "--port", str(port)], cwd=BACKEND_DIR)
+    try:
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=60) as client:
+            await wait_until_up(client, server)
+            return await run_workload(client, args.events, args.requests, args.concurrency, args.warmup, args.only, log)
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+async def main_async(args) -> dict:
+    from app.database.db import engine
+
+    results = await seed(args.events, log)
+    if "inprocess" in args.modes:
+        log(f"{args.events} events, in-process:")
+        results["inprocess"] = await run_in_process(args)
+    if "http" in args.modes:
+        # Drop the in-process run's writes so both modes see the same data
+        await seed(args.events, log)
+        await engine.dispose()
+        log(f"{args.events} events, over HTTP:")
+        results["http"] = await run_over_http(args)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark one scale (used by benchmarks.run)")
+    parser.add_argument("--events", type=int, required=True)
+    parser.add_argument("--modes", type=lambda value: value.split(","), default=["inprocess", "http"])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--only", type=lambda value: value.split(","), default=None)
+    parser.add_argument("--output", required=True)
+    args = parser.parse_args()
+
+    results = asyncio.run(main_async(args))
+    with open(args.output, "w") as output:
+        json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Synthetic data for the benchmarks.
+
+Seeding is deterministic (fixed random seed), so every run at a given
+scale benchmarks the same rows. Events are inserted in large batches with
+Core INSERTs, which is what makes a million rows practical.
+
+Rows the benchmarks themselves create (POST /events/ writes into
+BENCHMARK_ORGANIZATION) are deleted before every run, so an already seeded
+database is reused as long as its row counts still match.
+"""
+
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, insert, select, text
+
+from app.database.db import Base, SessionLocal, engine
+from app.database.migrations import upgrade_schema
+from app.database.models import AdminSession, Event, EventChange, Profile
+from app.services.recurrence import series_end
+
+BATCH_SIZE = 10_000
+RANDOM_SEED = 20260101
+
+# Events are spread over two years around this date
+SEED_START = datetime(2025, 7, 1, tzinfo=timezone.utc)
+SEED_DAYS = 730
+
+BENCHMARK_ORGANIZATION = "Benchmark Writes"
+
+ORGANIZATIONS = [
+    "Black Student Union", "MEChA", "Asian Pacific American Student Union",
+    "Native American Student Union", "Vietnamese Student Association",
+    "Korean Student Association", "Muslim Student Association",
+    "Jewish Student Union", "Queer Alliance", "Women of Color Coalition",
+    "First Generation Students", "International Student Association",
+    "Filipino American Student Association", "Latinx Strategy Group",
+    "Pacific Islander Student Alliance", "African Student Association",
+    "Chinese Student Association", "South Asian Student Association",
+    "Hmong Student Association", "Multicultural Center Staff",
+]
+
+TITLE_WORDS = [
+    "General", "Meeting", "Workshop", "Social", "Study", "Night", "Potluck",
+    "Panel", "Mixer", "Heritage", "Celebration", "Training", "Mentorship",
+    "Open", "Office", "Hours", "Film", "Screening", "Discussion", "Retreat",
+]
+
+# Share of seeded events that are recurring series
+RECURRING_SHARE = 0.01
+RECURRENCE_RULES = ["FREQ=WEEKLY;COUNT=10", "FREQ=WEEKLY;BYDAY=TU,TH;COUNT=20", "FREQ=DAILY;COUNT=5"]
+
+
+def profile_count(events: int) -> int:
+    """Admin profiles seeded alongside this many events."""
+    return max(10, events // 100)
+
+
+def admin_email(i: int) -> str:
+    return f"admin{i}@uoregon.edu"
+
+
+def event_rows(rng: random.Random, first: int, last: int):
+    """Insert parameters for seeded events first..last-1."""
+    rows = []
+    for i in range(first, last):
+        start = SEED_START + timedelta(minutes=rng.randrange(SEED_DAYS * 24 * 4) * 15)
+        end = start + timedelta(minutes=rng.choice((30, 60, 90, 120, 180)))
+        rule = rng.choice(RECURRENCE_RULES) if rng.random() < RECURRING_SHARE else None
+        office_hours = rng.random() < 0.2
+        rows.append({
+            "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+            "title": " ".join(rng.sample(TITLE_WORDS, 3)),
+            "description": f"Seeded event {i}. " + " ".join(rng.choices(TITLE_WORDS, k=12)),
+            "organization": rng.choice(ORGANIZATIONS),
+            "type": "office_hours" if office_hours else "event",
+            "start_time": start,
+            "end_time": end,
+            "recurrence_rule": rule,
+            "recurrence_end": series_end(rule, start, end) if rule else None,
+            "created_at": start - timedelta(days=30),
+            "updated_at": start - timedelta(days=30),
+        })
+    return rows
+
+
+async def seed(events: int, log=print) -> dict:
+    """
+    Make the database hold exactly `events` seeded events and
+    profile_count(events) profiles, reseeding only when it doesn't already.
+    """
+    profiles = profile_count(events)
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.run_sync(upgrade_schema)
+
+    async with SessionLocal() as db:
+        await db.execute(delete(Event).where(Event.organization == BENCHMARK_ORGANIZATION))
+        await db.execute(delete(EventChange))
+        await db.execute(delete(AdminSession))
+        await db.commit()
+
+        current_events = await db.scalar(select(func.count()).select_from(Event))
+        current_profiles = await db.scalar(select(func.count()).select_from(Profile))
+        if current_events == events and current_profiles == profiles:
+            log(f"Reusing seeded data: {events} events, {profiles} profiles")
+            return {"events": events, "profiles": profiles}
+
+        log(f"Seeding {events} events and {profiles} profiles...")
+        await db.execute(delete(Event))
+        await db.execute(delete(Profile))
+
+        created_at = SEED_START - timedelta(days=365)
+        await db.execute(insert(Profile), [
+            {"id": uuid.uuid4(), "email": admin_email(i), "role": "admin", "created_at": created_at, "updated_at": created_at}
+            for i in range(profiles)
+        ])
+
+        rng = random.Random(RANDOM_SEED)
+        for first in range(0, events, BATCH_SIZE):
+            await db.execute(insert(Event), event_rows(rng, first, min(events, first + BATCH_SIZE)))
+        await db.commit()
+
+    if engine.dialect.name == "postgresql":
+        # Don't leave fresh planner statistics to autovacuum's timing
+        async with engine.begin() as connection:
+            await connection.execute(text("ANALYZE events"))
+            await connection.execute(text("ANALYZE profiles"))
+
+    return {"events": events, "profiles": profiles}
@@ -0,0 +1,104 @@
+"""
+GET /events serialization: the ORM path vs the row path, at 10k events.
+
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --events 10000 --rounds 20 --database-url postgresql://...
+
+- orm: select(Event) objects, validated into EventResponse with
+  from_attributes and encoded by pydantic (how GET /events used to work)
+- rows: select(*EVENT_ROW_COLUMNS) rows, validated in bulk as EventRow
+  dicts and encoded by orjson (how it works now)
+
+Both list the same events; the script checks the JSON is byte-identical
+before timing anything, then reports median query and serialization time.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compare the GET /events serialization paths")
+    parser.add_argument("--events", type=int, default=10_000, help="events listed (and seeded)")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--database-url", default=None, help="default: benchmarks/.data/bench-<events>.db")
+    return parser.parse_args()
+
+
+def median_ms(samples) -> float:
+    return round(statistics.median(samples) * 1000, 1)
+
+
+async def main(args):
+    from typing import List
+
+    from pydantic import TypeAdapter
+    from sqlalchemy import select
+
+    from app.crud import EVENT_ROW_COLUMNS
+    from app.database.db import SessionLocal
+    from app.database.models import Event
+    from app.models.schemas import EventResponse
+    from app.routers.events import dump_json, validate_event_rows
+
+    from .seed import seed
+
+    await seed(args.events, lambda message: print(message, file=sys.stderr))
+    orm_adapter = TypeAdapter(List[EventResponse])
+    order = (Event.start_time.asc(), Event.id.asc())
+
+    async def orm_path(db):
+        started = time.perf_counter()
+        events = (await db.scalars(select(Event).order_by(*order).limit(args.events))).all()
+        queried = time.perf_counter()
+        body = orm_adapter.dump_json(orm_adapter.validate_python(events, from_attributes=True))
+        db.expunge_all()
+        return body, queried - started, time.perf_counter() - queried
+
+    async def row_path(db):
+        started = time.perf_counter()
+        rows = (await db.execute(select(*EVENT_ROW_COLUMNS).order_by(*order).limit(args.events))).all()
+        queried = time.perf_counter()
+        body = dump_json(validate_event_rows(rows))
+        return body, queried - started, time.perf_counter() - queried
+
+    results = {}
+    async with SessionLocal() as db:
+        orm_body = (await orm_path(db))[0]
+        row_body = (await row_path(db))[0]
+        if orm_body != row_body:
+            raise SystemExit("The two paths produced different JSON")
+
+        for name, path in (("orm", orm_path), ("rows", row_path)):
+            query_times, serialize_times = [], []
+            for _ in range(args.rounds):
+                _, query_seconds, serialize_seconds = await path(db)
+                query_times.append(query_seconds)
+                serialize_times.append(serialize_seconds)
+            results[name] = {
+                "query_ms": median_ms(query_times),
+                "serialize_ms": median_ms(serialize_times),
+                "total_ms": median_ms([q + s for q, s in zip(query_times, serialize_times)]),
+            }
+
+    print(f"{args.events} events, {len(orm_body) / 1e6:.1f} MB of JSON, median of {args.rounds} rounds")
+    print(f"{'path':<6} {'query':>10} {'serialize':>12} {'total':>10}")
+    for name, result in results.items():
+        print(f"{name:<6} {result['query_ms']:>8.1f}ms {result['serialize_ms']:>10.1f}ms {result['total_ms']:>8.1f}ms")
+    print(f"serialization {results['orm']['serialize_ms'] / results['rows']['serialize_ms']:.1f}x faster, "
+          f"query + serialization {results['orm']['total_ms'] / results['rows']['total_ms']:.1f}x faster")
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    # The app reads these when it is imported
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{os.path.join(BENCHMARKS_DIR, '.data', f'bench-{args.events}.db')}"
+    os.environ.setdefault("OPENAI_API_KEY", "benchmark-stub")
+    os.makedirs(os.path.join(BENCHMARKS_DIR, ".data"), exist_ok=True)
+    asyncio.run(main(args))
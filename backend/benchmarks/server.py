@@ -0,0 +1,25 @@
+"""
+Serve the benchmarked app (benchmarks/app.py) with uvicorn, for the
+over-HTTP runs. Started by benchmarks/run.py; usable on its own too:
+
+    DATABASE_URL=sqlite:///benchmarks/.data/bench-1000.db python -m benchmarks.server --port 8800
+"""
+
+import argparse
+
+import uvicorn
+
+from .app import build_app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    args = parser.parse_args()
+
+    uvicorn.run(build_app(), host=args.host, port=args.port, log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    main()
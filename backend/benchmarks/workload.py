@@ -0,0 +1,153 @@
+"""
+The benchmarked requests and how they are timed.
+
+Each scenario is one endpoint with a request generator. It is run for a
+fixed number of requests by `concurrency` concurrent clients after a few
+warm-up requests, and summarised as latency percentiles and throughput.
+The generators use a fixed random seed, so two runs send the same
+requests.
+"""
+
+import asyncio
+import random
+import statistics
+import time
+from datetime import timedelta
+from typing import Callable, Dict, List, NamedTuple
+
+import httpx
+
+from .seed import BENCHMARK_ORGANIZATION, ORGANIZATIONS, SEED_DAYS, SEED_START, admin_email, profile_count
+
+RANDOM_SEED = 20260102
+
+
+class Scenario(NamedTuple):
+    name: str
+    # (rng, context) -> (method, url, httpx request kwargs)
+    build: Callable
+
+
+def events_cached(rng, context):
+    """The calendar's default listing - served from the response cache after the first request."""
+    return "GET", "/events/", {"params": {"limit": 100}}
+
+
+def events_window(rng, context):
+    """A random week, sometimes for one organization - mostly cache misses."""
+    start = SEED_START + timedelta(days=rng.randrange(SEED_DAYS - 7), hours=rng.randrange(24))
+    params = {"start": start.isoformat(), "end": (start + timedelta(days=7)).isoformat(), "limit": 100}
+    if rng.random() < 0.5:
+        params["organization"] = rng.choice(ORGANIZATIONS)
+    return "GET", "/events/", {"params": params}
+
+
+def login(rng, context):
+    return "POST", "/auth/login", {"json": {"email": admin_email(rng.randrange(context["profiles"]))}}
+
+
+def current_admin(rng, context):
+    return "GET", "/_benchmark/admin", {"headers": context["auth"]}
+
+
+def list_admins(rng, context):
+    return "GET", "/auth/admins", {"headers": context["auth"]}
+
+
+def agenda(rng, context):
+    topics = ", ".join(rng.sample(["budget", "elections", "fall retreat", "fundraiser", "mentorship", "newsletter"], 3))
+    return "POST", "/api/agenda", {"json": {"message": f"Topics: {topics}", "history": []}}
+
+
+def create_event(rng, context):
+    start = SEED_START + timedelta(days=rng.randrange(SEED_DAYS), minutes=rng.randrange(96) * 15)
+    body = {
+        "title": "Benchmark event",
+        "organization": BENCHMARK_ORGANIZATION,
+        "type": "event",
+        "start_time": start.isoformat(),
+        "end_time": (start + timedelta(hours=1)).isoformat(),
+    }
+    return "POST", "/events/", {"json": body, "headers": context["auth"]}
+
+
+# Writes last, so they don't invalidate the caches the reads are measured with
+SCENARIOS = [
+    Scenario("get_events", events_cached),
+    Scenario("get_events_window", events_window),
+    Scenario("login", login),
+    Scenario("get_current_admin", current_admin),
+    Scenario("list_admins", list_admins),
+    Scenario("agenda", agenda),
+    Scenario("create_event", create_event),
+]
+
+
+def percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float, concurrency: int) -> dict:
+    ordered = sorted(latencies)
+    ms = lambda seconds: round(seconds * 1000, 3)
+    return {
+        "requests": len(ordered),
+        "concurrency": concurrency,
+        "errors": errors,
+        "p50_ms": ms(percentile(ordered, 50)),
+        "p95_ms": ms(percentile(ordered, 95)),
+        "p99_ms": ms(percentile(ordered, 99)),
+        "mean_ms": ms(statistics.fmean(ordered)),
+        "max_ms": ms(ordered[-1]),
+        "throughput_rps": round(len(ordered) / elapsed, 1),
+    }
+
+
+async def run_scenario(client: httpx.AsyncClient, scenario: Scenario, context: dict,
+                       requests: int, concurrency: int, warmup: int) -> dict:
+    rng = random.Random(f"{RANDOM_SEED}:{scenario.name}")
+    planned = [scenario.build(rng, context) for _ in range(warmup + requests)]
+
+    for method, url, kwargs in planned[:warmup]:
+        await client.request(method, url, **kwargs)
+
+    queue = iter(planned[warmup:])
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        for method, url, kwargs in queue:
+            started = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            await response.aread()
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - started, concurrency)
+
+
+async def run_workload(client: httpx.AsyncClient, events: int, requests: int, concurrency: int,
+                       warmup: int, only=None, log=print) -> Dict[str, dict]:
+    """Run every scenario (or just those named in only) against client."""
+    response = await client.post("/auth/login", json={"email": admin_email(0)})
+    response.raise_for_status()
+    context = {
+        "profiles": profile_count(events),
+        "auth": {"Authorization": f"Bearer {response.json()['token']}"},
+    }
+
+    results = {}
+    for scenario in SCENARIOS:
+        if only and scenario.name not in only:
+            continue
+        results[scenario.name] = stats = await run_scenario(client, scenario, context, requests, concurrency, warmup)
+        log(f"  {scenario.name:<20} p50 {stats['p50_ms']:>9.2f} ms  p95 {stats['p95_ms']:>9.2f} ms  "
+            f"p99 {stats['p99_ms']:>9.2f} ms  {stats['throughput_rps']:>8.1f} req/s"
+            + (f"  ({stats['errors']} errors)" if stats["errors"] else ""))
+    return results
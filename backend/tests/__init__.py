@@ -0,0 +1,9 @@
+"""
+Backend tests. Run from the backend/ directory:
+
+    pip install -r requirements.txt -r tests/requirements.txt
+    python -m pytest
+
+They use a throwaway SQLite database and a fake OpenAI server
+(tests/fake_openai.py), so no network or API key is needed.
+"""
@@ -0,0 +1,68 @@
+import os
+import tempfile
+
+# The app reads these when it is imported, so set them first
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='mcc-tests-'), 'test.db')}"
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.pop("AGENDA_CACHE_DIR", None)
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+from sqlalchemy import delete
+
+from app.database.db import Base, SessionLocal
+from app.database.models import Profile
+from app.main import app
+from app.routers.auth import get_current_admin
+from app.services import ai
+from app.services.agenda_cache import agenda_cache
+from app.services.event_cache import clear_event_caches
+from app.services.resilience import llm_breaker
+from app.services.search import search_index
+
+from . import fake_openai
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+async def empty_database():
+    async with SessionLocal() as db:
+        for table in reversed(Base.metadata.sorted_tables):
+            await db.execute(delete(table))
+        await db.commit()
+    clear_event_caches()
+    search_index.reset()
+
+
+@pytest.fixture
+async def client():
+    """
+    An httpx client for the app, with a fresh database and admin routes
+    unlocked. Runs the app's startup / shutdown around the test.
+    """
+    app.dependency_overrides[get_current_admin] = lambda: Profile(email="admin@uoregon.edu", role="admin")
+    try:
+        async with app.router.lifespan_context(app):
+            await empty_database()
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+                yield http
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Point the agenda service at tests/fake_openai.py, returns its Behavior."""
+    fake_openai.behavior.reset()
+    agenda_cache.memory.clear()
+    llm_breaker.record_success()  # closed, whatever an earlier test left it as
+    http_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=fake_openai.app))
+    monkeypatch.setattr(ai, "client", AsyncOpenAI(
+        api_key="test", base_url="http://fake-openai/v1", http_client=http_client, max_retries=0,
+    ))
+    return fake_openai.behavior
@@ -0,0 +1,100 @@
+"""
+A fake OpenAI-compatible chat completions server.
+
+Answers POST /v1/chat/completions like the real API - a JSON completion,
+or Server-Sent Events chunks with stream=true - without a key or network,
+so the agenda endpoints can be exercised end to end. The tests mount it
+in-process; for manual testing run it as a server and point the backend
+at it:
+
+    python -m tests.fake_openai --port 8001
+    OPENAI_BASE_URL=http://localhost:8001/v1 uvicorn app.main:app --reload
+
+The reply, per-chunk delay and failures are set through `behavior`.
+"""
+
+import argparse
+import asyncio
+import json
+from dataclasses import dataclass, field
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+DEFAULT_REPLY = "## Agenda\n\n1. Welcome (5 min)\n2. Budget update (15 min)\n3. Open discussion (10 min)\n"
+
+
+@dataclass
+class Behavior:
+    reply: str = DEFAULT_REPLY
+    chunk_delay_seconds: float = 0.0
+    fail_status: int = 0  # answer every request with this HTTP error instead
+    requests: list = field(default_factory=list)  # request bodies received, oldest first
+
+    def reset(self) -> None:
+        self.__init__()
+
+
+behavior = Behavior()
+app = FastAPI(title="Fake OpenAI")
+
+
+def completion_chunk(content: str = None, finish_reason: str = None) -> str:
+    delta = {"content": content} if content is not None else {}
+    chunk = {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": "fake",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    return f"data: {json.dumps(chunk)}\n\n"
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    behavior.requests.append(body)
+
+    if behavior.fail_status:
+        return JSONResponse(
+            {"error": {"message": "fake failure", "type": "server_error"}},
+            status_code=behavior.fail_status,
+        )
+
+    if body.get("stream"):
+        async def chunks():
+            # One chunk per line, like a model emitting the agenda item by item
+            for line in behavior.reply.splitlines(keepends=True):
+                if behavior.chunk_delay_seconds:
+                    await asyncio.sleep(behavior.chunk_delay_seconds)
+                yield completion_chunk(line)
+            yield completion_chunk(finish_reason="stop")
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    return {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "fake",
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": behavior.reply},
+            "finish_reason": "stop",
+        }],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run the fake OpenAI server")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--chunk-delay", type=float, default=0.05, help="seconds between streamed chunks")
+    args = parser.parse_args()
+
+    behavior.chunk_delay_seconds = args.chunk_delay
+    uvicorn.run(app, host="127.0.0.1", port=args.port)
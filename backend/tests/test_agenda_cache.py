@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+from app.services.agenda_cache import AgendaCache, cache_key
+
+pytestmark = pytest.mark.anyio
+
+REQUEST = {"message": "budget, welcome, open discussion", "history": []}
+
+
+def messages(*contents) -> list:
+    return [{"role": "user", "content": content} for content in contents]
+
+
+def test_cache_key_ignores_case_and_whitespace():
+    key = cache_key("gpt-4o-mini", messages("Budget,  welcome"))
+
+    assert cache_key("gpt-4o-mini", messages(" budget, WELCOME\n")) == key
+    assert cache_key("gpt-4o-mini", messages("budget, welcome, lunch")) != key
+    assert cache_key("gpt-4o-mini", [{"role": "assistant", "content": "budget, welcome"}]) != key
+    assert cache_key("gpt-4o", messages("budget, welcome")) != key
+
+
+async def test_repeat_request_is_answered_without_calling_the_model(client, fake_llm):
+    first = await client.post("/api/agenda", json=REQUEST)
+    second = await client.post("/api/agenda", json={**REQUEST, "message": REQUEST["message"].upper()})
+
+    assert first.json() == {"response": fake_llm.reply, "cached": False}
+    assert second.json() == {"response": fake_llm.reply, "cached": True}
+    assert len(fake_llm.requests) == 1
+
+    # A different conversation is a different agenda
+    followup = {"message": "add lunch", "history": [{"role": "user", "content": REQUEST["message"]}]}
+    assert (await client.post("/api/agenda", json=followup)).json()["cached"] is False
+
+
+async def test_failed_requests_are_not_cached(client, fake_llm):
+    fake_llm.fail_status = 400
+    await client.post("/api/agenda", json=REQUEST)
+
+    fake_llm.fail_status = 0
+    response = await client.post("/api/agenda", json=REQUEST)
+
+    assert response.json() == {"response": fake_llm.reply, "cached": False}
+    assert len(fake_llm.requests) == 2
+
+
+def test_disk_cache_survives_a_restart(tmp_path, monkeypatch):
+    AgendaCache(max_entries=10, ttl_seconds=60, directory=tmp_path).set("key", "1. Welcome")
+
+    # A new process (or another worker) starts with an empty memory cache
+    restarted = AgendaCache(max_entries=10, ttl_seconds=60, directory=tmp_path)
+    assert restarted.get("key") == "1. Welcome"
+    assert restarted.disk_hits == 1
+
+    created = os.path.getmtime(tmp_path / "key.json")
+    monkeypatch.setattr("app.services.agenda_cache.time.time", lambda: created + 61)
+    expired = AgendaCache(max_entries=10, ttl_seconds=60, directory=tmp_path)
+    assert expired.get("key") is None
+    assert not (tmp_path / "key.json").exists()
+
+
+def test_disk_cache_is_pruned_to_max_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr("app.services.agenda_cache.PRUNE_EVERY", 5)
+    cache = AgendaCache(max_entries=3, ttl_seconds=60, directory=tmp_path)
+    for i in range(5):
+        cache.set(f"key-{i}", "agenda")
+        os.utime(tmp_path / f"key-{i}.json", (i, i))  # oldest first
+
+    assert sorted(path.name for path in tmp_path.glob("*.json")) == ["key-2.json", "key-3.json", "key-4.json"]
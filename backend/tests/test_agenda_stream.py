@@ -0,0 +1,84 @@
+import json
+
+import pytest
+from starlette.requests import ClientDisconnect
+
+from app.models.schemas import AgendaRequest
+from app.routers.agenda import stream_agenda_response
+from app.services.resilience import llm_gate
+
+pytestmark = pytest.mark.anyio
+
+REQUEST = {"message": "budget, welcome, open discussion", "history": []}
+
+
+def parse_sse(body: str) -> list:
+    """(event, data) pairs from a Server-Sent Events body."""
+    frames = []
+    for frame in body.strip().split("\n\n"):
+        event, data = "message", None
+        for line in frame.splitlines():
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: "):
+                data = json.loads(line[len("data: "):])
+        frames.append((event, data))
+    return frames
+
+
+async def test_streams_agenda_as_it_is_generated(client, fake_llm):
+    response = await client.post("/api/agenda/stream", json=REQUEST)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    frames = parse_sse(response.text)
+    deltas = [data["delta"] for event, data in frames if event == "message"]
+    assert len(deltas) == len(fake_llm.reply.splitlines())
+    assert "".join(deltas) == fake_llm.reply
+    assert frames[-1] == ("done", {"cached": False})
+    assert fake_llm.requests[0]["stream"] is True
+    assert llm_gate.in_flight == 0
+
+
+async def test_repeat_request_is_served_from_cache(client, fake_llm):
+    await client.post("/api/agenda/stream", json=REQUEST)
+    response = await client.post("/api/agenda/stream", json={**REQUEST, "message": "  Budget, WELCOME, open discussion "})
+
+    frames = parse_sse(response.text)
+    assert frames == [("message", {"delta": fake_llm.reply}), ("done", {"cached": True})]
+    assert len(fake_llm.requests) == 1
+
+
+async def test_upstream_outage_is_a_503_before_the_stream_starts(client, fake_llm, monkeypatch):
+    monkeypatch.setattr("app.services.resilience.MAX_RETRIES", 0)
+    fake_llm.fail_status = 500
+
+    response = await client.post("/api/agenda/stream", json=REQUEST)
+
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+    assert llm_gate.in_flight == 0
+
+
+async def test_non_streaming_agenda_uses_the_same_backend(client, fake_llm):
+    response = await client.post("/api/agenda", json=REQUEST)
+
+    assert response.status_code == 200
+    assert response.json() == {"response": fake_llm.reply, "cached": False}
+
+
+async def test_client_gone_before_the_body_starts_releases_the_slot(fake_llm):
+    response = await stream_agenda_response(AgendaRequest(**REQUEST))
+    assert llm_gate.in_flight == 1
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        raise OSError("connection reset")  # what the server raises for a closed socket
+
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+    with pytest.raises(ClientDisconnect):
+        await response(scope, receive, send)
+
+    assert llm_gate.in_flight == 0
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.routers.calendar import feed_versions
+from app.services.ics import render_vtimezone
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_empty_feed_is_an_empty_calendar(client):
+    # An organization whose events are all long past still has a feed
+    old = datetime(2020, 1, 6, 17, tzinfo=timezone.utc)
+    await client.post("/events/", json={
+        "title": "Mixer",
+        "organization": "Black Student Union",
+        "start_time": old.isoformat(),
+        "end_time": (old + timedelta(hours=1)).isoformat(),
+    })
+
+    for path in ("/calendar/all.ics", "/calendar/Black%20Student%20Union.ics"):
+        response = await client.get(path)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/calendar")
+        assert response.text.startswith("BEGIN:VCALENDAR\r\n")
+        assert response.text.endswith("END:VCALENDAR\r\n")
+        assert "BEGIN:VEVENT" not in response.text
+
+        repeat = await client.get(path, headers={"If-None-Match": response.headers["etag"]})
+        assert repeat.status_code == 304
+
+    assert "X-WR-CALNAME:MCC - Black Student Union" in (await client.get("/calendar/BLACKSTUDENTUNION.ics")).text
+
+
+async def test_unknown_organization_feed_is_a_404(client):
+    response = await client.get("/calendar/no-such-organization.ics")
+
+    assert response.status_code == 404
+    assert feed_versions.get("NO-SUCH-ORGANIZATION") is None  # nothing kept for made-up names
+
+
+async def test_feed_keeps_last_modified_across_identical_renders(client):
+    start = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=1)
+    event = {
+        "title": "Mixer",
+        "organization": "MEChA",
+        "start_time": start.isoformat(),
+        "end_time": (start + timedelta(hours=1)).isoformat(),
+    }
+    first = await client.get("/calendar/all.ics")
+
+    # A write clears the feed cache; an event outside the feeds' window
+    # (and its deletion) re-renders the same body
+    created = (await client.post("/events/", json={**event, "start_time": "2020-01-06T17:00:00Z", "end_time": "2020-01-06T18:00:00Z"})).json()
+    await client.delete(f"/events/{created['id']}")
+    again = await client.get("/calendar/all.ics")
+    assert again.headers["last-modified"] == first.headers["last-modified"]
+
+    await client.post("/events/", json=event)
+    assert (await client.get("/calendar/all.ics")).headers["etag"] != first.headers["etag"]
+
+
+def test_timezone_definition_is_rendered_per_year():
+    render_vtimezone.cache_clear()
+
+    render_vtimezone(2025)
+    render_vtimezone(2026)
+    render_vtimezone(2026)
+
+    assert render_vtimezone.cache_info().misses == 2
+
+
+async def test_feed_defines_the_timezone_its_events_use(client):
+    start = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=1)
+    await client.post("/events/", json={
+        "title": "Office hours",
+        "organization": "Black Student Union",
+        "start_time": start.isoformat(),
+        "end_time": (start + timedelta(hours=1)).isoformat(),
+        "recurrence_rule": "FREQ=WEEKLY",
+    })
+
+    feed = (await client.get("/calendar/BLACKSTUDENTUNION.ics")).text
+
+    assert "DTSTART;TZID=America/Los_Angeles:" in feed
+    timezone_block = feed[feed.index("BEGIN:VTIMEZONE"):feed.index("END:VTIMEZONE")]
+    assert "TZID:America/Los_Angeles\r\n" in timezone_block
+    assert "BEGIN:DAYLIGHT\r\nDTSTART:19700308T020000\r\nRRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=2SU\r\n" in timezone_block
+    assert "BEGIN:STANDARD\r\nDTSTART:19701101T020000\r\nRRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=1SU\r\n" in timezone_block
+    assert feed.index("END:VTIMEZONE") < feed.index("BEGIN:VEVENT")
@@ -0,0 +1,89 @@
+from datetime import timedelta
+
+import pytest
+
+from .test_events import MONDAY, create, event
+
+pytestmark = pytest.mark.anyio
+
+
+async def conflicts(client, start, end, **params) -> list:
+    response = await client.get("/events/conflicts", params={
+        "start": start.isoformat(), "end": end.isoformat(), **params,
+    })
+    assert response.status_code == 200, response.text
+    return [item["title"] for item in response.json()]
+
+
+async def test_overlapping_events_are_conflicts(client):
+    await create(client, title="Meeting", start=MONDAY, hours=2)
+    await create(client, title="Before", start=MONDAY - timedelta(hours=1))  # ends as Meeting starts
+    await create(client, title="Other org", start=MONDAY, organization="MEChA")
+
+    assert await conflicts(client, MONDAY + timedelta(hours=1), MONDAY + timedelta(hours=3)) == ["Meeting"]
+    assert sorted(await conflicts(client, MONDAY, MONDAY + timedelta(minutes=30))) == ["Meeting", "Other org"]
+    assert await conflicts(client, MONDAY, MONDAY + timedelta(hours=1), organization="MEChA") == ["Other org"]
+    # Back to back is not a conflict
+    assert await conflicts(client, MONDAY + timedelta(hours=2), MONDAY + timedelta(hours=3)) == []
+
+
+async def test_recurring_occurrences_are_conflicts(client):
+    await create(client, title="Office hours", start=MONDAY, recurrence_rule="FREQ=WEEKLY;COUNT=4")
+
+    third_week = MONDAY + timedelta(weeks=2)
+    assert await conflicts(client, third_week, third_week + timedelta(minutes=30)) == ["Office hours"]
+    assert await conflicts(client, third_week + timedelta(days=1), third_week + timedelta(days=1, hours=1)) == []
+    after_series = MONDAY + timedelta(weeks=4)
+    assert await conflicts(client, after_series, after_series + timedelta(hours=1)) == []
+
+
+async def test_exclude_id_ignores_the_event_being_edited(client):
+    meeting = await create(client, title="Meeting", start=MONDAY)
+
+    assert await conflicts(client, MONDAY, MONDAY + timedelta(hours=1), exclude_id=meeting["id"]) == []
+
+
+async def test_reversed_window_is_a_400(client):
+    response = await client.get("/events/conflicts", params={
+        "start": MONDAY.isoformat(), "end": MONDAY.isoformat(),
+    })
+
+    assert response.status_code == 400
+
+
+async def test_strict_create_refuses_an_overlap(client):
+    await create(client, title="Meeting", start=MONDAY)
+    overlapping = event("Mixer", MONDAY + timedelta(minutes=30))
+
+    response = await client.post("/events/", params={"strict": "true"}, json=overlapping)
+
+    assert response.status_code == 409
+    assert [item["title"] for item in response.json()["detail"]["conflicts"]] == ["Meeting"]
+    assert [item["title"] for item in (await client.get("/events/")).json()] == ["Meeting"]
+
+    # Without strict the overlap is allowed
+    assert (await client.post("/events/", json=overlapping)).status_code == 201
+
+
+async def test_strict_recurring_create_checks_every_occurrence(client):
+    await create(client, title="Meeting", start=MONDAY + timedelta(weeks=3))
+    weekly = event("Office hours", MONDAY, recurrence_rule="FREQ=WEEKLY")
+
+    response = await client.post("/events/", params={"strict": "true"}, json=weekly)
+
+    assert response.status_code == 409
+    assert [item["title"] for item in response.json()["detail"]["conflicts"]] == ["Meeting"]
+
+
+async def test_strict_update_refuses_an_overlap(client):
+    await create(client, title="Meeting", start=MONDAY)
+    mixer = await create(client, title="Mixer", start=MONDAY + timedelta(hours=2))
+    moved = {"start_time": (MONDAY + timedelta(minutes=30)).isoformat(), "end_time": (MONDAY + timedelta(hours=1, minutes=30)).isoformat()}
+
+    response = await client.put(f"/events/{mixer['id']}", params={"strict": "true"}, json=moved)
+    assert response.status_code == 409
+    assert (await client.get(f"/events/{mixer['id']}")).json()["start_time"] == mixer["start_time"]
+
+    # The event doesn't conflict with itself
+    renamed = await client.put(f"/events/{mixer['id']}", params={"strict": "true"}, json={"title": "Social"})
+    assert renamed.status_code == 200
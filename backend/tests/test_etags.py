@@ -0,0 +1,90 @@
+from datetime import timedelta
+
+import pytest
+
+from app.services.http_cache import make_etag
+
+from .test_events import MONDAY, create
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_unchanged_listing_is_a_304(client):
+    await create(client, title="Mixer", start=MONDAY)
+
+    first = await client.get("/events/", params={"organization": "Black Student Union"})
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+
+    repeat = await client.get("/events/", params={"organization": "Black Student Union"}, headers={"If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert repeat.headers["etag"] == etag
+
+    # Different parameters are a different response
+    other = await client.get("/events/", params={"organization": "MCC"}, headers={"If-None-Match": etag})
+    assert other.status_code == 200
+
+
+async def test_every_kind_of_write_changes_the_listing_etag(client):
+    created = await create(client, title="Mixer", start=MONDAY)
+    etags = [(await client.get("/events/")).headers["etag"]]
+
+    await create(client, title="Workshop", start=MONDAY + timedelta(days=1))
+    etags.append((await client.get("/events/")).headers["etag"])
+    await client.put(f"/events/{created['id']}", json={"title": "Mixer, moved"})
+    etags.append((await client.get("/events/")).headers["etag"])
+    await client.delete(f"/events/{created['id']}")
+
+    response = await client.get("/events/", headers={"If-None-Match": ", ".join(etags)})
+    assert response.status_code == 200
+    assert response.headers["etag"] not in etags
+    assert len(set(etags)) == 3
+
+
+async def test_bulk_writes_change_the_listing_etag(client):
+    created = await create(client, title="Mixer", start=MONDAY)
+    etags = [(await client.get("/events/")).headers["etag"]]
+
+    await client.patch("/events/bulk", json={"ids": [created["id"]], "changes": {"title": "Social"}})
+    etags.append((await client.get("/events/")).headers["etag"])
+    await client.post("/events/bulk-delete", json={"ids": [created["id"]]})
+    etags.append((await client.get("/events/")).headers["etag"])
+
+    assert len(set(etags)) == 3
+    # The version is the change log's newest seq, the delta sync token
+    token = (await client.get("/events/changes")).json()["token"]
+    assert etags[-1] == make_etag("events", token, 0, 100, None, None, None, None)
+
+
+async def test_single_event_etag_follows_its_updates(client):
+    created = await create(client, title="Mixer", start=MONDAY)
+    path = f"/events/{created['id']}"
+
+    etag = (await client.get(path)).headers["etag"]
+    assert (await client.get(path, headers={"If-None-Match": etag})).status_code == 304
+
+    await client.put(path, json={"description": "Bring a friend"})
+    updated = await client.get(path, headers={"If-None-Match": etag})
+    assert updated.status_code == 200
+    assert updated.json()["description"] == "Bring a friend"
+
+    await client.delete(path)
+    assert (await client.get(path, headers={"If-None-Match": updated.headers["etag"]})).status_code == 404
+
+
+async def test_page_etag(client):
+    await create(client, title="Mixer", start=MONDAY)
+
+    etag = (await client.get("/events/page")).headers["etag"]
+    assert (await client.get("/events/page", headers={"If-None-Match": etag})).status_code == 304
+    assert (await client.get("/events/page", params={"limit": 1}, headers={"If-None-Match": etag})).status_code == 200
+
+
+@pytest.mark.parametrize("header", ["*", 'W/{etag}', '"stale", {etag}'])
+async def test_if_none_match_forms(client, header):
+    await create(client, title="Mixer", start=MONDAY)
+    etag = (await client.get("/events/")).headers["etag"]
+
+    response = await client.get("/events/", headers={"If-None-Match": header.format(etag=etag)})
+    assert response.status_code == 304
@@ -0,0 +1,95 @@
+from datetime import timedelta
+
+import pytest
+
+from app.services.cache import TTLCache
+from app.services.event_cache import event_list_cache
+
+from .test_events import MONDAY, create
+
+pytestmark = pytest.mark.anyio
+
+
+async def listing(client, **params) -> tuple:
+    """(titles, served from cache) for a GET /events."""
+    hits = event_list_cache.hits
+    response = await client.get("/events/", params=params)
+    assert response.status_code == 200
+    return [item["title"] for item in response.json()], event_list_cache.hits > hits
+
+
+async def test_repeat_listing_is_served_from_cache(client):
+    await create(client, title="Mixer", start=MONDAY)
+
+    assert await listing(client) == (["Mixer"], False)
+    assert await listing(client) == (["Mixer"], True)
+
+
+async def test_write_only_drops_listings_it_could_appear_in(client):
+    await create(client, title="Mixer", start=MONDAY)
+    await listing(client, organization="Black Student Union")
+    await listing(client, organization="MCC")
+
+    await create(client, title="Workshop", start=MONDAY, organization="MCC")
+
+    assert await listing(client, organization="Black Student Union") == (["Mixer"], True)
+    assert await listing(client, organization="MCC") == (["Workshop"], False)
+
+
+async def test_window_listings_are_kept_for_writes_outside_them(client):
+    window = {"start": MONDAY.isoformat(), "end": (MONDAY + timedelta(days=1)).isoformat()}
+    await listing(client, **window)
+
+    await create(client, title="Next week", start=MONDAY + timedelta(days=7))
+    assert await listing(client, **window) == ([], True)
+
+    # Starts the evening before, still running in the window
+    await create(client, title="Overnight", start=MONDAY - timedelta(hours=2), hours=3)
+    assert await listing(client, **window) == (["Overnight"], False)
+
+
+async def test_update_drops_listings_the_event_moved_out_of(client):
+    created = await create(client, title="Mixer", start=MONDAY)
+    await listing(client, organization="Black Student Union")
+    await listing(client, organization="MCC")
+
+    await client.put(f"/events/{created['id']}", json={"organization": "MCC"})
+
+    assert await listing(client, organization="Black Student Union") == ([], False)
+    assert await listing(client, organization="MCC") == (["Mixer"], False)
+
+    await client.delete(f"/events/{created['id']}")
+    assert await listing(client, organization="MCC") == ([], False)
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+    assert cache.evictions == 1
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("app.services.cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(max_entries=2, ttl_seconds=30)
+    cache.set("a", 1)
+
+    now[0] += 29
+    assert cache.get("a") == 1
+    now[0] += 1
+    assert cache.get("a") is None
+    assert cache.expirations == 1
+
+
+def test_ttl_cache_skips_values_computed_before_an_invalidation():
+    cache = TTLCache()
+    generation = cache.generation
+    cache.invalidate("a")  # a write lands while the value is being computed
+
+    assert cache.set("a", "stale", generation=generation) is False
+    assert cache.get("a") is None
@@ -0,0 +1,82 @@
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.routers.events import stream_event_changes
+from app.services.broker import EventBroker, change_message
+
+from .test_agenda_stream import parse_sse
+from .test_events import MONDAY, create
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def broker(monkeypatch):
+    """A fresh in-memory broker, for both publishing and the stream endpoint."""
+    broker = EventBroker(max_queue=2, max_subscribers=5)
+    monkeypatch.setattr("app.services.broker.event_broker", broker)
+    monkeypatch.setattr("app.routers.events.event_broker", broker)
+    return broker
+
+
+async def open_stream(broker):
+    """
+    The stream's frames as an async iterator. The endpoint is called
+    directly because the test client buffers the whole (endless) body.
+    """
+    request = Request({"type": "http", "method": "GET", "path": "/events/stream", "headers": []})
+    response = await stream_event_changes(request)
+    assert response.media_type == "text/event-stream"
+    return response.body_iterator
+
+
+async def next_frame(frames) -> tuple:
+    [frame] = parse_sse(await frames.__anext__())
+    return frame
+
+
+async def test_writes_are_pushed_to_subscribers(client, broker):
+    frames = await open_stream(broker)
+    assert await next_frame(frames) == ("ready", {})
+
+    created = await create(client, title="Mixer", start=MONDAY)
+    await client.put(f"/events/{created['id']}", json={"title": "Social"})
+    assert await next_frame(frames) == ("message", {"op": "upsert", "ids": [created["id"]], "count": 1})
+    assert await next_frame(frames) == ("message", {"op": "upsert", "ids": [created["id"]], "count": 1})
+
+    await client.delete(f"/events/{created['id']}")
+    assert await next_frame(frames) == ("message", {"op": "delete", "ids": [created["id"]], "count": 1})
+
+    await frames.aclose()
+    assert broker.stats()["subscribers"] == 0
+
+
+async def test_slow_subscriber_is_told_to_resync(client, broker):
+    frames = await open_stream(broker)
+    await next_frame(frames)  # ready
+
+    for i in range(3):  # one more than the queue holds
+        await create(client, title=f"Event {i}", start=MONDAY + timedelta(hours=i))
+
+    assert await next_frame(frames) == ("resync", {})
+    with pytest.raises(StopAsyncIteration):
+        await frames.__anext__()
+    assert broker.stats()["dropped_subscribers"] == 1
+
+
+async def test_subscriber_limit_is_a_503(broker):
+    broker.max_subscribers = 0
+    request = Request({"type": "http", "method": "GET", "path": "/events/stream", "headers": []})
+
+    with pytest.raises(HTTPException) as error:
+        await stream_event_changes(request)
+
+    assert error.value.status_code == 503
+    assert "Retry-After" in error.value.headers
+
+
+def test_large_writes_send_only_the_count():
+    assert change_message("delete", list(range(500))) == {"op": "delete", "ids": [], "count": 500}
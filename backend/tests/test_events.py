@@ -0,0 +1,249 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+from sqlalchemy import delete, func, select
+
+from app.database.db import SessionLocal
+from app.database.models import Event, EventChange
+from app.services.durations import longest_event
+
+pytestmark = pytest.mark.anyio
+
+MONDAY = datetime(2025, 10, 6, 17, tzinfo=timezone.utc)  # 10am in Oregon
+
+
+def event(title: str, start: datetime, hours: float = 1, **fields) -> dict:
+    return {
+        "title": title,
+        "organization": "Black Student Union",
+        "start_time": start.isoformat(),
+        "end_time": (start + timedelta(hours=hours)).isoformat(),
+        **fields,
+    }
+
+
+async def create(client, **fields) -> dict:
+    response = await client.post("/events/", json=event(**fields))
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+async def test_cursor_pages_cover_every_event_once(client):
+    # Several events share a start time, so the id tie-break matters
+    for i in range(7):
+        await create(client, title=f"Event {i}", start=MONDAY + timedelta(hours=i // 3))
+
+    seen, cursor = [], None
+    while True:
+        response = await client.get("/events/page", params={"limit": 3, **({"cursor": cursor} if cursor else {})})
+        page = response.json()
+        seen += [item["id"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+        # Inserting before the cursor must not shift the following pages
+        await create(client, title="Earlier", start=MONDAY - timedelta(days=1))
+
+    listing = (await client.get("/events/", params={"limit": 100})).json()
+    expected = [item["id"] for item in listing if item["title"] != "Earlier"]
+    assert seen == expected
+
+
+async def test_invalid_cursor_is_a_400(client):
+    response = await client.get("/events/page", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+async def test_window_expands_recurring_events(client):
+    weekly = await create(client, title="Office hours", start=MONDAY, type="office_hours",
+                          recurrence_rule="FREQ=WEEKLY;COUNT=4")
+    await create(client, title="Mixer", start=MONDAY + timedelta(days=8))
+
+    response = await client.get("/events/", params={
+        "start": (MONDAY + timedelta(days=7)).isoformat(),
+        "end": (MONDAY + timedelta(days=21)).isoformat(),
+    })
+
+    items = response.json()
+    assert [item["title"] for item in items] == ["Office hours", "Mixer", "Office hours"]
+    assert {items[0]["id"], items[2]["id"]} == {weekly["id"]}
+    assert items[0]["recurrence_id"] == items[0]["start_time"]
+
+
+async def test_bulk_import_upserts_by_external_id(client):
+    rows = [event(f"Row {i}", MONDAY + timedelta(days=i), external_id=f"sheet-{i}") for i in range(3)]
+    rows.append({"title": "No times", "organization": "MCC"})
+
+    first = (await client.post("/events/bulk", json=rows)).json()
+    assert (first["created"], first["updated"], first["failed"]) == (3, 0, 1)
+    assert first["errors"][0]["row"] == 3
+
+    rows[0]["title"] = "Row 0, renamed"
+    second = (await client.post("/events/bulk", json={"events": rows[:3]})).json()
+    assert (second["created"], second["updated"]) == (0, 3)
+    assert second["ids"] == first["ids"]
+
+    titles = [item["title"] for item in (await client.get("/events/")).json()]
+    assert titles == ["Row 0, renamed", "Row 1", "Row 2"]
+
+
+async def test_changes_since_token(client):
+    token = (await client.get("/events/changes")).json()["token"]
+    created = await create(client, title="Created", start=MONDAY)
+    deleted = await create(client, title="Deleted", start=MONDAY)
+    await client.delete(f"/events/{deleted['id']}")
+
+    changes = (await client.get("/events/changes", params={"since": token})).json()
+
+    assert [item["id"] for item in changes["upserted"]] == [created["id"]]
+    assert changes["deleted"] == [deleted["id"]]
+    assert changes["has_more"] is False
+    assert changes["token"] > token
+
+
+async def test_pruned_change_token_is_gone(client):
+    token = (await client.get("/events/changes")).json()["token"]
+    for i in range(3):
+        await create(client, title=f"Event {i}", start=MONDAY)
+
+    # What the pruner does to entries past retention
+    async with SessionLocal() as db:
+        newest = await db.scalar(select(func.max(EventChange.seq)))
+        await db.execute(delete(EventChange).where(EventChange.seq < newest))
+        await db.commit()
+
+    assert (await client.get("/events/changes", params={"since": token})).status_code == 410
+    assert (await client.get("/events/changes", params={"since": newest + 5})).status_code == 410
+    assert (await client.get("/events/changes", params={"since": newest})).status_code == 200
+
+
+async def test_deleting_past_events_keeps_ongoing_series(client):
+    # The dashboard's "Delete Past Office Hours": {type, end: start of today}
+    today = MONDAY + timedelta(days=14)
+    weekly = await create(client, title="Weekly", start=MONDAY, type="office_hours", recurrence_rule="FREQ=WEEKLY")
+    finished = await create(client, title="Finished", start=MONDAY, type="office_hours", recurrence_rule="FREQ=DAILY;COUNT=3")
+    past = await create(client, title="Past", start=MONDAY + timedelta(days=1), type="office_hours")
+
+    selection = {"type": "office_hours", "end": today.isoformat()}
+    updated = await client.patch("/events/bulk", json={**selection, "changes": {"description": "archived"}})
+    assert updated.json() == {"affected": 2}
+    deleted = await client.post("/events/bulk-delete", json=selection)
+    assert deleted.json() == {"affected": 2}
+
+    remaining = (await client.get("/events/", params={
+        "start": today.isoformat(), "end": (today + timedelta(days=7)).isoformat(),
+    })).json()
+    assert [item["id"] for item in remaining] == [weekly["id"]]
+    assert remaining[0]["description"] is None
+    assert {finished["id"], past["id"]}.isdisjoint(item["id"] for item in (await client.get("/events/")).json())
+
+
+async def test_event_times_are_checked_on_write(client):
+    assert (await client.post("/events/", json=event("Backwards", MONDAY, hours=-1))).status_code == 422
+
+    created = await create(client, title="Exhibit", start=MONDAY, hours=24 * 14)
+    response = await client.put(f"/events/{created['id']}", json={"end_time": MONDAY.isoformat()})
+    assert response.status_code == 400
+
+    # Still listed in a window that starts long after it did
+    window = {"start": (MONDAY + timedelta(days=13)).isoformat(), "end": (MONDAY + timedelta(days=20)).isoformat()}
+    assert [item["id"] for item in (await client.get("/events/", params=window)).json()] == [created["id"]]
+
+
+async def test_long_events_stay_in_windows_that_start_after_them(client):
+    exhibit = await create(client, title="Exhibit", start=MONDAY, hours=24 * 60)
+    window = {"start": (MONDAY + timedelta(days=50)).isoformat(), "end": (MONDAY + timedelta(days=57)).isoformat()}
+    assert [item["id"] for item in (await client.get("/events/", params=window)).json()] == [exhibit["id"]]
+
+    # Written by another worker (or by hand): found once the bound is refreshed
+    async with SessionLocal() as db:
+        db.add(Event(title="Residency", organization="MCC", start_time=MONDAY, end_time=MONDAY + timedelta(days=500)))
+        await db.commit()
+        await longest_event.refresh(db)
+    window = {"start": (MONDAY + timedelta(days=400)).isoformat(), "end": (MONDAY + timedelta(days=407)).isoformat()}
+    assert [item["title"] for item in (await client.get("/events/", params=window)).json()] == ["Residency"]
+
+
+async def test_update_rejects_null_for_required_fields(client):
+    created = await create(client, title="Mixer", start=MONDAY)
+
+    for field in ("title", "organization", "type", "start_time", "end_time"):
+        response = await client.put(f"/events/{created['id']}", json={field: None})
+        assert response.status_code == 422, field
+
+    # Nullable fields can still be cleared
+    response = await client.put(f"/events/{created['id']}", json={"description": None, "external_id": None})
+    assert response.status_code == 200
+    assert (await client.get(f"/events/{created['id']}")).json()["title"] == "Mixer"
+
+
+async def test_update_to_a_taken_external_id_is_a_409(client):
+    await create(client, title="Row 1", start=MONDAY, external_id="sheet-1")
+    other = await create(client, title="Row 2", start=MONDAY, external_id="sheet-2")
+
+    response = await client.put(f"/events/{other['id']}", json={"external_id": "sheet-1"})
+
+    assert response.status_code == 409
+    assert "sheet-1" in response.json()["detail"]
+
+
+async def test_csv_export_can_be_reimported(client):
+    await create(client, title="Office hours", start=MONDAY, type="office_hours", external_id="oh",
+                 recurrence_rule="FREQ=WEEKLY;COUNT=4", recurrence_exdates=[(MONDAY + timedelta(days=7)).isoformat()])
+    await create(client, title='Mixer, with "quotes"', start=MONDAY + timedelta(days=1), description="Line one\nline two")
+
+    exported = await client.get("/events/export", params={"format": "csv"})
+    before = (await client.get("/events/")).json()
+    await client.post("/events/bulk-delete", json={"ids": [item["id"] for item in before]})
+
+    response = await client.post("/events/bulk", content=exported.content, headers={"Content-Type": "text/csv"})
+    assert response.json()["failed"] == 0, response.text
+
+    fields = ("title", "description", "organization", "type", "start_time", "end_time",
+              "external_id", "recurrence_rule", "recurrence_exdates")
+    after = (await client.get("/events/")).json()
+    assert [{field: item[field] for field in fields} for item in after] == [{field: item[field] for field in fields} for item in before]
+
+
+async def test_bulk_update_changes_times_only_together(client):
+    created = await create(client, title="Event", start=MONDAY)
+    later = (MONDAY + timedelta(hours=3)).isoformat()
+
+    for changes in ({"start_time": later}, {"end_time": MONDAY.isoformat()}):
+        response = await client.patch("/events/bulk", json={"ids": [created["id"]], "changes": changes})
+        assert response.status_code == 400, changes
+    unset_end = {"start_time": later, "end_time": None}
+    assert (await client.patch("/events/bulk", json={"ids": [created["id"]], "changes": unset_end})).status_code == 422
+
+    backwards = {"start_time": later, "end_time": MONDAY.isoformat()}
+    assert (await client.patch("/events/bulk", json={"ids": [created["id"]], "changes": backwards})).status_code == 422
+
+    moved = {"start_time": later, "end_time": (MONDAY + timedelta(hours=4)).isoformat()}
+    assert (await client.patch("/events/bulk", json={"ids": [created["id"]], "changes": moved})).json() == {"affected": 1}
+
+
+async def test_bulk_update_rejects_null_for_required_fields(client):
+    created = await create(client, title="Event", start=MONDAY)
+
+    for field in ("title", "organization", "type"):
+        response = await client.patch("/events/bulk", json={"ids": [created["id"]], "changes": {field: None}})
+        assert response.status_code == 422, field
+
+    cleared = await client.patch("/events/bulk", json={"ids": [created["id"]], "changes": {"description": None}})
+    assert cleared.json() == {"affected": 1}
+
+
+async def test_bulk_move_keeps_series_end(client):
+    series = await create(client, title="Office hours", start=MONDAY, recurrence_rule="FREQ=WEEKLY;COUNT=3")
+    moved = {"start_time": (MONDAY + timedelta(days=1)).isoformat(), "end_time": (MONDAY + timedelta(days=1, hours=2)).isoformat()}
+
+    await client.patch("/events/bulk", json={"ids": [series["id"]], "changes": moved})
+
+    async with SessionLocal() as db:
+        event = await db.get(Event, UUID(series["id"]))
+    assert event.recurrence_end.replace(tzinfo=timezone.utc) == MONDAY + timedelta(weeks=2, days=1, hours=2)
+
+    # Still known to be finished, so a cleanup of past events removes it
+    cleanup = await client.post("/events/bulk-delete", json={"end": (MONDAY + timedelta(weeks=3)).isoformat()})
+    assert cleanup.json() == {"affected": 1}
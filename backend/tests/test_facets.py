@@ -0,0 +1,86 @@
+from datetime import timedelta
+
+import pytest
+
+from .test_events import MONDAY, create
+
+pytestmark = pytest.mark.anyio
+
+
+async def facets(client, **params) -> dict:
+    response = await client.get("/events/facets", params={
+        name: value.isoformat() if hasattr(value, "isoformat") else value for name, value in params.items()
+    })
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def counts(items: list) -> dict:
+    return {item["value"]: item["count"] for item in items}
+
+
+async def test_organizations_are_normalized_and_counted(client):
+    await create(client, title="Mixer", start=MONDAY)
+    await create(client, title="Meeting", start=MONDAY, organization="black student union ")
+    await create(client, title="Office hours", start=MONDAY, organization="MEChA", type="office_hours")
+
+    result = await facets(client)
+
+    assert counts(result["organizations"]) == {"BLACKSTUDENTUNION": 2, "MECHA": 1}
+    assert counts(result["types"]) == {"event": 2, "office_hours": 1}
+    assert result["days"] is None
+
+
+async def test_days_are_counted_in_the_campus_timezone(client):
+    await create(client, title="Morning", start=MONDAY)
+    await create(client, title="Evening", start=MONDAY + timedelta(hours=10))  # 3am UTC Tuesday, 8pm Monday in Oregon
+    await create(client, title="Office hours", start=MONDAY, recurrence_rule="FREQ=DAILY;COUNT=3")
+
+    result = await facets(client, start=MONDAY - timedelta(hours=12), end=MONDAY + timedelta(days=7))
+
+    assert counts(result["days"]) == {"2025-10-06": 3, "2025-10-07": 1, "2025-10-08": 1}
+    # Occurrences in the window count one each
+    assert counts(result["organizations"]) == {"BLACKSTUDENTUNION": 5}
+
+
+async def test_events_running_into_the_window_count_on_its_first_day(client):
+    window_start = MONDAY - timedelta(hours=10)  # midnight in Oregon
+    await create(client, title="Exhibit", start=MONDAY - timedelta(days=2), hours=72)
+    await create(client, title="Lock-in", start=MONDAY - timedelta(days=1), hours=20, recurrence_rule="FREQ=DAILY;COUNT=2")
+
+    result = await facets(client, start=window_start, end=window_start + timedelta(days=7))
+
+    assert counts(result["days"]) == {"2025-10-06": 3}
+
+
+async def test_type_filter_and_window(client):
+    await create(client, title="Mixer", start=MONDAY)
+    await create(client, title="Office hours", start=MONDAY, type="office_hours")
+    await create(client, title="Next month", start=MONDAY + timedelta(days=40))
+
+    result = await facets(client, type="event", start=MONDAY - timedelta(days=1), end=MONDAY + timedelta(days=7))
+
+    assert counts(result["types"]) == {"event": 1}
+    assert counts(result["days"]) == {"2025-10-06": 1}
+
+
+async def test_writes_refresh_cached_facets(client):
+    mixer = await create(client, title="Mixer", start=MONDAY)
+    assert counts((await facets(client))["organizations"]) == {"BLACKSTUDENTUNION": 1}
+
+    await client.put(f"/events/{mixer['id']}", json={"organization": "MEChA"})
+    assert counts((await facets(client))["organizations"]) == {"MECHA": 1}
+
+    await client.patch("/events/bulk", json={"ids": [mixer["id"]], "changes": {"type": "office_hours"}})
+    assert counts((await facets(client))["types"]) == {"office_hours": 1}
+
+    await client.delete(f"/events/{mixer['id']}")
+    assert (await facets(client))["organizations"] == []
+
+
+async def test_window_longer_than_a_year_is_a_400(client):
+    response = await client.get("/events/facets", params={
+        "start": MONDAY.isoformat(), "end": (MONDAY + timedelta(days=400)).isoformat(),
+    })
+
+    assert response.status_code == 400
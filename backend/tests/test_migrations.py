@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.database.migrations import upgrade_schema
+from app.database.models import EventChange
+
+
+def test_upgrade_swaps_events_that_end_before_they_start():
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        # The events table as it was before recurrence and bulk import
+        connection.execute(text(
+            "CREATE TABLE events (id CHAR(32) PRIMARY KEY, title VARCHAR(255) NOT NULL, description TEXT, "
+            "organization VARCHAR(100) NOT NULL, type VARCHAR(20) NOT NULL, start_time DATETIME NOT NULL, "
+            "end_time DATETIME NOT NULL, created_at DATETIME, updated_at DATETIME)"
+        ))
+        EventChange.__table__.create(connection)
+        connection.execute(text(
+            "INSERT INTO events (id, title, organization, type, start_time, end_time) VALUES "
+            "('a', 'Reversed', 'MCC', 'event', '2025-10-06 18:00:00', '2025-10-06 17:00:00'), "
+            "('b', 'Fine', 'MCC', 'event', '2025-10-06 17:00:00', '2025-10-06 18:00:00')"
+        ))
+
+        upgrade_schema(connection)
+
+        rows = connection.execute(text("SELECT id, start_time, end_time FROM events ORDER BY id")).all()
+        indexes = {index["name"] for index in inspect(connection).get_indexes("events")}
+        changes = connection.execute(text("SELECT event_id, op FROM event_changes")).all()
+
+    assert [(id, datetime.fromisoformat(start).hour, datetime.fromisoformat(end).hour) for id, start, end in rows] == [
+        ("a", 17, 18),
+        ("b", 17, 18),
+    ]
+    assert "ix_events_start_time_id" in indexes
+    # Logged, so delta sync clients and listing ETags pick up the fix
+    assert changes == [("a", "upsert")]
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.recurrence import EVENT_TIMEZONE, expand_occurrences, parse_rrule, series_end
+
+UTC = timezone.utc
+
+
+def local(*args) -> datetime:
+    return datetime(*args, tzinfo=EVENT_TIMEZONE)
+
+
+def series(rule: str, start: datetime, hours: float = 1, exdates=()):
+    return SimpleNamespace(
+        recurrence_rule=rule,
+        start_time=start.astimezone(UTC),
+        end_time=(start + timedelta(hours=hours)).astimezone(UTC),
+        recurrence_exdates=[value.astimezone(UTC).isoformat() for value in exdates],
+    )
+
+
+def starts(event, window_start: datetime, window_end: datetime) -> list:
+    return [occurrence.start_time.astimezone(EVENT_TIMEZONE) for occurrence in expand_occurrences(event, window_start, window_end)]
+
+
+@pytest.mark.parametrize("rule", [
+    "FREQ=MONTHLY",
+    "FREQ=WEEKLY;BYMONTH=1",
+    "FREQ=DAILY;BYDAY=MO",
+    "FREQ=WEEKLY;COUNT=3;UNTIL=20260101",
+    "FREQ=WEEKLY;INTERVAL=0",
+    "FREQ=WEEKLY;BYDAY=XX",
+])
+def test_rejects_unsupported_rules(rule):
+    with pytest.raises(ValueError):
+        parse_rrule(rule)
+
+
+def test_weekly_byday_in_window():
+    # Tuesday / Thursday office hours from Tue Sep 30 2025
+    event = series("FREQ=WEEKLY;BYDAY=TU,TH", local(2025, 9, 30, 10))
+
+    assert starts(event, local(2025, 10, 6), local(2025, 10, 13)) == [local(2025, 10, 7, 10), local(2025, 10, 9, 10)]
+
+
+def test_keeps_wall_clock_time_across_dst():
+    # US daylight saving ends Sun Nov 2 2025
+    event = series("FREQ=WEEKLY", local(2025, 10, 27, 10))
+
+    before, after = starts(event, local(2025, 10, 27), local(2025, 11, 4))
+    assert (before.hour, after.hour) == (10, 10)
+    assert after.astimezone(UTC) - before.astimezone(UTC) == timedelta(days=7, hours=1)
+
+
+def test_skips_cancelled_occurrences():
+    event = series("FREQ=DAILY;COUNT=5", local(2025, 11, 24, 9), exdates=[local(2025, 11, 27, 9)])
+
+    assert [value.day for value in starts(event, local(2025, 11, 1), local(2025, 12, 31))] == [24, 25, 26, 28]
+
+
+def test_count_is_honored_when_the_window_is_late_in_the_series():
+    event = series("FREQ=WEEKLY;COUNT=10", local(2025, 1, 6, 12))
+
+    assert starts(event, local(2025, 3, 1), local(2025, 3, 31)) == [local(2025, 3, 3, 12), local(2025, 3, 10, 12)]
+    assert starts(event, local(2025, 3, 11), local(2025, 12, 31)) == []
+
+
+def test_occurrence_running_into_the_window_is_included():
+    event = series("FREQ=DAILY", local(2025, 5, 1, 23), hours=2)
+
+    assert starts(event, local(2025, 5, 3, 0, 30), local(2025, 5, 3, 1)) == [local(2025, 5, 2, 23)]
+
+
+def test_series_end():
+    start = local(2025, 9, 30, 10)
+
+    assert series_end("FREQ=WEEKLY;COUNT=3", start, start + timedelta(hours=1)) == local(2025, 10, 14, 11).astimezone(UTC)
+    assert series_end("FREQ=DAILY;UNTIL=20251002", start, start + timedelta(hours=1)) == local(2025, 10, 2, 11).astimezone(UTC)
+    assert series_end("FREQ=WEEKLY", start, start + timedelta(hours=1)) is None
+    assert series_end(None, start, start + timedelta(hours=1)) is None
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from app.services import ai, resilience
+from app.services.resilience import CircuitBreaker, LLMError, LLMUnavailableError, call_llm, llm_breaker
+
+pytestmark = pytest.mark.anyio
+
+
+def test_half_open_breaker_lets_one_probe_through(monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: clock[0])
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    clock[0] = 31
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()  # the probe is still in flight
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock[0] = 62
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow() and breaker.allow()
+
+
+async def test_concurrent_calls_while_half_open(monkeypatch, fake_llm):
+    monkeypatch.setattr(resilience, "MAX_RETRIES", 0)
+    monkeypatch.setattr(llm_breaker, "opened_at", resilience.time.monotonic() - llm_breaker.reset_seconds)
+    release = asyncio.Event()
+    calls = []
+
+    async def slow_upstream():
+        calls.append(1)
+        await release.wait()
+        return "ok"
+
+    probe = asyncio.create_task(call_llm(slow_upstream))
+    while not calls:
+        await asyncio.sleep(0)
+    with pytest.raises(LLMUnavailableError):
+        await call_llm(slow_upstream)
+    assert len(calls) == 1
+
+    release.set()
+    assert await probe == "ok"
+    assert llm_breaker.state == "closed"
+
+
+async def test_probe_without_a_verdict_frees_the_slot(monkeypatch, fake_llm):
+    monkeypatch.setattr(llm_breaker, "opened_at", resilience.time.monotonic() - llm_breaker.reset_seconds)
+    fake_llm.fail_status = 400
+
+    with pytest.raises(LLMError):
+        await call_llm(lambda: ai.client.chat.completions.create(model="fake", messages=[]))
+    assert llm_breaker.state == "half_open"
+    assert not llm_breaker.probing  # the next call gets to probe
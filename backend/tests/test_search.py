@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+import pytest
+
+from app.services.search import EventSearchIndex, to_prefix_tsquery
+
+from .test_events import MONDAY, create, event
+
+pytestmark = pytest.mark.anyio
+
+
+async def search(client, q: str, **params) -> list:
+    response = await client.get("/events/search", params={"q": q, **params})
+    assert response.status_code == 200, response.text
+    return [item["title"] for item in response.json()]
+
+
+def test_prefix_tsquery():
+    assert to_prefix_tsquery("Black  stud") == "black:* & stud:*"
+    assert to_prefix_tsquery(" - ") is None
+
+
+def test_index_matches_every_word_as_a_prefix():
+    index = EventSearchIndex()
+    index.build([
+        (1, "Black Student Union mixer", None, "BSU", "event"),
+        (2, "Blackboard workshop", None, "Library", "event"),
+    ])
+
+    assert sorted(event_id for event_id, _ in index.search("blac", 10)) == [1, 2]
+    assert [event_id for event_id, _ in index.search("blac stu", 10)] == [1]
+    assert index.search("blac chess", 10) == []
+    assert [event_id for event_id, _ in index.search("blac", 10, organization="Library")] == [2]
+
+    index.remove(1)
+    assert [event_id for event_id, _ in index.search("blac", 10)] == [2]
+
+
+async def test_title_matches_rank_above_organization_and_description(client):
+    await create(client, title="Study session", start=MONDAY, description="Bring your chess set")
+    await create(client, title="Game night", start=MONDAY, organization="Chess Club")
+    await create(client, title="Chess tournament", start=MONDAY)
+
+    assert await search(client, "ches") == ["Chess tournament", "Game night", "Study session"]
+
+
+async def test_filters_and_limit(client):
+    await create(client, title="Chess tournament", start=MONDAY)
+    await create(client, title="Chess office hours", start=MONDAY, type="office_hours")
+    await create(client, title="Chess social", start=MONDAY, organization="MEChA")
+
+    assert await search(client, "chess", type="office_hours") == ["Chess office hours"]
+    assert await search(client, "chess", organization="MEChA") == ["Chess social"]
+    assert len(await search(client, "chess", limit=2)) == 2
+
+
+async def test_index_follows_writes(client):
+    tournament = await create(client, title="Chess tournament", start=MONDAY)
+    assert await search(client, "chess") == ["Chess tournament"]  # builds the index
+
+    await create(client, title="Chess social", start=MONDAY + timedelta(days=1))
+    await client.put(f"/events/{tournament['id']}", json={"title": "Go tournament"})
+    assert await search(client, "chess") == ["Chess social"]
+    assert await search(client, "go tour") == ["Go tournament"]
+
+    await client.post("/events/bulk", json=[event("Chess lessons", MONDAY, external_id="sheet-1")])
+    assert sorted(await search(client, "chess")) == ["Chess lessons", "Chess social"]
+
+    await client.patch("/events/bulk", json={"ids": [tournament["id"]], "changes": {"title": "Chess again"}})
+    assert sorted(await search(client, "chess")) == ["Chess again", "Chess lessons", "Chess social"]
+
+    await client.delete(f"/events/{tournament['id']}")
+    assert sorted(await search(client, "chess")) == ["Chess lessons", "Chess social"]
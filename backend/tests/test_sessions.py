@@ -0,0 +1,154 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import delete, select
+
+from app.database.db import SessionLocal
+from app.database.models import AdminSession, Profile
+from app.main import app
+from app.routers import auth
+from app.services.sessions import DatabaseSessionStore, MemorySessionStore, admin_profile_cache
+
+pytestmark = pytest.mark.anyio
+
+EMAIL = "admin@uoregon.edu"
+
+
+@pytest.fixture(params=["memory", "database"])
+def store(request, monkeypatch):
+    """Each session store in turn, as the one the auth router uses."""
+    store = MemorySessionStore() if request.param == "memory" else DatabaseSessionStore()
+    monkeypatch.setattr(auth, "session_store", store)
+    return store
+
+
+@pytest.fixture
+async def admin(client):
+    """An admin profile, with admin routes checking real sessions again."""
+    await add_admin(EMAIL)
+    app.dependency_overrides.pop(auth.get_current_admin)
+    admin_profile_cache.clear()
+    return EMAIL
+
+
+async def add_admin(email: str) -> None:
+    async with SessionLocal() as db:
+        db.add(Profile(email=email, role="admin"))
+        await db.commit()
+
+
+async def login(client, email: str = EMAIL) -> dict:
+    response = await client.post("/auth/login", json={"email": email})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['token']}"}
+
+
+async def test_login_verify_logout(client, admin, store):
+    headers = await login(client)
+
+    assert (await client.get("/auth/verify", headers=headers)).json() == {"valid": True, "email": EMAIL}
+    assert (await client.get("/auth/admins", headers=headers)).status_code == 200
+
+    assert (await client.post("/auth/logout", headers=headers)).json() == {"message": "Logged out successfully"}
+    assert (await client.get("/auth/verify", headers=headers)).status_code == 401
+    assert (await client.get("/auth/admins", headers=headers)).status_code == 401
+
+
+async def test_unknown_email_gets_no_session(client, admin, store):
+    response = await client.post("/auth/login", json={"email": "someone@uoregon.edu"})
+    assert response.status_code == 401
+
+
+async def test_expired_session_is_rejected_and_removed(client, admin, store, monkeypatch):
+    monkeypatch.setattr(auth, "SESSION_DURATION", timedelta(seconds=-1))
+    headers = await login(client)
+    token = headers["Authorization"].removeprefix("Bearer ")
+
+    response = await client.get("/auth/verify", headers=headers)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Session expired. Please login again."
+    assert await store.get(token) is None
+
+
+@pytest.mark.usefixtures("client")
+async def test_sweep_removes_only_expired_sessions(store):
+    now = datetime.now(timezone.utc)
+    for i in range(3):
+        await store.create(f"expired-{i}", EMAIL, now - timedelta(minutes=3 - i))
+    await store.create("current", EMAIL, now + timedelta(hours=1))
+
+    assert await store.sweep() == 3
+    assert await store.sweep() == 0
+    assert (await store.get("current"))["email"] == EMAIL
+    assert await store.get("expired-2") is None
+
+
+@pytest.mark.usefixtures("client")
+async def test_database_store_keeps_only_token_hashes():
+    store = DatabaseSessionStore()
+    expires = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(hours=1)
+    await store.create("secret-token", EMAIL, expires)
+
+    async with SessionLocal() as db:
+        stored = (await db.scalars(select(AdminSession.token_hash))).all()
+    assert len(stored) == 1 and "secret-token" not in stored[0]
+
+    # Shared by every worker: a fresh store (another process) sees it too
+    assert await DatabaseSessionStore().get("secret-token") == {"email": EMAIL, "expires": expires}
+    assert await store.delete("secret-token") is True
+    assert await store.delete("secret-token") is False
+
+
+async def test_admin_identity_is_cached_between_requests(client, admin):
+    headers = await login(client)
+    await client.get("/auth/admins", headers=headers)
+
+    # Removed behind the app's back: the cached identity is still accepted
+    async with SessionLocal() as db:
+        await db.delete(await db.scalar(select(Profile).where(Profile.email == EMAIL)))
+        await db.commit()
+    hits = admin_profile_cache.hits
+    assert (await client.get("/auth/admins", headers=headers)).status_code == 200
+    assert admin_profile_cache.hits == hits + 1
+
+    # ...until it expires
+    admin_profile_cache.clear()
+    assert (await client.get("/auth/admins", headers=headers)).status_code == 401
+
+
+async def test_removed_admin_is_locked_out_immediately(client, admin):
+    await add_admin("other@uoregon.edu")
+    headers, other = await login(client), await login(client, "other@uoregon.edu")
+    assert (await client.get("/auth/admins", headers=other)).status_code == 200
+
+    assert (await client.delete("/auth/admins/other@uoregon.edu", headers=headers)).status_code == 204
+    assert (await client.get("/auth/admins", headers=other)).status_code == 401
+
+
+async def test_database_sessions_are_cached_between_requests(client, admin, monkeypatch):
+    store = DatabaseSessionStore()
+    monkeypatch.setattr(auth, "session_store", store)
+    headers = await login(client)
+    await client.get("/auth/admins", headers=headers)
+
+    # Removed behind the app's back (e.g. logged out on another worker): still accepted
+    async with SessionLocal() as db:
+        await db.execute(delete(AdminSession))
+        await db.commit()
+    hits = store.cache.hits
+    assert (await client.get("/auth/admins", headers=headers)).status_code == 200
+    assert store.cache.hits == hits + 1
+
+    # ...until it expires
+    store.cache.clear()
+    assert (await client.get("/auth/admins", headers=headers)).status_code == 401
+
+
+async def test_logout_drops_the_cached_database_session(client, admin, monkeypatch):
+    monkeypatch.setattr(auth, "session_store", DatabaseSessionStore())
+    headers = await login(client)
+    assert (await client.get("/auth/admins", headers=headers)).status_code == 200
+
+    await client.post("/auth/logout", headers=headers)
+
+    assert (await client.get("/auth/admins", headers=headers)).status_code == 401
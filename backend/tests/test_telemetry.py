@@ -0,0 +1,66 @@
+import logging
+import uuid
+
+import pytest
+
+from app.services.telemetry import Histogram, PrometheusText
+
+from .test_events import MONDAY, create
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_responses_carry_server_timing(client):
+    await create(client, title="Mixer", start=MONDAY)
+
+    response = await client.get("/events/")
+
+    timing = response.headers["Server-Timing"]
+    assert timing.startswith("db;dur=")
+    assert "serialization;dur=" in timing and "total;dur=" in timing
+    assert 'desc="0 queries"' not in timing
+
+
+async def test_prometheus_metrics_use_route_templates(client):
+    await client.get(f"/events/{uuid.uuid4()}")
+    await client.get("/no/such/path")
+
+    response = await client.get("/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert '# TYPE mcc_http_request_duration_seconds histogram' in text
+    assert 'mcc_http_responses_total{method="GET",route="/events/{event_id}",status="404"}' in text
+    assert 'route="unmatched"' in text
+    assert "/no/such/path" not in text
+
+
+def test_prometheus_text_format():
+    histogram = Histogram((0.1, 1.0))
+    for seconds in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(seconds)
+    out = PrometheusText()
+    out.metric("requests_total", "counter", "Requests", [({"route": 'say "hi"\\\n'}, 2)])
+    out.histogram("latency_seconds", "Latency", [({}, histogram)])
+
+    lines = out.render().splitlines()
+
+    assert 'requests_total{route="say \\"hi\\"\\\\\\n"} 2' in lines
+    assert [line for line in lines if line.startswith("latency_seconds_bucket")] == [
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1.0"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+    ]
+    assert "latency_seconds_count 4" in lines
+
+
+async def test_slow_and_query_heavy_requests_are_logged(client, monkeypatch, caplog):
+    monkeypatch.setattr("app.services.telemetry.SLOW_QUERY_SECONDS", 0)
+    monkeypatch.setattr("app.services.telemetry.QUERY_COUNT_WARNING", 0)
+
+    with caplog.at_level(logging.WARNING, logger="app.services.telemetry"):
+        await client.get("/events/", params={"organization": "MEChA"})
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(message.startswith("Slow query") and "MEChA" in message for message in messages)
+    assert any("GET /events/ ran" in message and "N+1" in message for message in messages)
@@ -1,6 +1,6 @@
 "use client";
 
-import { useEffect, useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import { useRouter } from "next/navigation";
 import { API_URL } from "@/lib/constants";
 import { getAuthHeaders } from "@/lib/auth";
@@ -13,6 +13,7 @@ interface Event {
   id: string;
   title: string;
   organization: string;
+  type: string;
   start_time: string;
   end_time: string;
   description?: string;
@@ -38,6 +39,8 @@ export default function AdminDashboard() {
   const [editingEvent, setEditingEvent] = useState<Event | null>(null);
   const [deletingEvent, setDeletingEvent] = useState<Event | null>(null);
   const [isDeleting, setIsDeleting] = useState(false);
+  const [showDeletePast, setShowDeletePast] = useState(false);
+  const [isDeletingPast, setIsDeletingPast] = useState(false);
 
   // Admin management state
   const [admins, setAdmins] = useState<Admin[]>([]);
@@ -55,6 +58,9 @@ export default function AdminDashboard() {
   // View type filter (events vs office hours)
   const [viewType, setViewType] = useState<"event" | "office_hours">("event");
 
+  // Change token from GET /events/changes, so edits only fetch what changed
+  const changeToken = useRef<number | null>(null);
+
   useEffect(() => {
     // Check if user is logged in
     const token = localStorage.getItem("admin_token");
@@ -81,9 +87,28 @@ export default function AdminDashboard() {
     }
   }, [viewType]);
 
+  // Live updates: the server pushes a notification after every event write
+  // (by any admin) and we sync just the changes
+  useEffect(() => {
+    if (isLoading || !email) return;
+
+    const stream = new EventSource(`${apiUrl}/events/stream`);
+    stream.onmessage = () => syncEvents();
+    // Notifications may have been missed, start over from a full load
+    stream.addEventListener("resync", () => fetchEvents());
+
+    return () => stream.close();
+  }, [isLoading, email, viewType]);
+
   const fetchEvents = async () => {
     try {
       setEventsLoading(true);
+
+      // Take the change token first: changes made while the list loads are
+      // replayed by the next sync, never missed
+      const tokenResponse = await fetch(`${apiUrl}/events/changes`);
+      changeToken.current = tokenResponse.ok ? (await tokenResponse.json()).token : null;
+
       const response = await fetch(`${apiUrl}/events?type=${viewType}`);
 
       if (!response.ok) {
@@ -99,6 +124,43 @@ export default function AdminDashboard() {
     }
   };
 
+  // Apply just the events created, updated or deleted since the last load
+  // or sync; falls back to a full reload if the token is missing or expired
+  const syncEvents = async () => {
+    if (changeToken.current === null) {
+      return fetchEvents();
+    }
+
+    try {
+      let hasMore = true;
+      while (hasMore) {
+        const response = await fetch(`${apiUrl}/events/changes?since=${changeToken.current}`);
+        if (!response.ok) {
+          throw new Error("Failed to sync events");
+        }
+
+        const changes = await response.json();
+        const removed = new Set<string>([
+          ...changes.deleted,
+          ...changes.upserted.map((event: Event) => event.id),
+        ]);
+        const upserted = changes.upserted.filter((event: Event) => event.type === viewType);
+
+        setEvents((current) =>
+          [...current.filter((event) => !removed.has(event.id)), ...upserted].sort(
+            (a, b) => a.start_time.localeCompare(b.start_time) || a.id.localeCompare(b.id)
+          )
+        );
+
+        changeToken.current = changes.token;
+        hasMore = changes.has_more;
+      }
+    } catch (error) {
+      console.error("Error syncing events:", error);
+      fetchEvents();
+    }
+  };
+
   const fetchAdmins = async () => {
     try {
       setAdminsLoading(true);
@@ -204,7 +266,7 @@ export default function AdminDashboard() {
         throw new Error("Failed to delete event");
       }
 
-      fetchEvents();
+      syncEvents();
       setDeletingEvent(null);
     } catch (error) {
       console.error("Error deleting event:", error);
@@ -214,6 +276,42 @@ export default function AdminDashboard() {
     }
   };
 
+  // Deletes everything of the current type that started before today,
+  // in a single bulk request instead of one DELETE per event
+  const confirmDeletePast = async () => {
+    try {
+      setIsDeletingPast(true);
+      const startOfToday = new Date();
+      startOfToday.setHours(0, 0, 0, 0);
+
+      const response = await fetch(`${apiUrl}/events/bulk-delete`, {
+        method: "POST",
+        headers: getAuthHeaders(),
+        body: JSON.stringify({
+          type: viewType,
+          end: startOfToday.toISOString(),
+        }),
+      });
+
+      if (!response.ok) {
+        if (response.status === 401) {
+          alert("Session expired. Please login again.");
+          router.push("/admin");
+          return;
+        }
+        throw new Error("Failed to delete past events");
+      }
+
+      syncEvents();
+      setShowDeletePast(false);
+    } catch (error) {
+      console.error("Error deleting past events:", error);
+      alert("Failed to delete past events. Please try again.");
+    } finally {
+      setIsDeletingPast(false);
+    }
+  };
+
   const handleLogout = () => {
     // Clear localStorage
     localStorage.removeItem("admin_token");
@@ -402,6 +500,12 @@ export default function AdminDashboard() {
                 Office Hours
               </button>
             </div>
+            <button
+              onClick={() => setShowDeletePast(true)}
+              className="ml-4 px-4 py-2 text-sm text-red-600 hover:text-red-700 font-medium"
+            >
+              Delete Past {viewType === "event" ? "Events" : "Office Hours"}
+            </button>
           </div>
 
           {eventsLoading ? (
@@ -498,7 +602,7 @@ export default function AdminDashboard() {
         isOpen={showCreateModal}
         onClose={() => setShowCreateModal(false)}
         onEventCreated={() => {
-          fetchEvents();
+          syncEvents();
           setShowCreateModal(false);
         }}
       />
@@ -509,7 +613,7 @@ export default function AdminDashboard() {
         isOpen={editingEvent !== null}
         onClose={() => setEditingEvent(null)}
         onEventUpdated={() => {
-          fetchEvents();
+          syncEvents();
           setEditingEvent(null);
         }}
       />
@@ -526,6 +630,18 @@ export default function AdminDashboard() {
         confirmButtonText="Delete Event"
       />
 
+      {/* Delete Past Events Confirmation Modal */}
+      <DeleteConfirmationModal
+        isOpen={showDeletePast}
+        title={`Delete Past ${viewType === "event" ? "Events" : "Office Hours"}?`}
+        message="This permanently removes everything of this type that started before today."
+        itemName={viewType === "event" ? "All past events" : "All past office hours"}
+        onConfirm={confirmDeletePast}
+        onCancel={() => setShowDeletePast(false)}
+        isDeleting={isDeletingPast}
+        confirmButtonText="Delete All"
+      />
+
       {/* Delete Admin Confirmation Modal */}
       <DeleteConfirmationModal
         isOpen={deletingAdminEmail !== null}
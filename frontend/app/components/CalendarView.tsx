@@ -3,7 +3,7 @@
 import { Calendar, dateFnsLocalizer, View } from "react-big-calendar";
 import { format, parse, startOfWeek, getDay } from "date-fns";
 import "react-big-calendar/lib/css/react-big-calendar.css";
-import { useState, useCallback, useMemo } from "react";
+import { useMemo } from "react";
 
 const locales = {
   "en-US": require("date-fns/locale/en-US"),
@@ -27,26 +27,20 @@ interface Event {
 
 interface CalendarViewProps {
   events?: Event[];
+  // Controlled by the page, which loads the events around the visible date
+  date: Date;
+  onNavigate: (date: Date) => void;
+  view: View;
+  onView: (view: View) => void;
 }
 
-export default function CalendarView({ events = [] }: CalendarViewProps) {
-  const [date, setDate] = useState(new Date());
-  const [view, setView] = useState<View>("week");
-
+export default function CalendarView({ events = [], date, onNavigate, view, onView }: CalendarViewProps) {
   // Create stable min/max time values
   const { minTime, maxTime } = useMemo(() => ({
     minTime: new Date(2026, 1, 1, 9, 0, 0),
     maxTime: new Date(2026, 1, 1, 20, 0, 0),
   }), []);
 
-  const handleNavigate = useCallback((newDate: Date) => {
-    setDate(newDate);
-  }, []);
-
-  const handleViewChange = useCallback((newView: View) => {
-    setView(newView);
-  }, []);
-
   return (
     <div className="bg-surface rounded-xl border border-line p-4 shadow-soft">
       <Calendar
@@ -58,8 +52,8 @@ export default function CalendarView({ events = [] }: CalendarViewProps) {
         views={["week", "day", "month"]}
         view={view}
         date={date}
-        onNavigate={handleNavigate}
-        onView={handleViewChange}
+        onNavigate={onNavigate}
+        onView={onView}
         min={minTime}
         max={maxTime}
       />
@@ -1,9 +1,11 @@
 "use client";
 
 import Link from "next/link";
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef } from "react";
 import { API_URL } from "@/lib/constants";
 import dynamic from "next/dynamic";
+import type { View } from "react-big-calendar";
+import { addWeeks, endOfMonth, startOfMonth, startOfWeek } from "date-fns";
 import EventCard from "./components/EventCard";
 import EventDetailModal from "./components/EventDetailModal";
 
@@ -24,23 +26,44 @@ export default function Home() {
   const [showContactMessage, setShowContactMessage] = useState(false);
   const [selectedEvent, setSelectedEvent] = useState<Event | null>(null);
   const [events, setEvents] = useState<Event[]>([]);
+  // Only the first load shows the loading screen; later reloads (another
+  // month, a live update) keep the current events up until the new ones arrive
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [viewType, setViewType] = useState<"event" | "office_hours">("event");
+  const [orgNames, setOrgNames] = useState<string[]>([]);
+  const [calendarDate, setCalendarDate] = useState(() => new Date());
+  const [calendarView, setCalendarView] = useState<View>("week");
+
+  // Events are loaded a month at a time: the month being shown, padded to
+  // whole weeks like the month view. Any week or day view inside the month
+  // falls in the same range, so only changing month triggers a reload.
+  const visibleMonth = startOfMonth(calendarDate).getTime();
+
+  // Number of the latest fetchEvents call, so a slow response for a month
+  // the visitor already left can't overwrite the newer one
+  const latestFetch = useRef(0);
 
   // Fetch events from backend
   const fetchEvents = async () => {
+    const fetchId = ++latestFetch.current;
     try {
-      setIsLoading(true);
-      setError(null);
-      const apiUrl = API_URL;
-      const response = await fetch(`${apiUrl}/events?type=${viewType}`);
+      // With a start/end window the backend expands recurring events
+      // (e.g. weekly office hours) into each occurrence in it
+      const params = new URLSearchParams({
+        type: viewType,
+        start: startOfWeek(visibleMonth).toISOString(),
+        end: addWeeks(startOfWeek(endOfMonth(visibleMonth)), 1).toISOString(),
+        limit: "1000",
+      });
+      const response = await fetch(`${API_URL}/events?${params}`);
 
       if (!response.ok) {
         throw new Error("Failed to fetch events");
       }
 
       const data = await response.json();
+      if (fetchId !== latestFetch.current) return;
 
       // Convert ISO date strings to Date objects for the calendar
       const formattedEvents = data.map((event: any) => ({
@@ -53,18 +76,59 @@ export default function Home() {
       }));
 
       setEvents(formattedEvents);
+      setError(null);
     } catch (err) {
+      if (fetchId !== latestFetch.current) return;
       setError(err instanceof Error ? err.message : "Failed to load events");
     } finally {
-      setIsLoading(false);
+      if (fetchId === latestFetch.current) setIsLoading(false);
+    }
+  };
+
+  // Fetch the organization filter options (already normalized by the backend)
+  const fetchOrganizations = async () => {
+    try {
+      const response = await fetch(`${API_URL}/events/facets?type=${viewType}`);
+      if (!response.ok) return;
+
+      const facets = await response.json();
+      setOrgNames(facets.organizations.map((facet: { value: string }) => facet.value));
+    } catch {
+      // The dropdown just keeps its previous options
     }
   };
 
   // Load events on mount and when viewType changes
   useEffect(() => {
-    fetchEvents();
+    fetchOrganizations();
   }, [viewType]);
 
+  // ...and again for each month the calendar moves to
+  useEffect(() => {
+    fetchEvents();
+  }, [viewType, visibleMonth]);
+
+  // Reload when an admin adds, edits or removes an event, instead of
+  // waiting for the visitor to refresh the page
+  useEffect(() => {
+    const stream = new EventSource(`${API_URL}/events/stream`);
+    let reload: ReturnType<typeof setTimeout> | undefined;
+
+    stream.onmessage = () => {
+      // Coalesce bursts (e.g. a bulk import) into one reload
+      clearTimeout(reload);
+      reload = setTimeout(() => {
+        fetchEvents();
+        fetchOrganizations();
+      }, 1000);
+    };
+
+    return () => {
+      clearTimeout(reload);
+      stream.close();
+    };
+  }, [viewType, visibleMonth]);
+
   // Normalize organization name (remove ALL whitespace, capitalize consistently)
   const normalizeOrgName = (name: string): string => {
     return name.replace(/\s+/g, '').toUpperCase();
@@ -75,9 +139,8 @@ export default function Home() {
     ? events
     : events.filter((event) => normalizeOrgName(event.organization) === normalizeOrgName(selectedOrg));
 
-  // Get unique organizations from events (normalized)
-  const uniqueOrgNames = new Set(events.map(event => normalizeOrgName(event.organization)));
-  const organizations = ["All", ...Array.from(uniqueOrgNames).sort()];
+  // Organizations come from GET /events/facets, normalized and sorted
+  const organizations = ["All", ...orgNames];
 
   return (
     <div className="min-h-screen bg-bg">
@@ -202,7 +265,13 @@ export default function Home() {
 
             {/* Calendar */}
             <div className="mb-8">
-              <CalendarView events={filteredEvents} />
+              <CalendarView
+                events={filteredEvents}
+                date={calendarDate}
+                onNavigate={setCalendarDate}
+                view={calendarView}
+                onView={setCalendarView}
+              />
             </div>
 
             {/* Upcoming Events List */}
@@ -223,7 +292,7 @@ export default function Home() {
                 <div className="grid gap-4 md:grid-cols-2 lg:grid-cols-3">
                   {filteredEvents.map((event) => (
                     <EventCard
-                      key={event.id}
+                      key={`${event.id}-${event.start.getTime()}`}
                       event={event}
                       onViewDetails={() => setSelectedEvent(event)}
                     />